@@ -0,0 +1,45 @@
+import logging
+from pathlib import Path
+
+from ascs import params
+from ascs.input_data.checkpoint.checkpoint_config import (
+    CHECKPOINT_FILE_EXTENSIONS,
+    CHECKPOINTS_DIRECTORY,
+    NUMBER_OF_MANIFESTS_TO_KEEP_WHEN_COMPACTING,
+)
+from ascs.input_data.checkpoint.partitioned_checkpoint import (
+    compact_partitioned_checkpoint,
+    is_partitioned_checkpoint_path,
+)
+from ascs.menu import choose_which_params_file_to_use
+from ascs.utilities.setup_logging import setup_logging
+
+
+def main() -> None:
+    """
+    Deletes the old manifests of each partitioned checkpoint for this year,
+    and the partitions only they used. Don't run this while the data returns are being loaded.
+    """
+    setup_logging()
+
+    choose_which_params_file_to_use()
+
+    checkpoints_directory = Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR)
+    if not checkpoints_directory.exists():
+        logging.info("No checkpoint files available!")
+        return
+
+    for checkpoint_path in sorted(checkpoints_directory.iterdir()):
+        if checkpoint_path.name.endswith(
+            CHECKPOINT_FILE_EXTENSIONS
+        ) and is_partitioned_checkpoint_path(checkpoint_path):
+            number_of_files_deleted = compact_partitioned_checkpoint(
+                checkpoint_path, NUMBER_OF_MANIFESTS_TO_KEEP_WHEN_COMPACTING
+            )
+            logging.info(
+                f"Compacted {checkpoint_path}, deleting {number_of_files_deleted} files"
+            )
+
+
+if __name__ == "__main__":
+    main()
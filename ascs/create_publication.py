@@ -1,12 +1,8 @@
-from typing import Callable
+from typing import Callable, Optional
 import pandas as pd
 
 import logging
 import timeit
-from ascs.input_data.checkpoint.checkpoint_menu import (
-    load_data_from_data_return_with_menu,
-)
-
 from ascs.menu import choose_which_params_file_to_use, select_tables_to_run
 from ascs.simple_outputs.admin_data_table import create_admin_data_table
 from ascs.simple_outputs.demographics_table import create_demographics_table
@@ -14,14 +10,20 @@ from ascs.simple_outputs.outputs_already_in_the_data_needed_for_table_creation i
     get_average_rows,
     get_cleaned_questionnaire,
     get_dq_errors_loading_validating,
+    get_ingest_telemetry,
+    get_preprocessing_step_profile,
     get_unclean_questionnaire,
 )
 from ascs.simple_outputs.suppressed_questionnaire import create_suppressed_questionnaire
 from ascs.utilities.setup_logging import setup_logging
 
+from ascs.input_data.checkpoint.checkpoint_file_handler import (
+    wait_for_checkpoints_to_be_saved,
+)
+from ascs.input_data.input_columns_needed import get_input_question_columns
 from ascs.input_data.get_data_needed_for_table_creation import (
     DataNeededForTableCreation,
-    get_data_needed_for_table_creation_from_loaded_data_returns,
+    get_data_needed_for_table_creation_with_menu,
 )
 
 from ascs.methodology_figures import create_all_methodology_tables
@@ -42,6 +44,7 @@ from ascs.stratified_tables.stratified_by_la_demographic import (
 )
 from ascs.response_rate_by_area.response_rate_by_area import (
     create_response_rate_by_area_table,
+    get_input_question_columns_needed_for_response_rate_by_area_table,
 )
 from ascs.utilities.save_to_file import save_all_tables_to_csv, save_all_tables_to_excel
 
@@ -67,12 +70,30 @@ TABLES_OPTIONS: dict[str, FunctionForTableCreation] = {
     "Eligible Population/Questionnaire Data Disparity DQ Table": create_eligible_population_questionnaire_data_disparity_dq_table,
     "Average Rows": get_average_rows,
     "DQ Errors Loading and Validating Data": get_dq_errors_loading_validating,
+    "Ingest Telemetry": get_ingest_telemetry,
+    "Preprocessing Step Profile": get_preprocessing_step_profile,
     "Cleaned questionnaire": get_cleaned_questionnaire,
     "Consolidated but uncleaned questionnaire": get_unclean_questionnaire,
 }
 
 ALL_TABLES_IDS = list(TABLES_OPTIONS.keys())
 
+# The question columns of the data returns each table needs, the tables that aren't here need all of them.
+# Only the questions needed by the tables being made are loaded, cleaned, validated and preprocessed.
+INPUT_QUESTION_COLUMNS_NEEDED_BY_TABLE_ID: dict[str, Callable[[], list[str]]] = {
+    "Response Rates (4)": get_input_question_columns_needed_for_response_rate_by_area_table,
+    "Demographics (6)": lambda: [],
+    "Missing admin (DQ1, DQ2)": lambda: [],
+    "Methodology Figures": lambda: [],
+    "Eligible Population/Questionnaire Data Disparity DQ Table": lambda: [],
+    "Ingest Telemetry": lambda: [],
+}
+
+# The uncleaned questionnaire isn't in the prepared data checkpoints, so these tables can't be made from one
+TABLE_IDS_NEEDING_THE_UNCLEAN_QUESTIONNAIRE = [
+    "Consolidated but uncleaned questionnaire",
+]
+
 
 def main() -> None:
     setup_logging()
@@ -83,10 +104,12 @@ def main() -> None:
 
     start_time = timeit.default_timer()
 
-    loaded_data_returns = load_data_from_data_return_with_menu()
-
-    data_needed_for_table_creation = get_data_needed_for_table_creation_from_loaded_data_returns(
-        loaded_data_returns
+    data_needed_for_table_creation = get_data_needed_for_table_creation_with_menu(
+        get_input_question_columns_needed_for_tables(selected_table_ids),
+        unclean_questionnaire_needed=any(
+            table_id in TABLE_IDS_NEEDING_THE_UNCLEAN_QUESTIONNAIRE
+            for table_id in selected_table_ids
+        ),
     )
 
     output_tables = create_selected_tables(
@@ -96,12 +119,36 @@ def main() -> None:
     save_all_tables_to_csv(output_tables)
     save_all_tables_to_excel(output_tables)
 
+    # The checkpoint of the data returns is written while the tables are being made
+    wait_for_checkpoints_to_be_saved()
+
     total_time = timeit.default_timer() - start_time
     logging.info(
         f"Running time of create_publication: {int(total_time / 60)} minutes and {round(total_time%60)} seconds."
     )
 
 
+def get_input_question_columns_needed_for_tables(
+    table_ids: list[str],
+) -> Optional[list[str]]:
+    """
+    None if all the question columns are needed,
+    so everything is loaded and preprocessed (and the prepared data checkpoint saved) as usual
+    """
+    input_question_columns_needed = set()
+    for table_id in table_ids:
+        if table_id not in INPUT_QUESTION_COLUMNS_NEEDED_BY_TABLE_ID:
+            return None
+        input_question_columns_needed.update(
+            INPUT_QUESTION_COLUMNS_NEEDED_BY_TABLE_ID[table_id]()
+        )
+
+    if input_question_columns_needed >= set(get_input_question_columns()):
+        return None
+
+    return sorted(input_question_columns_needed)
+
+
 def create_selected_tables(
     data_needed_for_table_creation: DataNeededForTableCreation,
     tables_to_run=ALL_TABLES_IDS,
@@ -0,0 +1,135 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow.feather as feather
+
+
+ARROW_FILE_EXTENSION = ".arrow"
+# The columns Arrow can't store without changing them, see get_column_names_arrow_can_store
+OTHER_COLUMNS_FILE_EXTENSION = ".pkl"
+
+
+def save_dataframes_as_arrow_checkpoint(
+    df_by_key: dict[str, pd.DataFrame], checkpoint_path: Path
+) -> None:
+    """
+    An Arrow checkpoint is a folder with an uncompressed Arrow IPC (feather) file for each DataFrame,
+    so the columns are stored with their types, can be loaded one at a time, and can be memory mapped.
+
+    The folder is written under a temporary name and then renamed,
+    so a half written checkpoint is never offered in the menu.
+    """
+    temporary_checkpoint_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    if temporary_checkpoint_path.exists():
+        shutil.rmtree(temporary_checkpoint_path)
+    temporary_checkpoint_path.mkdir(parents=True)
+
+    for key, df in df_by_key.items():
+        save_dataframe_as_arrow(df, temporary_checkpoint_path, key)
+
+    replace_directory(temporary_checkpoint_path, checkpoint_path)
+
+
+def save_dataframe_as_arrow(df: pd.DataFrame, checkpoint_path: Path, key: str) -> None:
+    arrow_column_names = get_column_names_arrow_can_store(df)
+
+    feather.write_feather(
+        df[arrow_column_names],
+        checkpoint_path / (key + ARROW_FILE_EXTENSION),
+        # Compressed files can't be memory mapped
+        compression="uncompressed",
+    )
+    pd.to_pickle(
+        {
+            "column_names": df.columns.to_list(),
+            "df_other_columns": df.drop(columns=arrow_column_names),
+        },
+        checkpoint_path / (key + OTHER_COLUMNS_FILE_EXTENSION),
+    )
+
+
+def get_column_names_arrow_can_store(df: pd.DataFrame) -> list:
+    """
+    Arrow has a type for each column, so an object column can only be stored if it is all text
+    (the column of a question with an answer that isn't a number, for instance, is a mix of numbers and text).
+    The other object columns are pickled.
+    """
+    return [
+        column_name
+        for column_name, column in df.items()
+        if column.dtype != object
+        or pd.api.types.infer_dtype(column, skipna=False) == "string"
+    ]
+
+
+def load_dataframe_from_arrow_checkpoint(
+    checkpoint_path: Path, key: str, columns: Optional[list[str]] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Only the columns given are read (all of them if columns is None),
+    returns None if the checkpoint doesn't have the DataFrame
+    """
+    arrow_file_path = checkpoint_path / (key + ARROW_FILE_EXTENSION)
+    if not arrow_file_path.exists():
+        return None
+
+    other_columns = pd.read_pickle(
+        checkpoint_path / (key + OTHER_COLUMNS_FILE_EXTENSION)
+    )
+    column_names = other_columns["column_names"]
+    if columns is not None:
+        column_names = [
+            column_name for column_name in column_names if column_name in columns
+        ]
+
+    arrow_table = feather.read_table(arrow_file_path, memory_map=True)
+    df_arrow_columns = arrow_table.select(
+        [
+            arrow_column_name
+            for arrow_column_name, column_name in zip(
+                arrow_table.column_names, get_column_names_in_table(arrow_table)
+            )
+            if column_name in column_names
+        ]
+    ).to_pandas()
+    df_other_columns = other_columns["df_other_columns"]
+
+    return pd.concat(
+        [
+            df_arrow_columns,
+            df_other_columns[
+                [
+                    column_name
+                    for column_name in df_other_columns.columns
+                    if column_name in column_names
+                ]
+            ],
+        ],
+        axis=1,
+    )[column_names]
+
+
+def get_column_names_in_table(arrow_table) -> list:
+    """
+    Arrow column names are always text, the pandas ones are read back from the table
+    """
+    return arrow_table.slice(0, 0).to_pandas().columns.to_list()
+
+
+def replace_directory(source_path: Path, destination_path: Path) -> None:
+    """
+    os.replace can't replace a folder that has files in, so the old folder is moved out of the way first
+    """
+    if not destination_path.exists():
+        os.replace(source_path, destination_path)
+        return
+
+    old_path = destination_path.with_name(destination_path.name + ".old")
+    if old_path.exists():
+        shutil.rmtree(old_path)
+    os.replace(destination_path, old_path)
+    os.replace(source_path, destination_path)
+    shutil.rmtree(old_path)
@@ -1,3 +1,62 @@
 CHECKPOINTS_DIRECTORY = "./checkpoints/"
 QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY = "df_questionnaire_unclean_by_person"
 LOADING_BY_ERROR_KEY = "df_loading_error_by_file"
+H5_CHECKPOINT_FILE_EXTENSION = ".h5"
+# A folder of Arrow files, see arrow_checkpoint.py
+ARROW_CHECKPOINT_FILE_EXTENSION = ".arrow"
+# A folder with a partition for each LA, which each load adds to, see partitioned_checkpoint.py
+PARTITIONED_CHECKPOINT_FILE_EXTENSION = ".partitioned"
+CHECKPOINT_FILE_EXTENSIONS = (
+    H5_CHECKPOINT_FILE_EXTENSION,
+    ARROW_CHECKPOINT_FILE_EXTENSION,
+    PARTITIONED_CHECKPOINT_FILE_EXTENSION,
+)
+# The format of new checkpoints. Arrow checkpoints are much quicker to save and load,
+# and can load just the columns that are needed
+CHECKPOINT_FILE_EXTENSION = H5_CHECKPOINT_FILE_EXTENSION
+INGEST_TELEMETRY_BY_FILE_KEY = "df_ingest_telemetry_by_file"
+# Saved next to each checkpoint, so it can be looked at without loading the checkpoint
+INGEST_TELEMETRY_CSV_FILENAME_SUFFIX = "_ingest_telemetry.csv"
+PARSE_CACHE_DIRECTORY_NAME = "parse_cache"
+WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME = "watched_data_returns.h5"
+# The second tier of checkpoint, saved once the questionnaire has been cleaned, validated and preprocessed
+PREPARED_DATA_CHECKPOINTS_DIRECTORY_NAME = "prepared_data"
+PREPARED_DATA_CHECKPOINT_FILE_EXTENSION = ".pkl"
+SAVE_PREPARED_DATA_CHECKPOINT = True
+FIELDS_LEFT_OUT_OF_PREPARED_DATA_CHECKPOINT = ("df_questionnaire_unclean_by_person",)
+# Finds the checkpoint made from the same inputs, see checkpoint_index.py
+CHECKPOINT_INDEX_FILENAME = "checkpoint_index.json"
+DATA_RETURNS_CHECKPOINT_KIND = "data_returns"
+PREPARED_DATA_CHECKPOINT_KIND = "prepared_data"
+# Load the checkpoint made from the same data returns, population data, params and preprocessing code without asking
+REUSE_MATCHING_CHECKPOINTS_AUTOMATICALLY = True
+# Change this whenever what is saved in a prepared data checkpoint changes, so those made by an older version aren't reused
+PREPARED_DATA_CHECKPOINT_VERSION = 2
+# The code the prepared data is made by (relative to the ascs package). Its source is part of the prepared data fingerprint,
+# so after any change to the cleaning, validation or preprocessing (or the code they use, like that making the average rows)
+# a matching checkpoint isn't loaded. It is the whole package, apart from the code that only writes the outputs
+PREPARED_DATA_SOURCE_CODE_PATHS = (".",)
+PREPARED_DATA_SOURCE_CODE_PATHS_LEFT_OUT = (
+    "menu.py",
+    "output_to_excel/output_to_excel.py",
+    "output_to_excel/output_to_excel_column_and_row_spacing.py",
+    "output_to_excel/output_to_excel_column_spacing.py",
+    "output_to_excel/output_to_excel_no_spacing.py",
+    "output_to_excel/write_one_section_to_excel.py",
+)
+# These params don't change the data the tables are made from, so changing them doesn't need new checkpoints
+PARAMS_LEFT_OUT_OF_CHECKPOINT_FINGERPRINT = (
+    "TEST_ANNEX_TABLES_FILE_PATH",
+    "OUTPUT_ANNEX_TABLE_FILE_NAME",
+    "TEMPLATE_ANNEX_TABLE_FILE_PATH",
+    "DATA_RETURNS_DIRECTORY",
+    "ELIGIBLE_POPULATION_DATA_PATH",
+    "EXCEL_HORIZONTAL_GAP_SIZE_CONFIG_BY_NAME",
+    "EXCEL_HORIZONTAL_GAP_SIZE_AND_SECTIONS_BY_NAME",
+    "EXCEL_NO_HORIZONTAL_GAP_SIZE_AND_SECTIONS_BY_NAME",
+)
+# Loading the data returns adds to this partitioned checkpoint, rather than saving a new whole checkpoint each time
+SAVE_DATA_RETURNS_TO_PARTITIONED_CHECKPOINT = True
+PARTITIONED_CHECKPOINT_FILENAME = "data_returns" + PARTITIONED_CHECKPOINT_FILE_EXTENSION
+# Compacting a partitioned checkpoint keeps this many of its newest manifests
+NUMBER_OF_MANIFESTS_TO_KEEP_WHEN_COMPACTING = 1
@@ -1,7 +1,26 @@
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+import logging
+from .arrow_checkpoint import (
+    load_dataframe_from_arrow_checkpoint,
+    save_dataframes_as_arrow_checkpoint,
+)
+from .checkpoint_index import add_checkpoint_to_index
+from .partitioned_checkpoint import (
+    is_partitioned_checkpoint_path,
+    load_dataframes_from_partitioned_checkpoint,
+    save_dataframes_as_partitioned_checkpoint,
+)
 from .checkpoint_config import (
+    ARROW_CHECKPOINT_FILE_EXTENSION,
+    CHECKPOINT_FILE_EXTENSION,
+    CHECKPOINT_FILE_EXTENSIONS,
+    DATA_RETURNS_CHECKPOINT_KIND,
+    INGEST_TELEMETRY_BY_FILE_KEY,
+    INGEST_TELEMETRY_CSV_FILENAME_SUFFIX,
     LOADING_BY_ERROR_KEY,
+    PARTITIONED_CHECKPOINT_FILE_EXTENSION,
     QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY,
     CHECKPOINTS_DIRECTORY,
 )
@@ -9,36 +28,205 @@ from ..load_data_returns.data_return_config import LoadedDataReturns
 from ascs import params
 import pandas as pd
 import os
+from typing import Optional
+
+
+# One thread, so checkpoints are written in the order they were asked for
+checkpoint_writer = ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="checkpoint_writer"
+)
+checkpoints_being_saved: list[Future] = []
+
+
+def save_data_return_checkpoint_in_background(
+    checkpoint_data: LoadedDataReturns,
+    path_to_save_to: Path,
+    checkpoint_filename: Optional[str] = None,
+    fingerprint: Optional[str] = None,
+) -> Future:
+    """
+    The same as save_data_return_checkpoint, but returns straight away
+    so the cleaning and the tables can be getting on while the checkpoint is written.
+
+    The checkpoint is written from a shallow copy of the DataFrames,
+    so columns added or replaced afterwards don't end up in the checkpoint
+    (the values themselves are shared, but nothing edits the loaded data returns in place).
+    Call wait_for_checkpoints_to_be_saved before the run finishes.
+    """
+    if checkpoint_filename is None:
+        # Named after when the data returns were loaded, not when the checkpoint is written
+        checkpoint_filename = get_checkpoint_filename_from_current_time()
+
+    checkpoint_data_snapshot = LoadedDataReturns(
+        *(df.copy(deep=False) if df is not None else None for df in checkpoint_data)
+    )
+
+    checkpoint_being_saved = checkpoint_writer.submit(
+        save_data_return_checkpoint,
+        checkpoint_data_snapshot,
+        path_to_save_to,
+        checkpoint_filename,
+        fingerprint,
+    )
+    checkpoints_being_saved.append(checkpoint_being_saved)
+    return checkpoint_being_saved
+
+
+def wait_for_checkpoints_to_be_saved() -> None:
+    """
+    A checkpoint that fails to save is logged rather than raised, as the tables have been made by then
+    """
+    while checkpoints_being_saved:
+        checkpoint_being_saved = checkpoints_being_saved.pop(0)
+        try:
+            checkpoint_being_saved.result()
+            logging.info("Checkpoint saved!")
+        except Exception as err:
+            logging.error("Error saving the checkpoint")
+            logging.error(str(err))
+
+
+def get_checkpoint_filename_from_current_time() -> str:
+    return datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + CHECKPOINT_FILE_EXTENSION
 
 
 def save_data_return_checkpoint(
-    checkpoint_data: LoadedDataReturns, path_to_save_to: Path
+    checkpoint_data: LoadedDataReturns,
+    path_to_save_to: Path,
+    checkpoint_filename: Optional[str] = None,
+    fingerprint: Optional[str] = None,
 ):
+    """
+    The checkpoint is named after the current time, unless checkpoint_filename is given.
+    Given the fingerprint of the data returns it was loaded from (see checkpoint_fingerprint.py),
+    it is added to the checkpoint index once it has been saved, so it can be reused automatically.
+    It is saved as an Arrow checkpoint if checkpoint_filename ends .arrow,
+    added to a partitioned checkpoint if it ends .partitioned, otherwise saved as a h5 file.
+    The ingest telemetry (if there is any) is also saved as a CSV next to the checkpoint.
+    It is written to a temporary file which then replaces the checkpoint,
+    so a checkpoint that is being overwritten can still be loaded while it is written,
+    and a run that crashes part way through writing can't leave a half written checkpoint to be offered in the menu.
+    """
     if not Path.exists(path_to_save_to):
         os.mkdir(path_to_save_to)
 
-    checkpoint_filename = datetime.now().strftime("%Y-%m-%d_%H-%M-%S") + ".h5"
-    checkpoint_data.df_questionnaire_unclean_by_person.to_hdf(
-        path_to_save_to / checkpoint_filename, key=QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY
-    )
-    checkpoint_data.df_loading_error_by_file.to_hdf(
-        path_to_save_to / checkpoint_filename, key=LOADING_BY_ERROR_KEY,
-    )
+    if checkpoint_filename is None:
+        checkpoint_filename = get_checkpoint_filename_from_current_time()
+
+    df_by_key = {
+        QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY: checkpoint_data.df_questionnaire_unclean_by_person,
+        LOADING_BY_ERROR_KEY: checkpoint_data.df_loading_error_by_file,
+    }
+    if checkpoint_data.df_ingest_telemetry_by_file is not None:
+        df_by_key[
+            INGEST_TELEMETRY_BY_FILE_KEY
+        ] = checkpoint_data.df_ingest_telemetry_by_file
+        checkpoint_data.df_ingest_telemetry_by_file.to_csv(
+            path_to_save_to
+            / (Path(checkpoint_filename).stem + INGEST_TELEMETRY_CSV_FILENAME_SUFFIX),
+            index=False,
+        )
+
+    checkpoint_path = path_to_save_to / checkpoint_filename
+    if checkpoint_filename.endswith(PARTITIONED_CHECKPOINT_FILE_EXTENSION):
+        # What was saved this time is the manifest, not the whole folder
+        checkpoint_path = save_dataframes_as_partitioned_checkpoint(
+            df_by_key.pop(QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY),
+            df_by_key,
+            checkpoint_path,
+        )
+    elif checkpoint_filename.endswith(ARROW_CHECKPOINT_FILE_EXTENSION):
+        save_dataframes_as_arrow_checkpoint(df_by_key, checkpoint_path)
+    else:
+        save_dataframes_as_h5_checkpoint(df_by_key, checkpoint_path)
+
+    if fingerprint is not None:
+        add_checkpoint_to_index(
+            path_to_save_to, DATA_RETURNS_CHECKPOINT_KIND, fingerprint, checkpoint_path,
+        )
+
 
+def save_dataframes_as_h5_checkpoint(
+    df_by_key: dict[str, pd.DataFrame], checkpoint_path: Path
+) -> None:
+    temporary_checkpoint_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    if temporary_checkpoint_path.exists():
+        os.remove(temporary_checkpoint_path)
+
+    for key, df in df_by_key.items():
+        df.to_hdf(temporary_checkpoint_path, key=key)
+
+    os.replace(temporary_checkpoint_path, checkpoint_path)
+
+
+def load_data_returns_from_checkpoint(
+    checkpoint_file_to_use: str, columns: Optional[list[str]] = None
+) -> LoadedDataReturns:
+    """
+    Only the questionnaire columns given are loaded (all of them if columns is None).
+    An Arrow checkpoint only reads those columns from disk, a h5 checkpoint has to read them all first.
+    For a partitioned checkpoint, checkpoint_file_to_use can be the folder (for its latest manifest) or a manifest.
+    """
+    if is_partitioned_checkpoint_path(Path(checkpoint_file_to_use)):
+        (
+            df_questionnaire_unclean_by_person,
+            other_df_by_key,
+        ) = load_dataframes_from_partitioned_checkpoint(
+            Path(checkpoint_file_to_use), columns
+        )
+        return LoadedDataReturns(
+            df_questionnaire_unclean_by_person,
+            other_df_by_key[LOADING_BY_ERROR_KEY],
+            other_df_by_key.get(INGEST_TELEMETRY_BY_FILE_KEY),
+        )
+
+    if checkpoint_file_to_use.endswith(ARROW_CHECKPOINT_FILE_EXTENSION):
+        return LoadedDataReturns(
+            load_dataframe_from_arrow_checkpoint(
+                Path(checkpoint_file_to_use),
+                QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY,
+                columns,
+            ),
+            load_dataframe_from_arrow_checkpoint(
+                Path(checkpoint_file_to_use), LOADING_BY_ERROR_KEY
+            ),
+            load_dataframe_from_arrow_checkpoint(
+                Path(checkpoint_file_to_use), INGEST_TELEMETRY_BY_FILE_KEY
+            ),
+        )
 
-def load_data_returns_from_checkpoint(checkpoint_file_to_use: str) -> LoadedDataReturns:
     df_questionnaire_unclean_by_person = pd.read_hdf(
         checkpoint_file_to_use, key=QUESTIONNAIRE_UNCLEAN_BY_PERSON_KEY
     )
+    if columns is not None:
+        df_questionnaire_unclean_by_person = df_questionnaire_unclean_by_person[
+            [
+                column_name
+                for column_name in df_questionnaire_unclean_by_person.columns
+                if column_name in columns
+            ]
+        ]
     df_loading_error_by_file = pd.read_hdf(
         checkpoint_file_to_use, key=LOADING_BY_ERROR_KEY
     )
+    with pd.HDFStore(checkpoint_file_to_use, mode="r") as checkpoint_store:
+        df_ingest_telemetry_by_file = (
+            checkpoint_store[INGEST_TELEMETRY_BY_FILE_KEY]
+            if INGEST_TELEMETRY_BY_FILE_KEY in checkpoint_store
+            else None
+        )
 
     return LoadedDataReturns(
-        df_questionnaire_unclean_by_person, df_loading_error_by_file
+        df_questionnaire_unclean_by_person,
+        df_loading_error_by_file,
+        df_ingest_telemetry_by_file,
     )
 
 
+def get_current_year_checkpoints_directory() -> Path:
+    return Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR)
+
+
 def get_current_year_checkpoint_files() -> list[str]:
     current_year_checkpoints_directory = Path(
         CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR
@@ -46,5 +234,6 @@ def get_current_year_checkpoint_files() -> list[str]:
     return [
         str(current_year_checkpoints_directory / file)
         for file in os.listdir(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR)
-        if file.endswith(".h5")
+        # h5, Arrow and partitioned checkpoints
+        if file.endswith(CHECKPOINT_FILE_EXTENSIONS)
     ]
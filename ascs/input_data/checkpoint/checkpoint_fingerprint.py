@@ -0,0 +1,126 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterable, Optional
+
+import ascs
+from ascs import params
+from ..load_data_returns.load_excel import get_all_data_return_file_paths
+from ..load_data_returns.parse_cache import (
+    get_data_return_params_hash,
+    get_file_content_hash,
+)
+from .checkpoint_config import (
+    PARAMS_LEFT_OUT_OF_CHECKPOINT_FINGERPRINT,
+    PREPARED_DATA_CHECKPOINT_VERSION,
+    PREPARED_DATA_SOURCE_CODE_PATHS,
+    PREPARED_DATA_SOURCE_CODE_PATHS_LEFT_OUT,
+)
+
+
+def get_data_returns_fingerprint(
+    data_return_file_paths: Optional[list[str]] = None,
+) -> str:
+    """
+    The data returns checkpoint depends on the contents of every data return (and where it is,
+    as that is in the loading errors) and on params.DATA_RETURN
+    """
+    if data_return_file_paths is None:
+        data_return_file_paths = get_all_data_return_file_paths(
+            params.DATA_RETURNS_DIRECTORY
+        )
+
+    return get_hash_of_json(
+        {
+            "data_return_params_hash": get_data_return_params_hash(),
+            "file_content_hash_by_data_return_file_path": {
+                str(file_path): get_file_content_hash(file_path)
+                for file_path in data_return_file_paths
+            },
+        }
+    )
+
+
+def get_prepared_data_fingerprint(
+    data_returns_fingerprint: str, eligible_population_data_filename: str = None
+) -> str:
+    """
+    The prepared data checkpoint also depends on the eligible population data,
+    on the rest of the params (apart from those which are only used for the outputs)
+    and on the code that prepares the data
+    """
+    if eligible_population_data_filename is None:
+        eligible_population_data_filename = params.ELIGIBLE_POPULATION_DATA_PATH
+
+    return get_hash_of_json(
+        {
+            "PREPARED_DATA_CHECKPOINT_VERSION": PREPARED_DATA_CHECKPOINT_VERSION,
+            "data_returns_fingerprint": data_returns_fingerprint,
+            "eligible_population_data_hash": get_file_content_hash(
+                eligible_population_data_filename
+            ),
+            "source_code_hash": get_source_code_hash(
+                Path(ascs.__file__).parent,
+                PREPARED_DATA_SOURCE_CODE_PATHS,
+                PREPARED_DATA_SOURCE_CODE_PATHS_LEFT_OUT,
+            ),
+            "params": {
+                param_name: get_jsonable(param_value)
+                for param_name, param_value in vars(params).items()
+                if param_name not in PARAMS_LEFT_OUT_OF_CHECKPOINT_FINGERPRINT
+            },
+        }
+    )
+
+
+def get_source_code_hash(
+    source_code_directory: Path,
+    source_code_paths: Iterable[str],
+    left_out_source_code_paths: Iterable[str] = (),
+) -> str:
+    """
+    Hashes every .py file in the folders (and the files) given, relative to source_code_directory,
+    with its path so that moving code changes it too.
+    The files in left_out_source_code_paths aren't hashed.
+    """
+    left_out_source_code_file_paths = {
+        source_code_directory / left_out_source_code_path
+        for left_out_source_code_path in left_out_source_code_paths
+    }
+    source_code_hash = hashlib.sha256()
+    for source_code_path in source_code_paths:
+        source_code_path = source_code_directory / source_code_path
+        source_code_file_paths = (
+            sorted(source_code_path.rglob("*.py"))
+            if source_code_path.is_dir()
+            else [source_code_path]
+        )
+        for source_code_file_path in source_code_file_paths:
+            if source_code_file_path in left_out_source_code_file_paths:
+                continue
+            source_code_hash.update(
+                source_code_file_path.relative_to(source_code_directory)
+                .as_posix()
+                .encode()
+            )
+            source_code_hash.update(source_code_file_path.read_bytes())
+    return source_code_hash.hexdigest()
+
+
+def get_jsonable(value):
+    """
+    The params sections are objects, which are hashed by what they hold
+    """
+    if isinstance(value, dict):
+        return {str(key): get_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [get_jsonable(item) for item in value]
+    if hasattr(value, "__dict__"):
+        return get_jsonable(vars(value))
+    return value
+
+
+def get_hash_of_json(value) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, default=str).encode()
+    ).hexdigest()
@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .checkpoint_config import CHECKPOINT_INDEX_FILENAME
+
+# Checkpoints are added to the index by the background checkpoint writer as well as the main thread
+checkpoint_index_lock = threading.Lock()
+
+
+def find_checkpoint_in_index(
+    index_directory: Path, checkpoint_kind: str, fingerprint: str
+) -> Optional[Path]:
+    """
+    Returns the checkpoint made from the inputs with this fingerprint,
+    or None if there isn't one (or it has been deleted since)
+    """
+    checkpoint_file = (
+        load_checkpoint_index(index_directory).get(checkpoint_kind, {}).get(fingerprint)
+    )
+    if checkpoint_file is None:
+        return None
+
+    checkpoint_path = index_directory / checkpoint_file
+    if not checkpoint_path.exists():
+        return None
+    return checkpoint_path
+
+
+def add_checkpoint_to_index(
+    index_directory: Path,
+    checkpoint_kind: str,
+    fingerprint: str,
+    checkpoint_path: Path,
+) -> None:
+    """
+    Checkpoints that have been deleted are taken out of the index at the same time
+    """
+    with checkpoint_index_lock:
+        checkpoint_file_by_fingerprint_by_kind = load_checkpoint_index(index_directory)
+
+        checkpoint_file_by_fingerprint_by_kind.setdefault(checkpoint_kind, {})[
+            fingerprint
+        ] = Path(os.path.relpath(checkpoint_path, index_directory)).as_posix()
+
+        save_checkpoint_index(
+            {
+                kind: {
+                    fingerprint: checkpoint_file
+                    for fingerprint, checkpoint_file in checkpoint_file_by_fingerprint.items()
+                    if (index_directory / checkpoint_file).exists()
+                }
+                for kind, checkpoint_file_by_fingerprint in checkpoint_file_by_fingerprint_by_kind.items()
+            },
+            index_directory,
+        )
+
+
+def load_checkpoint_index(index_directory: Path) -> dict[str, dict[str, str]]:
+    """
+    The checkpoint file (relative to the index's folder) by the fingerprint of its inputs, for each kind of checkpoint.
+    A missing or unreadable index is treated as empty, the checkpoints are then just made again.
+    """
+    checkpoint_index_path = index_directory / CHECKPOINT_INDEX_FILENAME
+    if not checkpoint_index_path.exists():
+        return {}
+
+    try:
+        with open(checkpoint_index_path) as checkpoint_index_file:
+            return json.load(checkpoint_index_file)
+    except Exception as err:
+        logging.warning(f"Ignoring unreadable checkpoint index {checkpoint_index_path}")
+        logging.warning(str(err))
+        return {}
+
+
+def save_checkpoint_index(
+    checkpoint_file_by_fingerprint_by_kind: dict[str, dict[str, str]],
+    index_directory: Path,
+) -> None:
+    index_directory.mkdir(parents=True, exist_ok=True)
+
+    checkpoint_index_path = index_directory / CHECKPOINT_INDEX_FILENAME
+    temporary_checkpoint_index_path = checkpoint_index_path.with_suffix(".tmp")
+    with open(temporary_checkpoint_index_path, "w") as checkpoint_index_file:
+        json.dump(
+            checkpoint_file_by_fingerprint_by_kind,
+            checkpoint_index_file,
+            indent=4,
+            sort_keys=True,
+        )
+    os.replace(temporary_checkpoint_index_path, checkpoint_index_path)
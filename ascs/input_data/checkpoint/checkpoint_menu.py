@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Optional
 from ascs import params
 import inquirer
 import os
@@ -8,30 +9,89 @@ from ascs.input_data.load_data_returns.data_return_config import LoadedDataRetur
 from ascs.input_data.load_data_returns.load_excel import (
     load_all_data_returns_from_excel,
 )
-from .checkpoint_config import CHECKPOINTS_DIRECTORY
+from .checkpoint_config import (
+    ARROW_CHECKPOINT_FILE_EXTENSION,
+    CHECKPOINTS_DIRECTORY,
+    DATA_RETURNS_CHECKPOINT_KIND,
+    PARTITIONED_CHECKPOINT_FILE_EXTENSION,
+    PREPARED_DATA_CHECKPOINT_FILE_EXTENSION,
+    PREPARED_DATA_CHECKPOINTS_DIRECTORY_NAME,
+)
 from .checkpoint_file_handler import (
     load_data_returns_from_checkpoint,
     get_current_year_checkpoint_files,
+    get_current_year_checkpoints_directory,
 )
+from .checkpoint_index import find_checkpoint_in_index
+from .prepared_data_checkpoint import get_current_year_prepared_data_checkpoint_files
 
 
 def load_data_from_data_return_with_menu() -> LoadedDataReturns:
+    loaded_data_returns, _ = load_data_from_data_return_and_check_inputs_with_menu()
+    return loaded_data_returns
+
+
+def load_data_from_data_return_and_check_inputs_with_menu(
+    data_returns_fingerprint: Optional[str] = None, columns: Optional[list[str]] = None,
+) -> tuple[LoadedDataReturns, bool]:
+    """
+    Given the fingerprint of the data returns (see checkpoint_fingerprint.py),
+    the checkpoint made from them is loaded without asking, if there is one.
+    Otherwise the checkpoint saved after loading the excel files is indexed under the fingerprint.
+
+    Only the questionnaire columns given are loaded from a checkpoint (all of them if columns is None).
+    The excel files are always loaded whole, so the checkpoint saved from them has every column.
+
+    Also returns whether the data returns loaded are the ones the fingerprint was made from,
+    which isn't known for a checkpoint picked from the menu.
+    """
+    if data_returns_fingerprint is not None:
+        matching_checkpoint_path = find_checkpoint_in_index(
+            get_current_year_checkpoints_directory(),
+            DATA_RETURNS_CHECKPOINT_KIND,
+            data_returns_fingerprint,
+        )
+        if matching_checkpoint_path is not None:
+            logging.info(
+                f"Loading {matching_checkpoint_path}, which was made from the same data returns"
+            )
+            return (
+                load_data_returns_from_checkpoint(
+                    str(matching_checkpoint_path), columns
+                ),
+                True,
+            )
+
     if check_current_year_checkpoint_directory_exists() and want_to_load_checkpoint():
         checkpoint_file_to_use = select_checkpoint_to_load()
-        return load_data_returns_from_checkpoint(checkpoint_file_to_use)
+        return load_data_returns_from_checkpoint(checkpoint_file_to_use, columns), False
     else:
         logging.info("Loading questionnaire data (takes a while)")
-        return load_all_data_returns_from_excel()
+        return (
+            load_all_data_returns_from_excel(
+                checkpoint_fingerprint=data_returns_fingerprint
+            ),
+            True,
+        )
 
 
 def select_checkpoint_to_load() -> str:
-    checkpoint_files = get_current_year_checkpoint_files()
+    return select_checkpoint_file_to_load(
+        get_current_year_checkpoint_files(), f"checkpoints/{params.PUBLICATION_YEAR}"
+    )
+
 
-    print(
-        f"\nCheckpoint files available in checkpoints/{params.PUBLICATION_YEAR} folder:\n"
+def select_prepared_data_checkpoint_to_load() -> str:
+    return select_checkpoint_file_to_load(
+        get_current_year_prepared_data_checkpoint_files(),
+        f"checkpoints/{params.PUBLICATION_YEAR}/{PREPARED_DATA_CHECKPOINTS_DIRECTORY_NAME}",
     )
+
+
+def select_checkpoint_file_to_load(checkpoint_files: list[str], folder: str) -> str:
+    print(f"\nCheckpoint files available in {folder} folder:\n")
     for i, file in enumerate(checkpoint_files):
-        print(f"{i+1} - {file}")
+        print(f"{i+1} - {file} ({get_checkpoint_format(file)})")
     print()
 
     checkpoint_index_to_use = (
@@ -42,6 +102,16 @@ def select_checkpoint_to_load() -> str:
     return checkpoint_files[checkpoint_index_to_use]
 
 
+def get_checkpoint_format(checkpoint_file: str) -> str:
+    if checkpoint_file.endswith(ARROW_CHECKPOINT_FILE_EXTENSION):
+        return "Arrow"
+    if checkpoint_file.endswith(PARTITIONED_CHECKPOINT_FILE_EXTENSION):
+        return "partitioned, latest manifest"
+    if checkpoint_file.endswith(PREPARED_DATA_CHECKPOINT_FILE_EXTENSION):
+        return "prepared data"
+    return "h5"
+
+
 def check_current_year_checkpoint_directory_exists():
     if os.path.exists(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR):
         return True
@@ -55,3 +125,13 @@ def want_to_load_checkpoint() -> bool:
         inquirer.confirm("Do you want to load from a checkpoint?", default=False)
     )
 
+
+def want_to_load_prepared_data_checkpoint() -> bool:
+    if not get_current_year_prepared_data_checkpoint_files():
+        return False
+    return bool(
+        inquirer.confirm(
+            "Do you want to load the cleaned and preprocessed data from a prepared data checkpoint?",
+            default=False,
+        )
+    )
@@ -0,0 +1,248 @@
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .checkpoint_config import PARTITIONED_CHECKPOINT_FILE_EXTENSION
+
+
+PARTITIONS_DIRECTORY_NAME = "partitions"
+MANIFESTS_DIRECTORY_NAME = "manifests"
+PARTITION_FILE_EXTENSION = ".pkl"
+MANIFEST_FILE_EXTENSION = ".json"
+# The DataFrames other than the questionnaire are small, so are saved whole next to each manifest
+MANIFEST_TABLES_FILE_EXTENSION = ".pkl"
+LA_CODE_COLUMN_NAME = "LaCode"
+
+
+def save_dataframes_as_partitioned_checkpoint(
+    df_questionnaire_unclean_by_person: pd.DataFrame,
+    other_df_by_key: dict[str, pd.DataFrame],
+    checkpoint_path: Path,
+) -> Path:
+    """
+    A partitioned checkpoint is a folder that is added to each time the data returns are loaded,
+    rather than a new file with everything in.
+
+    The questionnaire is split into partitions, one for each LA (each run of rows with the same LaCode),
+    named by a hash of what they hold. A partition that is already saved (because that LA's data return
+    hasn't changed since) isn't written again, so saving takes as long as the data returns that changed.
+    A manifest lists the partitions the questionnaire is made of, in order, and is written last,
+    so a manifest only ever lists partitions that have been saved.
+
+    Returns the path of the manifest.
+    """
+    partitions_directory = checkpoint_path / PARTITIONS_DIRECTORY_NAME
+    manifests_directory = checkpoint_path / MANIFESTS_DIRECTORY_NAME
+    partitions_directory.mkdir(parents=True, exist_ok=True)
+    manifests_directory.mkdir(parents=True, exist_ok=True)
+
+    partition_file_names = []
+    number_of_partitions_written = 0
+    for la_code, df_partition in get_partitions_by_la(
+        df_questionnaire_unclean_by_person
+    ):
+        partition_bytes = pickle.dumps(df_partition, protocol=pickle.HIGHEST_PROTOCOL)
+        partition_file_name = get_partition_file_name(la_code, partition_bytes)
+        partition_file_names.append(partition_file_name)
+
+        partition_path = partitions_directory / partition_file_name
+        if not partition_path.exists():
+            save_bytes(partition_bytes, partition_path)
+            number_of_partitions_written += 1
+
+    logging.info(
+        f"Wrote {number_of_partitions_written} of {len(partition_file_names)} checkpoint partitions, the rest were unchanged"
+    )
+
+    manifest_name = datetime.now().strftime("%Y-%m-%d_%H-%M-%S_%f")
+    save_bytes(
+        pickle.dumps(
+            {
+                # The questionnaire if there are no partitions, so its columns and dtypes are still right
+                "df_with_no_rows": df_questionnaire_unclean_by_person.iloc[:0],
+                "other_df_by_key": other_df_by_key,
+            },
+            protocol=pickle.HIGHEST_PROTOCOL,
+        ),
+        manifests_directory / (manifest_name + MANIFEST_TABLES_FILE_EXTENSION),
+    )
+
+    manifest_path = manifests_directory / (manifest_name + MANIFEST_FILE_EXTENSION)
+    temporary_manifest_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(temporary_manifest_path, "w") as manifest_file:
+        json.dump(
+            {"partition_file_names": partition_file_names}, manifest_file, indent=4
+        )
+    os.replace(temporary_manifest_path, manifest_path)
+
+    return manifest_path
+
+
+def get_partitions_by_la(df_questionnaire_unclean_by_person: pd.DataFrame):
+    """
+    Each data return is one LA, so (with the data returns loaded one after another)
+    each run of rows with the same LaCode is one LA's data return.
+    Splitting on the runs, rather than grouping by LaCode, keeps the rows in the same order.
+    """
+    la_codes = (
+        df_questionnaire_unclean_by_person[LA_CODE_COLUMN_NAME].astype(str)
+        if LA_CODE_COLUMN_NAME in df_questionnaire_unclean_by_person.columns
+        else pd.Series("", index=df_questionnaire_unclean_by_person.index)
+    )
+    run_start_row_numbers = np.flatnonzero(la_codes.ne(la_codes.shift()))
+    run_end_row_numbers = np.append(
+        run_start_row_numbers[1:], len(df_questionnaire_unclean_by_person)
+    )
+
+    for start_row_number, end_row_number in zip(
+        run_start_row_numbers, run_end_row_numbers
+    ):
+        yield (
+            la_codes.iat[start_row_number],
+            df_questionnaire_unclean_by_person.iloc[
+                start_row_number:end_row_number
+            ].reset_index(drop=True),
+        )
+
+
+def get_partition_file_name(la_code: str, partition_bytes: bytes) -> str:
+    """
+    Named by a hash of the pickled partition, which is quicker than hashing the DataFrame
+    (and, unlike pd.util.hash_pandas_object, tells 1 from "1" in a column of numbers and text).
+    The LA code is only there to make the partitions easier to find, so anything odd in it is replaced.
+    """
+    la_code = re.sub(r"\W", "_", la_code)
+    partition_hash = hashlib.sha256(partition_bytes).hexdigest()
+    return f"{la_code}_{partition_hash[:32]}{PARTITION_FILE_EXTENSION}"
+
+
+def load_dataframes_from_partitioned_checkpoint(
+    checkpoint_path: Path, columns: Optional[list[str]] = None
+) -> tuple[pd.DataFrame, dict[str, pd.DataFrame]]:
+    """
+    checkpoint_path is either the checkpoint folder, when the latest manifest is loaded, or a manifest.
+    Returns the questionnaire (only the columns given, if they are)
+    and the other DataFrames saved with the manifest, by key.
+    """
+    manifest_path = (
+        checkpoint_path
+        if checkpoint_path.suffix == MANIFEST_FILE_EXTENSION
+        else get_latest_manifest_path(checkpoint_path)
+    )
+    partitions_directory = manifest_path.parent.parent / PARTITIONS_DIRECTORY_NAME
+
+    with open(manifest_path) as manifest_file:
+        partition_file_names = json.load(manifest_file)["partition_file_names"]
+    manifest_tables = pd.read_pickle(
+        manifest_path.with_suffix(MANIFEST_TABLES_FILE_EXTENSION)
+    )
+
+    df_partitions = []
+    for partition_file_name in partition_file_names:
+        df_partition = pd.read_pickle(partitions_directory / partition_file_name)
+        if columns is not None:
+            df_partition = df_partition[
+                [column_name for column_name in df_partition if column_name in columns]
+            ]
+        df_partitions.append(df_partition)
+
+    # The partitions were all split from the same DataFrame, so have the same columns and dtypes
+    df_questionnaire_unclean_by_person = (
+        pd.concat(df_partitions, ignore_index=True)
+        if df_partitions
+        else manifest_tables["df_with_no_rows"]
+    )
+    if not df_partitions and columns is not None:
+        df_questionnaire_unclean_by_person = df_questionnaire_unclean_by_person[
+            [
+                column_name
+                for column_name in df_questionnaire_unclean_by_person
+                if column_name in columns
+            ]
+        ]
+
+    return df_questionnaire_unclean_by_person, manifest_tables["other_df_by_key"]
+
+
+def get_manifest_paths(checkpoint_path: Path) -> list[Path]:
+    """
+    Oldest first
+    """
+    manifests_directory = checkpoint_path / MANIFESTS_DIRECTORY_NAME
+    if not manifests_directory.exists():
+        return []
+    return sorted(manifests_directory.glob("*" + MANIFEST_FILE_EXTENSION))
+
+
+def get_latest_manifest_path(checkpoint_path: Path) -> Path:
+    manifest_paths = get_manifest_paths(checkpoint_path)
+    assert manifest_paths, f"The checkpoint {checkpoint_path} doesn't have a manifest"
+    return manifest_paths[-1]
+
+
+def is_partitioned_checkpoint_path(checkpoint_path: Path) -> bool:
+    """
+    True for a partitioned checkpoint folder or one of its manifests
+    """
+    return checkpoint_path.suffix == PARTITIONED_CHECKPOINT_FILE_EXTENSION or (
+        checkpoint_path.suffix == MANIFEST_FILE_EXTENSION
+        and checkpoint_path.parent.parent.suffix
+        == PARTITIONED_CHECKPOINT_FILE_EXTENSION
+    )
+
+
+def compact_partitioned_checkpoint(
+    checkpoint_path: Path, number_of_manifests_to_keep: int = 1
+) -> int:
+    """
+    Deletes all but the newest manifests, and the partitions that none of those that are left use.
+    Returns the number of files deleted.
+    """
+    assert number_of_manifests_to_keep >= 1
+
+    manifest_paths = get_manifest_paths(checkpoint_path)
+    manifest_paths_to_keep = manifest_paths[-number_of_manifests_to_keep:]
+    partition_file_names_in_use = set()
+    for manifest_path in manifest_paths_to_keep:
+        with open(manifest_path) as manifest_file:
+            partition_file_names_in_use.update(
+                json.load(manifest_file)["partition_file_names"]
+            )
+
+    paths_to_delete = []
+    for manifest_path in manifest_paths[:-number_of_manifests_to_keep]:
+        paths_to_delete.append(manifest_path)
+        paths_to_delete.append(
+            manifest_path.with_suffix(MANIFEST_TABLES_FILE_EXTENSION)
+        )
+    paths_to_delete.extend(
+        partition_path
+        for partition_path in (checkpoint_path / PARTITIONS_DIRECTORY_NAME).iterdir()
+        if partition_path.name not in partition_file_names_in_use
+    )
+
+    for path in paths_to_delete:
+        # The tables file of a manifest could be missing if a save was stopped part way through
+        if path.exists():
+            os.remove(path)
+
+    return len(paths_to_delete)
+
+
+def save_bytes(value_bytes: bytes, path: Path) -> None:
+    """
+    Written to a temporary file then renamed, so a half written file is never left behind
+    """
+    temporary_path = path.with_name(path.name + ".tmp")
+    with open(temporary_path, "wb") as file:
+        file.write(value_bytes)
+    os.replace(temporary_path, path)
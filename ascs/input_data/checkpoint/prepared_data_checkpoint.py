@@ -0,0 +1,90 @@
+from datetime import datetime
+from pathlib import Path
+import logging
+import os
+
+import pandas as pd
+
+from ascs import params
+from ..data_needed_for_table_creation import DataNeededForTableCreation
+from .checkpoint_config import (
+    CHECKPOINTS_DIRECTORY,
+    FIELDS_LEFT_OUT_OF_PREPARED_DATA_CHECKPOINT,
+    PREPARED_DATA_CHECKPOINT_FILE_EXTENSION,
+    PREPARED_DATA_CHECKPOINTS_DIRECTORY_NAME,
+)
+
+
+def get_prepared_data_checkpoints_directory() -> Path:
+    return (
+        Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR)
+        / PREPARED_DATA_CHECKPOINTS_DIRECTORY_NAME
+    )
+
+
+def get_prepared_data_checkpoint_filename_from_current_time() -> str:
+    return (
+        datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        + PREPARED_DATA_CHECKPOINT_FILE_EXTENSION
+    )
+
+
+def save_prepared_data_checkpoint(
+    data_needed_for_table_creation: DataNeededForTableCreation,
+    path_to_save_to: Path,
+    checkpoint_filename: str = None,
+) -> Path:
+    """
+    Saves everything the tables are made from, once the questionnaire has been cleaned, validated and preprocessed,
+    so a rerun can start making the tables straight away.
+    The uncleaned questionnaire is left out, as it is already in the data returns checkpoint.
+
+    It is pickled (like the parse cache) so every DataFrame and Series comes back exactly as it was,
+    whatever its index and dtypes.
+    It is saved before the tables are made, rather than in the background, as the tables could change the DataFrames.
+    """
+    if checkpoint_filename is None:
+        checkpoint_filename = get_prepared_data_checkpoint_filename_from_current_time()
+
+    path_to_save_to.mkdir(parents=True, exist_ok=True)
+
+    checkpoint_path = path_to_save_to / checkpoint_filename
+    temporary_checkpoint_path = checkpoint_path.with_name(checkpoint_path.name + ".tmp")
+    pd.to_pickle(
+        {
+            field_name: value
+            for field_name, value in data_needed_for_table_creation._asdict().items()
+            if field_name not in FIELDS_LEFT_OUT_OF_PREPARED_DATA_CHECKPOINT
+        },
+        temporary_checkpoint_path,
+    )
+    os.replace(temporary_checkpoint_path, checkpoint_path)
+
+    logging.info(f"Prepared data checkpoint saved to {checkpoint_path}")
+    return checkpoint_path
+
+
+def load_prepared_data_checkpoint(
+    checkpoint_file_to_use: str,
+) -> DataNeededForTableCreation:
+    value_by_field_name = pd.read_pickle(checkpoint_file_to_use)
+    return DataNeededForTableCreation(
+        **{
+            field_name: value
+            for field_name, value in value_by_field_name.items()
+            # So a checkpoint saved by an older version of the code can still be loaded
+            if field_name in DataNeededForTableCreation._fields
+        }
+    )
+
+
+def get_current_year_prepared_data_checkpoint_files() -> list[str]:
+    prepared_data_checkpoints_directory = get_prepared_data_checkpoints_directory()
+    if not prepared_data_checkpoints_directory.exists():
+        return []
+
+    return [
+        str(prepared_data_checkpoints_directory / file)
+        for file in sorted(os.listdir(prepared_data_checkpoints_directory))
+        if file.endswith(PREPARED_DATA_CHECKPOINT_FILE_EXTENSION)
+    ]
@@ -1,25 +1,32 @@
+import functools
 import pandas as pd
 
-from typing import Callable
+from typing import Callable, Optional
 
 from ascs.input_data.validators.serial_number_duplicates_validator import (
     SerialNumberDuplicatesValidator,
 )
 
 from .df_with_errors import DFWithErrors
-
-from .validators.whole_number_validator import run_all_whole_number_validations
-from .validators.between_validator import run_all_between_validations
-from .validators.easy_read_validator import run_all_easy_read_validations
-from .validators.multichoice_questions_validator import run_all_multichoice_validations
-from .validators.is_in_validator import (
-    run_all_is_in_validations_for_demographic_columns,
+from .input_columns_needed import needs_question_columns_not_loaded
+from .la_shards import run_on_la_shards
+from .la_shards_config import (
+    MINIMUM_ROWS_TO_PREPROCESS_IN_LA_SHARDS,
+    NUMBER_OF_PROCESSES_FOR_PREPROCESSING,
 )
+
+from .validators.base_validator import BaseValidator
+from .validators.fused_validation import run_validators_in_one_pass
+from .validators.whole_number_validator import get_all_whole_number_validators
+from .validators.between_validator import get_all_between_validators
+from .validators.easy_read_validator import get_all_easy_read_validators
+from .validators.multichoice_questions_validator import get_all_multichoice_validators
+from .validators.is_in_validator import get_all_is_in_validators_for_demographic_columns
 from .validators.column_should_be_certain_value_for_non_respondents_validator import (
-    run_all_column_should_be_certain_value_for_non_respondents_validations,
+    get_all_column_should_be_certain_value_for_non_respondents_validators,
 )
 from .validators.column_should_be_null_for_non_respondents_validator import (
-    run_all_column_should_be_null_for_non_respondents_validations,
+    get_all_column_should_be_null_for_non_respondents_validators,
 )
 
 from .preprocess_questionnaire.type_conversions import clean_all_types
@@ -32,11 +39,9 @@ from .preprocess_questionnaire.q2c_preprocessing import do_q2c_preprocessing
 from .preprocess_questionnaire.demographics_columns import (
     add_all_grouped_demographics_columns,
 )
-from .preprocess_questionnaire.miscellaneous_preprocessing import (
-    replace_erroneous_input_value_with_null,
-    add_stratum_column,
-)
+from .preprocess_questionnaire.miscellaneous_preprocessing import add_stratum_column
 from .preprocess_questionnaire.generate_ascof_scores import generate_all_scores
+from .preprocess_questionnaire.categorical_columns import make_columns_categorical
 
 
 PreprocessFunction = Callable[[pd.DataFrame], pd.DataFrame]
@@ -45,7 +50,22 @@ ValidateCleanerFunction = Callable[[pd.DataFrame], DFWithErrors]
 
 def clean_validate_preprocess_questionnaire(
     df_questionnaire_by_person: pd.DataFrame,
+    number_of_processes: int = None,
+    question_columns_not_loaded: Optional[list[str]] = None,
 ) -> DFWithErrors:
+    """
+    The validation and preprocessing treat each LA on its own,
+    so on a big questionnaire they are done for a share of the LAs in each of number_of_processes processes (see la_shards.py).
+    The types are cleaned before, and the columns made categorical after, on the whole questionnaire,
+    as the types those steps give a column depend on all of its values.
+
+    The steps that need the question_columns_not_loaded are skipped (see input_columns_needed.py).
+    """
+    if number_of_processes is None:
+        number_of_processes = NUMBER_OF_PROCESSES_FOR_PREPROCESSING
+    if len(df_questionnaire_by_person) < MINIMUM_ROWS_TO_PREPROCESS_IN_LA_SHARDS:
+        number_of_processes = 1
+
     # Copying the data ensures the unclean DataFrame is not edited
     df_questionnaire_by_person = df_questionnaire_by_person.copy()
 
@@ -54,24 +74,48 @@ def clean_validate_preprocess_questionnaire(
 
     df_questionnaire_w_errs = (
         DFWithErrors(df_questionnaire_by_person)
-        .run_transformer_on_df(replace_erroneous_input_value_with_null)
         .pipe(clean_all_types)
-        .pipe(validate_that_numbers_are_in_expected_range)
-        .pipe(add_derived_columns_needed_for_later_validations)
-        .pipe(run_more_complex_validations)
-        .pipe(do_final_preprocessing)
+        .pipe(
+            run_on_la_shards,
+            functools.partial(
+                validate_and_preprocess_questionnaire,
+                question_columns_not_loaded=question_columns_not_loaded,
+            ),
+            number_of_processes=number_of_processes,
+        )
+        .run_transformer_on_df(make_columns_categorical)
     )
 
     return df_questionnaire_w_errs
 
 
-def validate_that_numbers_are_in_expected_range(
+def validate_and_preprocess_questionnaire(
     df_questionnaire_w_errs: DFWithErrors,
+    question_columns_not_loaded: Optional[list[str]] = None,
 ) -> DFWithErrors:
     return (
-        df_questionnaire_w_errs.pipe(run_all_whole_number_validations)
-        .pipe(run_all_between_validations)
-        .pipe(run_all_is_in_validations_for_demographic_columns)
+        df_questionnaire_w_errs.pipe(
+            validate_that_numbers_are_in_expected_range, question_columns_not_loaded
+        )
+        .pipe(add_derived_columns_needed_for_later_validations)
+        .pipe(run_more_complex_validations, question_columns_not_loaded)
+        .pipe(do_final_preprocessing, question_columns_not_loaded)
+    )
+
+
+def validate_that_numbers_are_in_expected_range(
+    df_questionnaire_w_errs: DFWithErrors,
+    question_columns_not_loaded: Optional[list[str]] = None,
+) -> DFWithErrors:
+    # The validators are checked together, see fused_validation.py
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        leave_out_validators_needing_question_columns_not_loaded(
+            get_all_whole_number_validators(df_questionnaire_w_errs.df)
+            + get_all_between_validators()
+            + get_all_is_in_validators_for_demographic_columns(),
+            question_columns_not_loaded,
+        ),
     )
 
 
@@ -85,23 +129,53 @@ def add_derived_columns_needed_for_later_validations(
 
 def run_more_complex_validations(
     df_questionnaire_w_errs: DFWithErrors,
+    question_columns_not_loaded: Optional[list[str]] = None,
 ) -> DFWithErrors:
-    return (
-        df_questionnaire_w_errs.pipe(
-            run_all_column_should_be_null_for_non_respondents_validations
-        )
-        .pipe(run_all_column_should_be_certain_value_for_non_respondents_validations)
-        .pipe(run_all_easy_read_validations)
-        .pipe(run_all_multichoice_validations)
-        .run_validator_on_df(SerialNumberDuplicatesValidator())
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        leave_out_validators_needing_question_columns_not_loaded(
+            get_all_column_should_be_null_for_non_respondents_validators()
+            + get_all_column_should_be_certain_value_for_non_respondents_validators()
+            + get_all_easy_read_validators()
+            + get_all_multichoice_validators()
+            + [SerialNumberDuplicatesValidator()],
+            question_columns_not_loaded,
+        ),
     )
 
 
-def do_final_preprocessing(df_questionnaire_w_errs: DFWithErrors,) -> DFWithErrors:
+def do_final_preprocessing(
+    df_questionnaire_w_errs: DFWithErrors,
+    question_columns_not_loaded: Optional[list[str]] = None,
+) -> DFWithErrors:
     return (
-        df_questionnaire_w_errs.run_transformer_on_df(add_easy_read_columns)
-        .run_transformer_on_df(add_excluded_columns)
+        df_questionnaire_w_errs.run_transformer_on_df(
+            add_easy_read_columns,
+            question_columns_not_loaded=question_columns_not_loaded,
+        )
+        .run_transformer_on_df(
+            add_excluded_columns,
+            question_columns_not_loaded=question_columns_not_loaded,
+        )
         .run_transformer_on_df(add_all_grouped_demographics_columns)
-        .run_transformer_on_df(do_q2c_preprocessing)
-        .run_transformer_on_df(generate_all_scores)
+        .run_transformer_on_df(
+            do_q2c_preprocessing,
+            question_columns_not_loaded=question_columns_not_loaded,
+        )
+        .run_transformer_on_df(
+            generate_all_scores,
+            question_columns_not_loaded=question_columns_not_loaded,
+        )
     )
+
+
+def leave_out_validators_needing_question_columns_not_loaded(
+    validators: list[BaseValidator], question_columns_not_loaded: Optional[list[str]]
+) -> list[BaseValidator]:
+    return [
+        validator
+        for validator in validators
+        if not needs_question_columns_not_loaded(
+            validator.get_columns_read(), question_columns_not_loaded
+        )
+    ]
@@ -10,4 +10,7 @@ class DataNeededForTableCreation(NamedTuple):
     average_rows: pd.DataFrame = None
     df_by_validation_error: pd.DataFrame = None
     df_loading_error_by_file: pd.DataFrame = None
+    df_ingest_telemetry_by_file: pd.DataFrame = None
     df_questionnaire_unclean_by_person: pd.DataFrame = None
+    # See step_profiler.py, None unless the preprocessing was profiled
+    df_preprocessing_profile_by_step: pd.DataFrame = None
@@ -3,9 +3,12 @@ from __future__ import annotations
 # This import is needed to allow a type definition for a method that refers to the type it is in
 # https://stackoverflow.com/questions/33533148/how-do-i-type-hint-a-method-with-the-type-of-the-enclosing-class
 
+import numpy as np
 import pandas as pd
 
-from typing import TYPE_CHECKING, Callable, NamedTuple, TypeVar
+from typing import TYPE_CHECKING, Callable, NamedTuple, TypeVar, Union
+
+from .step_profiler import profiled_step
 
 
 if TYPE_CHECKING:
@@ -19,17 +22,35 @@ ValidatorFunction = Callable[[pd.DataFrame], "DFWithErrors"]
 
 ReturnType = TypeVar("ReturnType")
 
+# The columns of the questionnaire that are in every error DataFrame
+ERROR_DF_ID_COLUMNS = ["LaCode", "PrimaryKey", "SerialNo"]
+
+
+class DeferredErrors(NamedTuple):
+    """
+    The errors a validator found, kept as the row numbers of the invalid rows
+    and their values in the columns the validator read, rather than as an error DataFrame.
+    The messages and the LaCode, PrimaryKey and SerialNo columns are only made when the errors are concatenated,
+    see concatenate_errors_into_one_df.
+    """
+
+    validator: BaseValidator
+    row_numbers: np.ndarray
+    df_values_read: pd.DataFrame
+
 
 class DFWithErrors(NamedTuple):
     """
     While doing preprocessing and validating, you slowly create a new DataFrame, and you accumulate errors.
     This class stores both the errors and the DataFrame together for convenience.
     It also makes it easy to append new errors to this list of errors as you go doing multiple validations in a row.
+    While profile_steps is on, each transformer and validator run on it is profiled (see step_profiler.py).
     """
 
     df: pd.DataFrame
-    error_dfs: list[pd.DataFrame] = []
+    error_dfs: list[Union[pd.DataFrame, DeferredErrors]] = []
 
+    @profiled_step
     def run_transformer_on_df(
         self, df_transformer_function: DFTransformerFunction, *args, **kwargs
     ) -> DFWithErrors:
@@ -54,6 +75,7 @@ class DFWithErrors(NamedTuple):
         """
         return self.run_validator_function_on_df(validator.run_check, *args, **kwargs)
 
+    @profiled_step
     def run_validator_function_on_df(
         self, validator_function: ValidatorFunction, *args, **kwargs
     ) -> DFWithErrors:
@@ -83,10 +105,102 @@ class DFWithErrors(NamedTuple):
         """
         return function_that_takes_df_with_errors(self, *args, **kwargs)
 
+    def get_number_of_errors(self) -> int:
+        """
+        The number of rows concatenate_errors_into_one_df would give, without making them
+        """
+        return sum(
+            len(error_df.row_numbers)
+            if isinstance(error_df, DeferredErrors)
+            else len(error_df)
+            for error_df in self.error_dfs
+        )
+
     def concatenate_errors_into_one_df(self):
-        if len(self.error_dfs) == 0:
-            return pd.DataFrame(
-                [], columns=["LaCode", "PrimaryKey", "SerialNo", "message"]
+        """
+        Any DeferredErrors are made into error DataFrames here, taking the LaCode, PrimaryKey and SerialNo
+        of their rows from this object's DataFrame (the rows are never dropped or reordered, and those columns never set null,
+        once the questionnaire has been loaded). They can have been made categorical by then, so are taken as objects,
+        the same as in the other error DataFrames. Each run of DeferredErrors is made into one DataFrame together.
+        DeferredErrors without any errors are left out.
+        """
+        error_dfs_with_errors = [
+            error_df
+            for error_df in self.error_dfs
+            if not (
+                isinstance(error_df, DeferredErrors) and len(error_df.row_numbers) == 0
             )
-
-        return pd.concat(self.error_dfs, axis=0, ignore_index=True)
+        ]
+        if len(error_dfs_with_errors) == 0:
+            return pd.DataFrame([], columns=ERROR_DF_ID_COLUMNS + ["message"])
+
+        error_dfs = []
+        deferred_errors_to_make_into_df = []
+        for error_df in error_dfs_with_errors + [None]:
+            if isinstance(error_df, DeferredErrors):
+                deferred_errors_to_make_into_df.append(error_df)
+                continue
+
+            if deferred_errors_to_make_into_df:
+                error_dfs.append(
+                    make_error_df_from_deferred_errors(
+                        self.df, deferred_errors_to_make_into_df
+                    )
+                )
+                deferred_errors_to_make_into_df = []
+            if error_df is not None:
+                error_dfs.append(error_df)
+
+        return pd.concat(error_dfs, axis=0, ignore_index=True)
+
+
+def make_error_df_from_deferred_errors(
+    df_questionnaire_by_person: pd.DataFrame,
+    deferred_errors_list: list[DeferredErrors],
+) -> pd.DataFrame:
+    """
+    The same as the error DataFrames the validators would have made (see BaseValidator.get_error_df), one after another
+    """
+    df_by_error = get_rows_and_columns(
+        df_questionnaire_by_person,
+        np.concatenate(
+            [deferred_errors.row_numbers for deferred_errors in deferred_errors_list]
+        ),
+        ERROR_DF_ID_COLUMNS,
+    ).astype(object)
+    df_by_error["message"] = np.concatenate(
+        [
+            get_error_messages(deferred_errors)
+            for deferred_errors in deferred_errors_list
+        ]
+    )
+    return df_by_error
+
+
+def get_error_messages(deferred_errors: DeferredErrors) -> np.ndarray:
+    """
+    get_error_message gives either one message for all the rows, or a message for each
+    """
+    error_message = deferred_errors.validator.get_error_message(
+        deferred_errors.df_values_read
+    )
+    if isinstance(error_message, str):
+        return np.full(len(deferred_errors.row_numbers), error_message, dtype=object)
+    return np.asarray(error_message, dtype=object)
+
+
+def get_rows_and_columns(
+    df_questionnaire_by_person: pd.DataFrame,
+    row_numbers: np.ndarray,
+    column_names: list[str],
+) -> pd.DataFrame:
+    """
+    Taken a column at a time, as taking the rows of the DataFrame first would copy every column,
+    and taking the columns first would copy every row
+    """
+    return pd.DataFrame(
+        {
+            column_name: df_questionnaire_by_person[column_name].iloc[row_numbers]
+            for column_name in column_names
+        }
+    )
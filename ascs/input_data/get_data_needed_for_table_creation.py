@@ -1,28 +1,173 @@
 import logging
+from typing import Optional
 
 from .data_needed_for_table_creation import DataNeededForTableCreation
 from .load_data_returns.data_return_config import LoadedDataReturns
 from .load_csv import load_df_population_by_la
+from .input_columns_needed import (
+    get_input_columns_to_load,
+    get_input_question_columns_not_loaded,
+    select_input_columns_to_load,
+)
 
 from ascs.stratified_tables.stratified_by_average_group_tables import (
     StratifiedByAverageGroupTables,
 )
-from .checkpoint.checkpoint_menu import load_data_from_data_return_with_menu
+from .checkpoint.checkpoint_config import (
+    PREPARED_DATA_CHECKPOINT_KIND,
+    REUSE_MATCHING_CHECKPOINTS_AUTOMATICALLY,
+    SAVE_PREPARED_DATA_CHECKPOINT,
+)
+from .checkpoint.checkpoint_file_handler import get_current_year_checkpoints_directory
+from .checkpoint.checkpoint_fingerprint import (
+    get_data_returns_fingerprint,
+    get_prepared_data_fingerprint,
+)
+from .checkpoint.checkpoint_index import (
+    add_checkpoint_to_index,
+    find_checkpoint_in_index,
+)
+from .checkpoint.checkpoint_menu import (
+    load_data_from_data_return_and_check_inputs_with_menu,
+    select_prepared_data_checkpoint_to_load,
+    want_to_load_prepared_data_checkpoint,
+)
+from .checkpoint.prepared_data_checkpoint import (
+    get_prepared_data_checkpoints_directory,
+    load_prepared_data_checkpoint,
+    save_prepared_data_checkpoint,
+)
 from .clean_validate_preprocess_questionnaire import (
     clean_validate_preprocess_questionnaire,
 )
 from .preprocess_eligible_population.preprocessing_eligible_population import (
     preprocess_eligible_population_data,
 )
+from .step_profiler import run_with_step_profile, warn_about_steps_that_regressed
+from .step_profiler_config import (
+    PROFILE_PREPROCESSING_STEPS,
+    TRACE_MEMORY_ALLOCATIONS_WHEN_PROFILING,
+)
+
+
+def get_data_needed_for_table_creation_with_menu(
+    input_question_columns_needed: Optional[list[str]] = None,
+    unclean_questionnaire_needed: bool = False,
+) -> DataNeededForTableCreation:
+    """
+    A prepared data checkpoint skips loading the data returns and preprocessing them,
+    otherwise one is saved once they have been preprocessed.
+
+    The checkpoints made from the same data returns, eligible population data, params and preprocessing code as this run
+    are found from their fingerprints (see checkpoint_fingerprint.py) and loaded without asking.
+
+    Only the question columns given (see input_columns_needed.py) are loaded and preprocessed,
+    all of them if input_question_columns_needed is None.
+    A prepared data checkpoint is only saved when all of them were, so it can be used for any tables.
+
+    The uncleaned questionnaire isn't in the prepared data checkpoints,
+    so when it is needed the data returns are loaded and preprocessed instead.
+    """
+    data_returns_fingerprint, prepared_data_fingerprint = get_fingerprints_of_inputs()
+
+    matching_checkpoint_path = (
+        find_checkpoint_in_index(
+            get_current_year_checkpoints_directory(),
+            PREPARED_DATA_CHECKPOINT_KIND,
+            prepared_data_fingerprint,
+        )
+        if prepared_data_fingerprint is not None
+        else None
+    )
+
+    if not unclean_questionnaire_needed:
+        if matching_checkpoint_path is not None:
+            logging.info(
+                f"Loading {matching_checkpoint_path}, which was made from the same inputs"
+            )
+            return load_prepared_data_checkpoint(str(matching_checkpoint_path))
+
+        if want_to_load_prepared_data_checkpoint():
+            checkpoint_file_to_use = select_prepared_data_checkpoint_to_load()
+            logging.info("Loading the prepared data checkpoint")
+            return load_prepared_data_checkpoint(checkpoint_file_to_use)
+    else:
+        logging.info(
+            "Not loading a prepared data checkpoint, as the uncleaned questionnaire isn't saved in them"
+        )
+
+    (
+        loaded_data_returns,
+        loaded_data_returns_match_fingerprint,
+    ) = load_data_from_data_return_and_check_inputs_with_menu(
+        data_returns_fingerprint,
+        get_input_columns_to_load(input_question_columns_needed),
+    )
+
+    data_needed_for_table_creation = get_data_needed_for_table_creation_from_loaded_data_returns(
+        loaded_data_returns, input_question_columns_needed
+    )
+
+    if (
+        SAVE_PREPARED_DATA_CHECKPOINT
+        and input_question_columns_needed is None
+        # There is already a checkpoint of the same prepared data
+        and matching_checkpoint_path is None
+    ):
+        checkpoint_path = save_prepared_data_checkpoint(
+            data_needed_for_table_creation, get_prepared_data_checkpoints_directory()
+        )
+        if (
+            prepared_data_fingerprint is not None
+            and loaded_data_returns_match_fingerprint
+        ):
+            add_checkpoint_to_index(
+                get_current_year_checkpoints_directory(),
+                PREPARED_DATA_CHECKPOINT_KIND,
+                prepared_data_fingerprint,
+                checkpoint_path,
+            )
+
+    return data_needed_for_table_creation
+
+
+def get_fingerprints_of_inputs() -> tuple[Optional[str], Optional[str]]:
+    """
+    The fingerprints of the data returns and of everything the prepared data is made from,
+    or None if they can't be made (a checkpoint can then still be picked from the menu)
+    """
+    if not REUSE_MATCHING_CHECKPOINTS_AUTOMATICALLY:
+        return None, None
+
+    logging.info("Fingerprinting the data returns, population data and params")
+    try:
+        data_returns_fingerprint = get_data_returns_fingerprint()
+        return (
+            data_returns_fingerprint,
+            get_prepared_data_fingerprint(data_returns_fingerprint),
+        )
+    except OSError as err:
+        logging.warning("Couldn't fingerprint the inputs to find a matching checkpoint")
+        logging.warning(str(err))
+        return None, None
 
 
 def get_data_needed_for_table_creation_from_loaded_data_returns(
     loaded_data_returns: LoadedDataReturns,
+    input_question_columns_needed: Optional[list[str]] = None,
 ) -> DataNeededForTableCreation:
-    df_questionnaire_unclean_by_person = (
-        loaded_data_returns.df_questionnaire_unclean_by_person
+    """
+    The average rows are made from every question, so are left out
+    unless all the question columns are needed
+    """
+    df_questionnaire_unclean_by_person = select_input_columns_to_load(
+        loaded_data_returns.df_questionnaire_unclean_by_person,
+        input_question_columns_needed,
     )
     df_loading_error_by_file = loaded_data_returns.df_loading_error_by_file
+    question_columns_not_loaded = get_input_question_columns_not_loaded(
+        input_question_columns_needed
+    )
     logging.info("Loading population data")
     df_population_by_la = load_df_population_by_la().astype({"LaCode": str})
     (
@@ -32,21 +177,39 @@ def get_data_needed_for_table_creation_from_loaded_data_returns(
     ) = preprocess_eligible_population_data(df_population_by_la)
 
     logging.info("Starting clean, validate and preprocess questionnaire")
-    df_questionnaire_w_errs = clean_validate_preprocess_questionnaire(
-        df_questionnaire_unclean_by_person
-    )
+    if PROFILE_PREPROCESSING_STEPS:
+        (
+            df_questionnaire_w_errs,
+            df_preprocessing_profile_by_step,
+        ) = run_with_step_profile(
+            clean_validate_preprocess_questionnaire,
+            df_questionnaire_unclean_by_person,
+            question_columns_not_loaded=question_columns_not_loaded,
+            trace_memory_allocations=TRACE_MEMORY_ALLOCATIONS_WHEN_PROFILING,
+        )
+        warn_about_steps_that_regressed(df_preprocessing_profile_by_step)
+    else:
+        df_questionnaire_w_errs = clean_validate_preprocess_questionnaire(
+            df_questionnaire_unclean_by_person,
+            question_columns_not_loaded=question_columns_not_loaded,
+        )
+        df_preprocessing_profile_by_step = None
 
     df_questionnaire_by_person = df_questionnaire_w_errs.df
     df_by_validation_error = df_questionnaire_w_errs.concatenate_errors_into_one_df()
 
-    average_rows = StratifiedByAverageGroupTables(
-        DataNeededForTableCreation(
-            df_questionnaire_by_person=df_questionnaire_by_person,
-            population_by_la_stratum=population_by_la_stratum,
-            population_sample_by_la_stratum=population_sample_by_la_stratum,
-            population_2c_by_la_stratum=population_2c_by_la_stratum,
-        )
-    ).get_table_by_supergroup_question_response()
+    average_rows = (
+        StratifiedByAverageGroupTables(
+            DataNeededForTableCreation(
+                df_questionnaire_by_person=df_questionnaire_by_person,
+                population_by_la_stratum=population_by_la_stratum,
+                population_sample_by_la_stratum=population_sample_by_la_stratum,
+                population_2c_by_la_stratum=population_2c_by_la_stratum,
+            )
+        ).get_table_by_supergroup_question_response()
+        if input_question_columns_needed is None
+        else None
+    )
 
     return DataNeededForTableCreation(
         df_questionnaire_by_person=df_questionnaire_by_person,
@@ -56,5 +219,7 @@ def get_data_needed_for_table_creation_from_loaded_data_returns(
         average_rows=average_rows,
         df_by_validation_error=df_by_validation_error,
         df_loading_error_by_file=df_loading_error_by_file,
+        df_ingest_telemetry_by_file=loaded_data_returns.df_ingest_telemetry_by_file,
         df_questionnaire_unclean_by_person=df_questionnaire_unclean_by_person,
+        df_preprocessing_profile_by_step=df_preprocessing_profile_by_step,
     )
@@ -0,0 +1,110 @@
+import re
+from typing import Optional
+
+import pandas as pd
+
+from ascs import params
+from ascs.params_utils.params_transformations import column_name_is_a_question_column
+
+
+def get_input_question_columns() -> list[str]:
+    """
+    The question columns of the data returns (like q1, q2a), before any are derived from them
+    """
+    return [
+        column_name
+        for column_name in params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.values()
+        if column_name_is_a_question_column(column_name)
+    ]
+
+
+def get_input_question_columns_needed_for_columns(column_names: list[str]) -> list[str]:
+    """
+    The question columns of the data returns that the columns given are made from.
+
+    A column made from a question (like q1Comb, q20Excl or q22Exclb) is found from its question number,
+    so all the question columns with that number are needed (q2a, q2b and q2c for q2aComb).
+    That is more than is strictly needed, but a question's subquestions are validated together anyway.
+    """
+    question_numbers_needed = {
+        question_number_match.group(1)
+        for column_name in column_names
+        for question_number_match in [re.match(r"q(\d+)", column_name)]
+        if question_number_match is not None
+    }
+
+    return [
+        column_name
+        for column_name in get_input_question_columns()
+        if re.match(r"q(\d+)", column_name).group(1) in question_numbers_needed
+    ]
+
+
+def get_input_columns_to_load(
+    input_question_columns_needed: Optional[list[str]],
+) -> Optional[list[str]]:
+    """
+    All the columns of the data returns that aren't questions are always loaded
+    (they are small, and the cleaning, validation and preprocessing need most of them),
+    plus the question columns needed.
+    None (load all of them) if all the question columns are needed.
+    """
+    if input_question_columns_needed is None:
+        return None
+
+    return [
+        column_name
+        for column_name in params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.values()
+        if not column_name_is_a_question_column(column_name)
+        or column_name in input_question_columns_needed
+    ]
+
+
+def select_input_columns_to_load(
+    df_questionnaire_by_person: pd.DataFrame,
+    input_question_columns_needed: Optional[list[str]],
+) -> pd.DataFrame:
+    columns_to_load = get_input_columns_to_load(input_question_columns_needed)
+    if columns_to_load is None:
+        return df_questionnaire_by_person
+
+    return df_questionnaire_by_person[
+        [
+            column_name
+            for column_name in df_questionnaire_by_person.columns
+            if column_name in columns_to_load
+        ]
+    ]
+
+
+def get_input_question_columns_not_loaded(
+    input_question_columns_needed: Optional[list[str]],
+) -> Optional[list[str]]:
+    """
+    None if all the question columns are needed
+    """
+    if input_question_columns_needed is None:
+        return None
+
+    return [
+        column_name
+        for column_name in get_input_question_columns()
+        if column_name not in input_question_columns_needed
+    ]
+
+
+def needs_question_columns_not_loaded(
+    column_names: list[str], question_columns_not_loaded: Optional[list[str]]
+) -> bool:
+    """
+    When only some of the question columns are loaded, the validators and preprocessing steps
+    that need the questions that weren't loaded (or the columns made from them, like q1Comb) are skipped.
+    Only the questions left out on purpose are skipped like this,
+    so in a run with all of them any column that is missing still makes the step fail.
+    """
+    if not question_columns_not_loaded:
+        return False
+
+    return not set(
+        get_input_question_columns_needed_for_columns(column_names)
+    ).isdisjoint(question_columns_not_loaded)
@@ -0,0 +1,209 @@
+from typing import Callable, Union
+
+import numpy as np
+import pandas as pd
+
+from ascs.utilities.process_pool import get_process_pool_with_current_params
+from .df_with_errors import DeferredErrors, DFWithErrors
+from .step_profiler import (
+    StepProfile,
+    add_step_profiles,
+    is_profiling_steps,
+    is_tracing_memory_allocations,
+    profile_steps,
+)
+
+
+LA_CODE_COLUMN_NAME = "LaCode"
+
+DFWithErrorsFunction = Callable[[DFWithErrors], DFWithErrors]
+
+
+def run_on_la_shards(
+    df_questionnaire_w_errs: DFWithErrors,
+    df_with_errors_function: DFWithErrorsFunction,
+    number_of_processes: int,
+) -> DFWithErrors:
+    """
+    Gives the same DataFrame and errors as df_questionnaire_w_errs.pipe(df_with_errors_function),
+    but splits the questionnaire into a shard for each process (each with all the rows of some of the LAs)
+    and runs the function on the shards at the same time.
+
+    The function has to treat each LA on its own (nothing it does to one LA's rows can depend on another LA's),
+    and every run of it has to give the same number of errors DataFrames or DeferredErrors, in the same order,
+    whatever rows it is given (see run_validators_in_one_pass), so the errors can be merged one by one.
+    The function also has to be importable (not a lambda), so it can be sent to the other processes.
+    """
+    if number_of_processes <= 1:
+        return df_questionnaire_w_errs.pipe(df_with_errors_function)
+
+    row_numbers_by_shard = get_row_numbers_by_la_shard(
+        df_questionnaire_w_errs.df, number_of_processes
+    )
+    if len(row_numbers_by_shard) <= 1:
+        return df_questionnaire_w_errs.pipe(df_with_errors_function)
+
+    with get_process_pool_with_current_params(
+        len(row_numbers_by_shard)
+    ) as process_pool:
+        shards_w_errs_and_step_profiles = list(
+            process_pool.map(
+                run_on_shard,
+                [df_with_errors_function] * len(row_numbers_by_shard),
+                [
+                    df_questionnaire_w_errs.df.iloc[row_numbers]
+                    for row_numbers in row_numbers_by_shard
+                ],
+                [is_profiling_steps()] * len(row_numbers_by_shard),
+                [is_tracing_memory_allocations()] * len(row_numbers_by_shard),
+            )
+        )
+
+    for shard_number, (_, step_profiles) in enumerate(shards_w_errs_and_step_profiles):
+        add_step_profiles(
+            [
+                step_profile._replace(la_shard=shard_number)
+                for step_profile in step_profiles
+            ]
+        )
+
+    return merge_la_shards(
+        df_questionnaire_w_errs.error_dfs,
+        [shard_w_errs for shard_w_errs, _ in shards_w_errs_and_step_profiles],
+        row_numbers_by_shard,
+    )
+
+
+def run_on_shard(
+    df_with_errors_function: DFWithErrorsFunction,
+    df_shard: pd.DataFrame,
+    profile_steps_in_shard: bool = False,
+    trace_memory_allocations_in_shard: bool = False,
+) -> tuple[DFWithErrors, list[StepProfile]]:
+    """
+    Run in another process. The errors from before the questionnaire was split stay in the main process.
+    The steps are profiled (see step_profiler.py) when they are being profiled in the main process,
+    and the profiles sent back with the shard.
+    """
+    if not profile_steps_in_shard:
+        return DFWithErrors(df_shard).pipe(df_with_errors_function), []
+
+    with profile_steps(trace_memory_allocations_in_shard) as step_profiles:
+        shard_w_errs = DFWithErrors(df_shard).pipe(df_with_errors_function)
+    return shard_w_errs, step_profiles
+
+
+def get_row_numbers_by_la_shard(
+    df_questionnaire_by_person: pd.DataFrame, number_of_shards: int
+) -> list[np.ndarray]:
+    """
+    Each LA (including the rows without an LA code, which are treated as one more LA)
+    is put in the shard with the fewest rows so far, biggest LAs first, so the shards are about the same size.
+    The row numbers of each shard are in the order the rows are in the questionnaire.
+    Shards without any rows are left out.
+    """
+    la_number_by_row, la_codes = pd.factorize(
+        df_questionnaire_by_person[LA_CODE_COLUMN_NAME]
+    )
+    # The rows without an LA code are given -1, so they are made the last LA
+    la_number_by_row = np.where(la_number_by_row == -1, len(la_codes), la_number_by_row)
+    number_of_rows_by_la_number = np.bincount(la_number_by_row)
+
+    shard_number_by_la_number = np.zeros(len(number_of_rows_by_la_number), dtype=int)
+    number_of_rows_by_shard_number = np.zeros(number_of_shards, dtype=int)
+    for la_number in np.argsort(-number_of_rows_by_la_number, kind="stable"):
+        shard_number = np.argmin(number_of_rows_by_shard_number)
+        shard_number_by_la_number[la_number] = shard_number
+        number_of_rows_by_shard_number[shard_number] += number_of_rows_by_la_number[
+            la_number
+        ]
+
+    shard_number_by_row = shard_number_by_la_number[la_number_by_row]
+    return [
+        row_numbers
+        for shard_number in range(number_of_shards)
+        for row_numbers in [np.flatnonzero(shard_number_by_row == shard_number)]
+        if len(row_numbers) > 0
+    ]
+
+
+def merge_la_shards(
+    error_dfs_before_splitting: list[Union[pd.DataFrame, DeferredErrors]],
+    shards_w_errs: list[DFWithErrors],
+    row_numbers_by_shard: list[np.ndarray],
+) -> DFWithErrors:
+    """
+    The rows of the shards are put back in the order they were in before the questionnaire was split.
+    A column that has different dtypes in different shards
+    (like a column of whole numbers that only had some of its values set null in one shard)
+    gets the dtype pd.concat gives it, which is the one it would have had if the questionnaire hadn't been split.
+    """
+    row_numbers = np.concatenate(row_numbers_by_shard)
+    order_of_rows = np.argsort(row_numbers, kind="stable")
+    df_questionnaire_by_person = pd.concat(
+        [shard_w_errs.df for shard_w_errs in shards_w_errs], axis=0
+    ).iloc[order_of_rows]
+
+    number_of_error_dfs_by_shard = {
+        len(shard_w_errs.error_dfs) for shard_w_errs in shards_w_errs
+    }
+    assert (
+        len(number_of_error_dfs_by_shard) == 1
+    ), "Every shard should have the same number of error DataFrames, so they can be merged"
+
+    return DFWithErrors(
+        df=df_questionnaire_by_person,
+        error_dfs=error_dfs_before_splitting
+        + [
+            merge_error_dfs_of_la_shards(
+                list(error_df_by_shard),
+                df_questionnaire_by_person,
+                row_numbers_by_shard,
+            )
+            for error_df_by_shard in zip(
+                *[shard_w_errs.error_dfs for shard_w_errs in shards_w_errs]
+            )
+        ],
+    )
+
+
+def merge_error_dfs_of_la_shards(
+    error_df_by_shard: list[Union[pd.DataFrame, DeferredErrors]],
+    df_questionnaire_by_person: pd.DataFrame,
+    row_numbers_by_shard: list[np.ndarray],
+) -> Union[pd.DataFrame, DeferredErrors]:
+    """
+    The errors are put in the order of the rows they are for, as they would have been if the questionnaire hadn't been split.
+    The row numbers of DeferredErrors are changed from row numbers in the shard to row numbers in the whole questionnaire.
+    """
+    if all(isinstance(error_df, DeferredErrors) for error_df in error_df_by_shard):
+        row_numbers = np.concatenate(
+            [
+                row_numbers_of_shard[deferred_errors.row_numbers]
+                for deferred_errors, row_numbers_of_shard in zip(
+                    error_df_by_shard, row_numbers_by_shard
+                )
+            ]
+        )
+        order_of_errors = np.argsort(row_numbers, kind="stable")
+        return DeferredErrors(
+            validator=error_df_by_shard[0].validator,
+            row_numbers=row_numbers[order_of_errors],
+            df_values_read=pd.concat(
+                [
+                    deferred_errors.df_values_read
+                    for deferred_errors in error_df_by_shard
+                ],
+                axis=0,
+            ).iloc[order_of_errors],
+        )
+
+    assert not any(
+        isinstance(error_df, DeferredErrors) for error_df in error_df_by_shard
+    ), "The shards should have the same kind of errors at each position, so they can be merged"
+    # The error DataFrames have the index of the rows of the questionnaire they are for
+    df_by_error = pd.concat(error_df_by_shard, axis=0)
+    order_of_errors = np.argsort(
+        df_questionnaire_by_person.index.get_indexer(df_by_error.index), kind="stable"
+    )
+    return df_by_error.iloc[order_of_errors]
@@ -0,0 +1,8 @@
+import os
+
+
+# On a big questionnaire, the validation and preprocessing are done in this many processes at once,
+# each doing a share of the LAs (see la_shards.py). 1 does them all in this process
+NUMBER_OF_PROCESSES_FOR_PREPROCESSING = os.cpu_count() or 1
+# Below this many rows, starting the processes and sending them the questionnaire takes longer than it saves
+MINIMUM_ROWS_TO_PREPROCESS_IN_LA_SHARDS = 100_000
@@ -0,0 +1,117 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class ColumnarDataReturnStore:
+    """
+    Builds the DataFrame of every person one data return at a time,
+    instead of keeping every data return's DataFrame until the end to pd.concat them.
+
+    Each column of a data return is copied out as it is added, so the data return's DataFrame can be freed straight away.
+    Once every data return is in, the pieces of each column are joined one column at a time,
+    so only one column is ever held twice (where pd.concat holds every data return and the result at the same time).
+
+    The DataFrame is the same as pd.concat(dfs, ignore_index=True) would give,
+    the columns just aren't consolidated into blocks (which the first deep copy of it does).
+    """
+
+    def __init__(self):
+        # None for a data return without the column
+        self.column_pieces_by_column_name: dict[str, list[Optional[pd.Series]]] = {}
+        self.number_of_rows_by_data_return: list[int] = []
+        self.dtype_sample_by_data_return: list[pd.DataFrame] = []
+
+    def __len__(self) -> int:
+        return sum(self.number_of_rows_by_data_return)
+
+    def append(self, df_questionnaire_in_la_by_person: pd.DataFrame) -> None:
+        if df_questionnaire_in_la_by_person.shape == (0, 0):
+            # pd.concat leaves these out
+            return
+
+        for column_name in df_questionnaire_in_la_by_person.columns:
+            if column_name not in self.column_pieces_by_column_name:
+                self.column_pieces_by_column_name[column_name] = [None] * len(
+                    self.number_of_rows_by_data_return
+                )
+
+        for column_name, column_pieces in self.column_pieces_by_column_name.items():
+            column_pieces.append(
+                df_questionnaire_in_la_by_person[column_name].copy()
+                if column_name in df_questionnaire_in_la_by_person.columns
+                else None
+            )
+
+        self.number_of_rows_by_data_return.append(len(df_questionnaire_in_la_by_person))
+        self.dtype_sample_by_data_return.append(
+            get_dtype_sample(df_questionnaire_in_la_by_person)
+        )
+
+    def pop_df(self) -> pd.DataFrame:
+        """
+        Gives the DataFrame of every data return added, and empties the store
+        """
+        if not self.number_of_rows_by_data_return:
+            return pd.DataFrame()
+
+        dtype_by_column_name = pd.concat(
+            self.dtype_sample_by_data_return, ignore_index=True
+        ).dtypes
+
+        column_by_column_name = {}
+        for column_name, dtype in dtype_by_column_name.items():
+            column_by_column_name[column_name] = concat_column_pieces(
+                self.column_pieces_by_column_name.pop(column_name),
+                self.number_of_rows_by_data_return,
+                dtype,
+            )
+
+        self.number_of_rows_by_data_return = []
+        self.dtype_sample_by_data_return = []
+
+        return pd.DataFrame(column_by_column_name, copy=False)
+
+
+def get_dtype_sample(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    The dtype of each column that pd.concat gives depends on more than the dtypes of the pieces being joined:
+    columns which are entirely blank in a DataFrame are ignored, and columns sharing a block are given the same dtype.
+    So each column's dtype is found by joining a few rows of every DataFrame with pd.concat.
+
+    The rows are the first with a value in each column, which keeps the same columns entirely blank,
+    and taking rows keeps the dtypes and blocks of the DataFrame.
+    """
+    if df.empty:
+        return df
+
+    first_row_with_a_value_by_column = df.notna().to_numpy().argmax(axis=0)
+    return df.take(np.unique(first_row_with_a_value_by_column))
+
+
+def concat_column_pieces(
+    column_pieces: list[Optional[pd.Series]],
+    number_of_rows_by_data_return: list[int],
+    dtype,
+) -> pd.Series:
+    return pd.concat(
+        [
+            get_column_piece_as_dtype(column_piece, number_of_rows, dtype)
+            for column_piece, number_of_rows in zip(
+                column_pieces, number_of_rows_by_data_return
+            )
+        ],
+        ignore_index=True,
+    )
+
+
+def get_column_piece_as_dtype(
+    column_piece: Optional[pd.Series], number_of_rows: int, dtype
+) -> pd.Series:
+    if column_piece is None:
+        # pd.concat fills a column that is missing from one of the DataFrames with NaN
+        return pd.Series(np.nan, index=pd.RangeIndex(number_of_rows)).astype(dtype)
+    if column_piece.dtype != dtype:
+        return column_piece.astype(dtype)
+    return column_piece
@@ -1,6 +1,22 @@
 from typing import NamedTuple, Union
 import typed_params
 import pandas as pd
+import os
+
+
+# Loading the data returns is the slowest part of a run, so by default we use every core
+NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS = os.cpu_count() or 1
+# How many data returns each process can have loaded (or be loading) ahead of the one being used,
+# so the data returns loaded but not used yet don't all have to be held in memory
+DATA_RETURNS_IN_FLIGHT_PER_PROCESS = 2
+
+# Each data return is added to one growing DataFrame as soon as it is loaded (see columnar_store.py),
+# rather than keeping them all to pd.concat at the end, which needs twice the memory.
+# False goes back to pd.concat, to compare the peak memory used (it is logged)
+MERGE_DATA_RETURNS_INTO_COLUMNAR_STORE = True
+
+# How often the watch folder mode looks for new or changed data returns
+WATCH_FOLDER_POLL_INTERVAL_SECONDS = 30
 
 
 class DataReturnParams(typed_params.BaseModel):
@@ -12,3 +28,5 @@ class DataReturnParams(typed_params.BaseModel):
 class LoadedDataReturns(NamedTuple):
     df_questionnaire_unclean_by_person: pd.DataFrame
     df_loading_error_by_file: pd.DataFrame
+    # See ingest_telemetry.py, None for a checkpoint saved before this was added
+    df_ingest_telemetry_by_file: pd.DataFrame = None
@@ -0,0 +1,69 @@
+import sys
+from typing import NamedTuple, Optional
+
+import pandas as pd
+import psutil
+
+
+class DataReturnIngestTelemetry(NamedTuple):
+    """
+    How loading one data return went, to find the data returns that make loading slow
+    (like a workbook with a million formatted but blank rows).
+
+    rows_read is every row of Service User Data that was read, blank or not,
+    and persons_kept the rows left after ignore_rows_where_there_isnt_a_person.
+    peak_memory_delta_bytes is how much loading the data return raised the peak memory of the process loading it,
+    so is 0 when it needed less memory than a data return loaded before it by the same process.
+    A data return from the parse cache wasn't parsed, so only the time to read it from the cache is known.
+    """
+
+    file_size_bytes: Optional[int]
+    from_parse_cache: bool
+    parse_seconds: Optional[float] = None
+    rows_read: Optional[int] = None
+    persons_kept: Optional[int] = None
+    columns: Optional[int] = None
+    peak_memory_delta_bytes: Optional[int] = None
+
+
+def get_ingest_telemetry_df(
+    data_return_file_paths: list[str],
+    ingest_telemetry_by_file: list[DataReturnIngestTelemetry],
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {"file_path": file_path, **ingest_telemetry._asdict()}
+            for file_path, ingest_telemetry in zip(
+                data_return_file_paths, ingest_telemetry_by_file
+            )
+        ],
+        columns=["file_path", *DataReturnIngestTelemetry._fields],
+    ).astype(
+        # Float so that the values which aren't known are NaN, and so the table can be saved in a checkpoint
+        {
+            column_name: float
+            for column_name in DataReturnIngestTelemetry._fields
+            if column_name != "from_parse_cache"
+        }
+    )
+
+
+def get_peak_memory_of_this_process_in_bytes() -> int:
+    """
+    The most memory this process has used since it started.
+    This is cheap to get (unlike tracemalloc, which makes loading a data return about three times slower).
+    """
+    memory_info = psutil.Process().memory_info()
+    if hasattr(memory_info, "peak_wset"):
+        # Windows
+        return memory_info.peak_wset
+
+    import resource
+
+    max_resident_set_size = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # In bytes on macOS, kilobytes everywhere else
+    return (
+        max_resident_set_size
+        if sys.platform == "darwin"
+        else max_resident_set_size * 1024
+    )
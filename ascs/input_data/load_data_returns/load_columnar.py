@@ -0,0 +1,93 @@
+import logging
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+from .service_user_data import (
+    check_service_user_data_column_names,
+    get_service_user_data_from_np_array,
+    select_only_initial_expected_columns,
+)
+from .zip_archive import open_data_return_file
+from ascs import params
+
+
+CSV_FILE_EXTENSION = ".csv"
+PARQUET_FILE_EXTENSION = ".parquet"
+COLUMNAR_DATA_RETURN_FILE_EXTENSIONS = [CSV_FILE_EXTENSION, PARQUET_FILE_EXTENSION]
+
+LA_CODE_COLUMN_NAME = "LaCode"
+
+
+def is_columnar_data_return(file_path: Union[str, Path]) -> bool:
+    return Path(file_path).suffix in COLUMNAR_DATA_RETURN_FILE_EXTENSIONS
+
+
+def load_one_columnar_data_return(file_path: Union[str, Path]) -> pd.DataFrame:
+    return load_one_columnar_data_return_and_count_rows_read(file_path)[0]
+
+
+def load_one_columnar_data_return_and_count_rows_read(
+    file_path: Union[str, Path]
+) -> tuple[pd.DataFrame, int]:
+    """
+    Some councils send their Service User Data as a CSV or Parquet file exported from their own systems,
+    rather than in the excel template.
+    The file has the same columns as the Service User Data sheet, with the column names in the first row,
+    and goes through the same checks as a data return in the template.
+    There is no Sign Off Sheet, so the LA code comes from the LaCode column.
+    """
+    logging.info(file_path)
+
+    data_return_np = get_columnar_data_return_as_np_array(file_path)
+    service_user_data_np = select_only_initial_expected_columns(data_return_np)
+    check_service_user_data_column_names(service_user_data_np)
+
+    la_code = get_la_code_from_columnar_data_return(service_user_data_np)
+
+    return (
+        get_service_user_data_from_np_array(service_user_data_np, la_code),
+        len(data_return_np) - 1,
+    )
+
+
+def get_columnar_data_return_as_np_array(file_path: Union[str, Path]) -> np.ndarray:
+    """
+    Gives the same array as get_worksheet_as_np_array_from_workbook would for the Service User Data sheet:
+    the column names then the rows, with None for blank cells.
+    """
+    is_parquet = Path(file_path).suffix == PARQUET_FILE_EXTENSION
+    with open_data_return_file(file_path, random_access=is_parquet) as file:
+        if is_parquet:
+            df_data_return = pd.read_parquet(file)
+        else:
+            # Every value is read as text (as there is no type in a CSV),
+            # the columns are given their types in the same way as data returns in the template
+            df_data_return = pd.read_csv(file, dtype=str, keep_default_na=False)
+
+    values_np = df_data_return.to_numpy(dtype=object)
+    values_np[pd.isna(values_np) | (values_np == "")] = None
+
+    return np.vstack(
+        [np.array([df_data_return.columns.to_list()], dtype=object), values_np]
+    )
+
+
+def get_la_code_from_columnar_data_return(service_user_data_np: np.ndarray) -> str:
+    la_code_column_index = list(
+        params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.values()
+    ).index(LA_CODE_COLUMN_NAME)
+
+    la_codes = {
+        # A Parquet column of LA codes with a blank in it is a float column
+        str(int(la_code)) if isinstance(la_code, float) else str(la_code)
+        for la_code in service_user_data_np[1:, la_code_column_index]
+        if la_code is not None
+    }
+    assert (
+        len(la_codes) == 1
+    ), f"Expected one LA code in the {LA_CODE_COLUMN_NAME} column, but found {sorted(la_codes)}"
+
+    return la_codes.pop()
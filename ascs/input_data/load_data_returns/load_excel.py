@@ -1,86 +1,560 @@
 import logging
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-import warnings
 import pandas as pd
 
-from openpyxl import load_workbook
 import os
+import timeit
 
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
 
-from .data_return_config import LoadedDataReturns
-from .service_user_data import get_service_user_data_from_workbook
-from .worksheets import SIGN_OFF_SHEET_NAME, check_workbook_has_needed_worksheets
-from ..checkpoint.checkpoint_config import CHECKPOINTS_DIRECTORY
-from ..checkpoint.checkpoint_file_handler import save_data_return_checkpoint
+from .columnar_store import ColumnarDataReturnStore
+from .data_return_config import (
+    DATA_RETURNS_IN_FLIGHT_PER_PROCESS,
+    MERGE_DATA_RETURNS_INTO_COLUMNAR_STORE,
+    NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS,
+    LoadedDataReturns,
+)
+from .ingest_telemetry import (
+    DataReturnIngestTelemetry,
+    get_ingest_telemetry_df,
+    get_peak_memory_of_this_process_in_bytes,
+)
+from .load_columnar import (
+    COLUMNAR_DATA_RETURN_FILE_EXTENSIONS,
+    is_columnar_data_return,
+    load_one_columnar_data_return_and_count_rows_read,
+)
+from .parse_cache import (
+    get_data_return_params_hash,
+    get_file_content_hash,
+    get_parse_cache_directory,
+    get_parse_cache_file_path,
+    load_from_parse_cache,
+    save_to_parse_cache,
+)
+from .service_user_data import get_service_user_data_from_xlsx
+from .worksheets import (
+    SERVICE_USER_DATA_SHEET_NAME,
+    SIGN_OFF_SHEET_NAME,
+    check_workbook_has_needed_worksheets,
+)
+from .xlsx_reader import XlsxReader
+from .zip_archive import (
+    get_data_return_file_size,
+    get_file_names_in_zip_archive,
+    get_zip_member_path,
+    is_zip_archive,
+    open_data_return_file,
+)
+from ..checkpoint.checkpoint_config import (
+    CHECKPOINTS_DIRECTORY,
+    PARTITIONED_CHECKPOINT_FILENAME,
+    SAVE_DATA_RETURNS_TO_PARTITIONED_CHECKPOINT,
+)
+from ..checkpoint.checkpoint_file_handler import (
+    save_data_return_checkpoint_in_background,
+)
 from ascs import params
+from ascs.utilities.process_pool import get_process_pool_with_current_params
 
 
 LA_CODE_CELL_REF = "E2"
 
+EXCEL_FILE_EXTENSION = ".xlsx"
+DATA_RETURN_FILE_EXTENSIONS = tuple(
+    [EXCEL_FILE_EXTENSION] + COLUMNAR_DATA_RETURN_FILE_EXTENSIONS
+)
+
+T = TypeVar("T")
+
+# The people in the data return (or the error message if it didn't load) and how loading it went
+DataReturnLoadingResult = tuple[
+    Optional[pd.DataFrame], Optional[str], DataReturnIngestTelemetry
+]
+
 
 def load_all_data_returns_from_excel(
     directory: Optional[str] = None,
+    number_of_processes: Optional[int] = None,
+    parse_cache_directory: Optional[Path] = None,
+    checkpoint_fingerprint: Optional[str] = None,
 ) -> LoadedDataReturns:
+    """
+    The checkpoint saved afterwards is added to the checkpoint index under checkpoint_fingerprint, if it is given
+    """
     if directory is None:
         directory = params.DATA_RETURNS_DIRECTORY
+    if number_of_processes is None:
+        number_of_processes = NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS
+    if parse_cache_directory is None:
+        parse_cache_directory = get_parse_cache_directory()
 
     data_return_file_paths = get_all_data_return_file_paths(directory)
 
+    loaded_data_returns = combine_loaded_data_returns(
+        data_return_file_paths,
+        try_to_load_data_returns_using_parse_cache(
+            data_return_file_paths, number_of_processes, parse_cache_directory
+        ),
+    )
+
+    save_data_return_checkpoint_in_background(
+        loaded_data_returns,
+        Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR),
+        checkpoint_filename=PARTITIONED_CHECKPOINT_FILENAME
+        if SAVE_DATA_RETURNS_TO_PARTITIONED_CHECKPOINT
+        else None,
+        fingerprint=checkpoint_fingerprint,
+    )
+    logging.info("Saving the checkpoint in the background")
+
+    return loaded_data_returns
+
+
+def combine_loaded_data_returns(
+    data_return_file_paths: list[str],
+    results: Iterable[DataReturnLoadingResult],
+    merge_into_columnar_store: Optional[bool] = None,
+) -> LoadedDataReturns:
+    """
+    Puts the people from every data return that loaded into one DataFrame,
+    the errors from those that didn't into another, and how loading each one went into a third.
+
+    With merge_into_columnar_store (the default, see data_return_config.py) each data return's people
+    are added to a ColumnarDataReturnStore as soon as they are loaded and then let go,
+    rather than every data return being kept to pd.concat at the end, which needs twice the memory.
+    Either way the DataFrame of people is the same.
+    """
+    if merge_into_columnar_store is None:
+        merge_into_columnar_store = MERGE_DATA_RETURNS_INTO_COLUMNAR_STORE
+
+    columnar_data_return_store = ColumnarDataReturnStore()
     data_return_dfs: list[pd.DataFrame] = []
     load_file_errors: list[dict] = []
+    ingest_telemetry_by_file: list[DataReturnIngestTelemetry] = []
+    peak_memory_at_start = get_peak_memory_of_this_process_in_bytes()
 
-    for file_path in data_return_file_paths:
-        try:
-            df_questionnaire_in_la_by_person = load_one_data_return(file_path)
-            data_return_dfs.append(df_questionnaire_in_la_by_person)
-        except Exception as err:
+    for file_path, result in zip(data_return_file_paths, results):
+        df_questionnaire_in_la_by_person, error_message, ingest_telemetry = result
+        # So that only the store holds on to the data return's people
+        del result
+
+        ingest_telemetry_by_file.append(ingest_telemetry)
+        if error_message is not None:
             logging.error(f"Error loading {file_path}")
-            logging.error(err)
-            load_file_errors.append({"file_path": file_path, "error_message": str(err)})
+            logging.error(error_message)
+            load_file_errors.append(
+                {"file_path": file_path, "error_message": error_message}
+            )
+        elif merge_into_columnar_store:
+            columnar_data_return_store.append(df_questionnaire_in_la_by_person)
+        else:
+            data_return_dfs.append(df_questionnaire_in_la_by_person)
+        del df_questionnaire_in_la_by_person
 
-    df_questionnaire_by_person = pd.concat(data_return_dfs, axis=0, ignore_index=True)
-    df_by_loading_error = (
-        pd.DataFrame(load_file_errors)
-        if load_file_errors
-        else pd.DataFrame([["No errors while loading files!"]])
-    )
+    if merge_into_columnar_store:
+        df_questionnaire_by_person = columnar_data_return_store.pop_df()
+    else:
+        df_questionnaire_by_person = (
+            pd.concat(data_return_dfs, axis=0, ignore_index=True)
+            if data_return_dfs
+            else pd.DataFrame()
+        )
+        del data_return_dfs
+    df_by_loading_error = get_loading_error_df(load_file_errors)
 
-    loaded_data_returns = LoadedDataReturns(
+    log_peak_memory_rise_while_combining_data_returns(peak_memory_at_start)
+
+    return LoadedDataReturns(
         df_questionnaire_unclean_by_person=df_questionnaire_by_person,
         df_loading_error_by_file=df_by_loading_error,
+        df_ingest_telemetry_by_file=get_ingest_telemetry_df(
+            data_return_file_paths, ingest_telemetry_by_file
+        ),
     )
 
-    save_data_return_checkpoint(
-        loaded_data_returns, Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR),
-    )
-    logging.info("Checkpoint saved!")
 
-    return loaded_data_returns
+def log_peak_memory_rise_while_combining_data_returns(
+    peak_memory_at_start: int,
+) -> None:
+    """
+    For comparing how much memory the two ways of combining the data returns need
+    (set MERGE_DATA_RETURNS_INTO_COLUMNAR_STORE in data_return_config.py)
+    """
+    peak_memory_rise_in_megabytes = (
+        get_peak_memory_of_this_process_in_bytes() - peak_memory_at_start
+    ) / 1024 ** 2
+    logging.info(
+        f"Loading and combining the data returns raised the peak memory of this process by {peak_memory_rise_in_megabytes:.0f} MB"
+    )
 
 
 def get_all_data_return_file_paths(directory: str):
+    """
+    The directory can also be a zip archive of data returns, which are then read without being extracted.
+    """
     directory: Path = Path(directory)
 
+    if is_zip_archive(directory):
+        return [
+            get_zip_member_path(directory.resolve(), file_name)
+            for file_name in sorted(get_file_names_in_zip_archive(directory))
+            if is_data_return_file_name(Path(file_name).name)
+        ]
+
     data_return_file_paths = [
         str((directory / file_path).resolve())
-        for file_path in os.listdir(directory)
-        if file_path.endswith(".xlsx") and not file_path.startswith("~$")
+        for file_path in sorted(os.listdir(directory))
+        if is_data_return_file_name(file_path)
     ]
 
     return data_return_file_paths
 
 
+def is_data_return_file_name(file_name: str) -> bool:
+    # Files starting ~$ are the lock files excel makes while a workbook is open
+    return file_name.endswith(DATA_RETURN_FILE_EXTENSIONS) and not file_name.startswith(
+        "~$"
+    )
+
+
+def try_to_load_data_returns_using_parse_cache(
+    data_return_file_paths: list[str],
+    number_of_processes: int,
+    parse_cache_directory: Path,
+) -> Iterator[DataReturnLoadingResult]:
+    """
+    The same as try_to_load_data_returns, except that a data return which has already been loaded
+    (with the same contents and the same params.DATA_RETURN) is taken from the parse cache instead of being read again.
+    Only new or changed data returns are read, and are then added to the cache.
+
+    A file with exactly the same contents as an earlier file is returned as an error,
+    as it means the same data return has been submitted twice (under a different name or LA).
+
+    Each result is yielded as soon as it is ready (in the same order as the file paths),
+    so the data returns don't all have to be held in memory at once.
+    """
+    data_return_params_hash = get_data_return_params_hash()
+
+    error_message_by_duplicate_file_path: dict[str, str] = {}
+    first_file_path_by_file_content_hash: dict[str, str] = {}
+    # None when the file couldn't be read to find its hash
+    parse_cache_file_path_by_file_path: dict[str, Optional[Path]] = {}
+
+    for file_path in data_return_file_paths:
+        try:
+            file_content_hash = get_file_content_hash(file_path)
+        except OSError:
+            # Reading the data return will give the error message
+            parse_cache_file_path_by_file_path[file_path] = None
+            continue
+
+        if file_content_hash in first_file_path_by_file_content_hash:
+            error_message_by_duplicate_file_path[file_path] = (
+                f"This file is identical to {first_file_path_by_file_content_hash[file_content_hash]}"
+                " - the same data return has been submitted more than once"
+            )
+            continue
+        first_file_path_by_file_content_hash[file_content_hash] = file_path
+
+        parse_cache_file_path_by_file_path[file_path] = get_parse_cache_file_path(
+            parse_cache_directory, file_content_hash, data_return_params_hash
+        )
+
+    file_paths_to_read = [
+        file_path
+        for file_path, parse_cache_file_path in parse_cache_file_path_by_file_path.items()
+        if parse_cache_file_path is None or not parse_cache_file_path.exists()
+    ]
+    logging.info(
+        f"{len(file_paths_to_read)} new or changed data returns to read, "
+        f"the rest are in the parse cache"
+    )
+
+    results_of_files_to_read = try_to_load_data_returns(
+        file_paths_to_read, number_of_processes
+    )
+    file_paths_to_read = set(file_paths_to_read)
+
+    for file_path in data_return_file_paths:
+        if file_path in error_message_by_duplicate_file_path:
+            yield (
+                None,
+                error_message_by_duplicate_file_path[file_path],
+                get_ingest_telemetry_of_data_return_not_loaded(file_path),
+            )
+            continue
+
+        parse_cache_file_path = parse_cache_file_path_by_file_path[file_path]
+        if file_path in file_paths_to_read:
+            result = next(results_of_files_to_read)
+        else:
+            result = try_to_load_data_return_from_parse_cache(
+                file_path, parse_cache_file_path
+            )
+            if result is None:
+                # The cached file couldn't be read after all
+                result = next(try_to_load_data_returns([file_path], 1))
+            else:
+                yield result
+                continue
+
+        df_questionnaire_in_la_by_person, error_message, _ = result
+        if error_message is None and parse_cache_file_path is not None:
+            save_to_parse_cache(df_questionnaire_in_la_by_person, parse_cache_file_path)
+        yield result
+
+
+def try_to_load_data_return_from_parse_cache(
+    file_path: str, parse_cache_file_path: Path
+) -> Optional[DataReturnLoadingResult]:
+    start_time = timeit.default_timer()
+
+    df_questionnaire_in_la_by_person = load_from_parse_cache(parse_cache_file_path)
+    if df_questionnaire_in_la_by_person is None:
+        return None
+
+    return (
+        df_questionnaire_in_la_by_person,
+        None,
+        DataReturnIngestTelemetry(
+            file_size_bytes=get_data_return_file_size(file_path),
+            from_parse_cache=True,
+            parse_seconds=timeit.default_timer() - start_time,
+            persons_kept=len(df_questionnaire_in_la_by_person),
+            columns=len(df_questionnaire_in_la_by_person.columns),
+        ),
+    )
+
+
+def try_to_load_data_returns(
+    data_return_file_paths: list[str], number_of_processes: int
+) -> Iterator[DataReturnLoadingResult]:
+    """
+    Gives (DataFrame, None, telemetry) for each file that loaded and (None, error message, telemetry) for each file that didn't.
+    The results come in the same order as the file paths, however many processes are used.
+    """
+    return (
+        get_data_return_loading_result(file_path, measured_data_return, error_message)
+        for file_path, (measured_data_return, error_message) in zip(
+            data_return_file_paths,
+            try_to_run_on_each_data_return(
+                try_to_load_and_measure_one_data_return,
+                data_return_file_paths,
+                number_of_processes,
+            ),
+        )
+    )
+
+
+def get_data_return_loading_result(
+    file_path: str,
+    measured_data_return: Optional[tuple[pd.DataFrame, DataReturnIngestTelemetry]],
+    error_message: Optional[str],
+) -> DataReturnLoadingResult:
+    if error_message is not None:
+        return (
+            None,
+            error_message,
+            get_ingest_telemetry_of_data_return_not_loaded(file_path),
+        )
+
+    df_questionnaire_in_la_by_person, ingest_telemetry = measured_data_return
+    return df_questionnaire_in_la_by_person, None, ingest_telemetry
+
+
+def try_to_run_on_each_data_return(
+    try_function: Callable[[str], tuple[Optional[T], Optional[str]]],
+    data_return_file_paths: list[str],
+    number_of_processes: int,
+) -> Iterator[tuple[Optional[T], Optional[str]]]:
+    """
+    Runs try_function (which returns (result, None) or (None, error message)) on every file,
+    across a pool of processes, giving the results in the same order as the file paths.
+
+    A few files for each process are given to the pool ahead of the one being waited for
+    (see DATA_RETURNS_IN_FLIGHT_PER_PROCESS), so they are being worked on while the caller is still busy with other things,
+    without the results the caller hasn't got to yet all being held in memory.
+    """
+    if number_of_processes == 1 or len(data_return_file_paths) <= 1:
+        return map(try_function, data_return_file_paths)
+
+    return get_results_in_order(
+        try_function, data_return_file_paths, number_of_processes
+    )
+
+
+def get_results_in_order(
+    try_function: Callable[[str], tuple[Optional[T], Optional[str]]],
+    data_return_file_paths: list[str],
+    number_of_processes: int,
+) -> Iterator[tuple[Optional[T], Optional[str]]]:
+    """
+    When a worker process dies (e.g. it ran out of memory) the whole pool breaks,
+    and every file the pool hadn't finished fails, not just the one that killed its worker.
+    So the file being waited for is tried again in a process of its own, which only fails if that file was the one,
+    and the files after it are given to a new pool.
+
+    The pool is shut down (and the files it hasn't started cancelled)
+    even if the caller stops before getting every result.
+    """
+    number_of_futures_in_flight = (
+        number_of_processes * DATA_RETURNS_IN_FLIGHT_PER_PROCESS
+    )
+    process_pool = get_process_pool_with_current_params(number_of_processes)
+    futures: deque[Future] = deque()
+    try:
+        for file_path_number, file_path in enumerate(data_return_file_paths):
+            first_file_path_number_to_submit = file_path_number + len(futures)
+            last_file_path_number_to_submit = (
+                file_path_number + number_of_futures_in_flight
+            )
+            for file_path_to_submit in data_return_file_paths[
+                first_file_path_number_to_submit:last_file_path_number_to_submit
+            ]:
+                futures.append(process_pool.submit(try_function, file_path_to_submit))
+
+            # Taken out of the queue so the result can be freed once it has been used
+            future = futures.popleft()
+            logging.info(file_path)
+            try:
+                yield future.result()
+            except BrokenProcessPool:
+                process_pool.shutdown(cancel_futures=True)
+                yield try_to_run_in_a_process_of_its_own(try_function, file_path)
+                process_pool = get_process_pool_with_current_params(number_of_processes)
+                file_paths_not_finished = data_return_file_paths[file_path_number + 1:]
+                futures = resubmit_files_not_finished(
+                    try_function, process_pool, futures, file_paths_not_finished,
+                )
+            except Exception as err:
+                yield None, str(err)
+    finally:
+        process_pool.shutdown(cancel_futures=True)
+
+
+def try_to_run_in_a_process_of_its_own(
+    try_function: Callable[[str], tuple[Optional[T], Optional[str]]], file_path: str,
+) -> tuple[Optional[T], Optional[str]]:
+    with get_process_pool_with_current_params(1) as process_pool:
+        try:
+            return process_pool.submit(try_function, file_path).result()
+        except Exception as err:
+            # Only happens when the worker process itself dies
+            return None, str(err)
+
+
+def resubmit_files_not_finished(
+    try_function: Callable[[str], tuple[Optional[T], Optional[str]]],
+    process_pool: ProcessPoolExecutor,
+    futures: deque[Future],
+    file_paths: list[str],
+) -> deque[Future]:
+    """
+    The files which were finished before the old pool broke keep their results
+    """
+    return deque(
+        future
+        if future.done() and not isinstance(future.exception(), BrokenProcessPool)
+        else process_pool.submit(try_function, file_path)
+        for future, file_path in zip(futures, file_paths)
+    )
+
+
+def try_to_load_and_measure_one_data_return(
+    file_path: str,
+) -> tuple[Optional[tuple[pd.DataFrame, DataReturnIngestTelemetry]], Optional[str]]:
+    """
+    Any problem with the file is returned as an error message rather than raised.
+    That way one broken data return can't stop the others from loading.
+    """
+    try:
+        return load_and_measure_one_data_return(file_path), None
+    except Exception as err:
+        return None, str(err)
+
+
+def load_and_measure_one_data_return(
+    file_path: str,
+) -> tuple[pd.DataFrame, DataReturnIngestTelemetry]:
+    peak_memory_at_start = get_peak_memory_of_this_process_in_bytes()
+    start_time = timeit.default_timer()
+
+    (
+        df_questionnaire_in_la_by_person,
+        number_of_rows_read,
+    ) = load_one_data_return_and_count_rows_read(file_path)
+
+    return (
+        df_questionnaire_in_la_by_person,
+        DataReturnIngestTelemetry(
+            file_size_bytes=get_data_return_file_size(file_path),
+            from_parse_cache=False,
+            parse_seconds=timeit.default_timer() - start_time,
+            rows_read=number_of_rows_read,
+            persons_kept=len(df_questionnaire_in_la_by_person),
+            columns=len(df_questionnaire_in_la_by_person.columns),
+            peak_memory_delta_bytes=get_peak_memory_of_this_process_in_bytes()
+            - peak_memory_at_start,
+        ),
+    )
+
+
+def get_ingest_telemetry_of_data_return_not_loaded(
+    file_path: str,
+) -> DataReturnIngestTelemetry:
+    try:
+        file_size_bytes = get_data_return_file_size(file_path)
+    except OSError:
+        file_size_bytes = None
+
+    return DataReturnIngestTelemetry(
+        file_size_bytes=file_size_bytes, from_parse_cache=False
+    )
+
+
 def load_one_data_return(file_path: str) -> pd.DataFrame:
+    return load_one_data_return_and_count_rows_read(file_path)[0]
+
+
+def load_one_data_return_and_count_rows_read(
+    file_path: str,
+) -> tuple[pd.DataFrame, int]:
+    """
+    The number of rows read includes the blank rows, which is what makes some data returns slow to load
+    """
+    if is_columnar_data_return(file_path):
+        return load_one_columnar_data_return_and_count_rows_read(file_path)
+    return load_one_excel_data_return_and_count_rows_read(file_path)
+
+
+def load_one_excel_data_return_and_count_rows_read(
+    file_path: str,
+) -> tuple[pd.DataFrame, int]:
     logging.info(file_path)
 
-    with warnings.catch_warnings():
-        warnings.simplefilter("ignore")
-        wb = load_workbook(file_path, data_only=True, read_only=True)
+    with open_data_return_file(file_path) as file, XlsxReader(file) as xlsx_reader:
+        check_workbook_has_needed_worksheets(xlsx_reader)
+
+        la_code = get_la_code_from_xlsx(xlsx_reader)
+
+        df_questionnaire_in_la_by_person = get_service_user_data_from_xlsx(
+            xlsx_reader, la_code
+        )
+
+    return (
+        df_questionnaire_in_la_by_person,
+        xlsx_reader.number_of_rows_read_by_sheet_name.get(
+            SERVICE_USER_DATA_SHEET_NAME, 0
+        ),
+    )
 
-    check_workbook_has_needed_worksheets(wb)
 
-    la_code = wb[SIGN_OFF_SHEET_NAME][LA_CODE_CELL_REF].value
+def get_la_code_from_xlsx(xlsx_reader: XlsxReader) -> str:
+    la_code = xlsx_reader.get_cell_value(SIGN_OFF_SHEET_NAME, LA_CODE_CELL_REF)
     assert (
         la_code is not None and la_code != ""
     ), "LA Code (cell E2, sheet Sign Off Sheet) - likely the excel file has been damaged"
@@ -88,10 +562,12 @@ def load_one_data_return(file_path: str) -> pd.DataFrame:
         "select la name" not in str(la_code).lower()
     ), "LA not selected (cell E3, Sign Off Sheet)"
 
-    la_code = str(la_code)
-
-    df_questionnaire_in_la_by_person = get_service_user_data_from_workbook(wb, la_code)
+    return str(la_code)
 
-    wb.close()
 
-    return df_questionnaire_in_la_by_person
+def get_loading_error_df(load_file_errors: list[dict]) -> pd.DataFrame:
+    return (
+        pd.DataFrame(load_file_errors)
+        if load_file_errors
+        else pd.DataFrame([["No errors while loading files!"]])
+    )
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Optional, Union
+
+import pandas as pd
+
+from .zip_archive import open_data_return_file
+from ..checkpoint.checkpoint_config import (
+    CHECKPOINTS_DIRECTORY,
+    PARSE_CACHE_DIRECTORY_NAME,
+)
+from ascs import params
+
+
+# Change this whenever the loader changes the DataFrame it makes from a data return,
+# so that DataFrames cached by an older version of the code aren't used
+PARSE_CACHE_VERSION = 3
+
+FILE_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_parse_cache_directory() -> Path:
+    return (
+        Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR)
+        / PARSE_CACHE_DIRECTORY_NAME
+    )
+
+
+def get_file_content_hash(file_path: Union[str, Path]) -> str:
+    file_hash = hashlib.sha256()
+    with open_data_return_file(file_path, random_access=False) as file:
+        for chunk in iter(lambda: file.read(FILE_HASH_CHUNK_SIZE), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def get_data_return_params_hash() -> str:
+    """
+    The DataFrame made from a data return depends on params.DATA_RETURN (which columns are kept and what they are called),
+    so a cached DataFrame is only reused while params.DATA_RETURN is the same.
+    """
+    data_return_params_json = json.dumps(
+        {
+            "PARSE_CACHE_VERSION": PARSE_CACHE_VERSION,
+            "DATA_RETURN": vars(params.DATA_RETURN),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(data_return_params_json.encode()).hexdigest()
+
+
+def get_parse_cache_file_path(
+    parse_cache_directory: Path, file_content_hash: str, data_return_params_hash: str
+) -> Path:
+    return (
+        parse_cache_directory
+        / f"{file_content_hash[:32]}_{data_return_params_hash[:16]}.pkl"
+    )
+
+
+def load_from_parse_cache(parse_cache_file_path: Path) -> Optional[pd.DataFrame]:
+    """
+    Returns None if the data return hasn't been cached (or the cached file can't be read)
+    """
+    if not parse_cache_file_path.exists():
+        return None
+
+    try:
+        return pd.read_pickle(parse_cache_file_path)
+    except Exception as err:
+        logging.warning(f"Ignoring unreadable parse cache file {parse_cache_file_path}")
+        logging.warning(str(err))
+        return None
+
+
+def save_to_parse_cache(
+    df_questionnaire_in_la_by_person: pd.DataFrame, parse_cache_file_path: Path
+) -> None:
+    """
+    Written to a temporary file then renamed,
+    so a run that is stopped part way through can't leave a half written file in the cache
+    """
+    parse_cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    temporary_file_path = parse_cache_file_path.with_suffix(".tmp")
+    df_questionnaire_in_la_by_person.to_pickle(temporary_file_path)
+    os.replace(temporary_file_path, parse_cache_file_path)
@@ -0,0 +1,104 @@
+import logging
+from typing import Optional
+
+import pandas as pd
+
+from .data_return_config import NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS
+from .load_columnar import (
+    LA_CODE_COLUMN_NAME,
+    is_columnar_data_return,
+    load_one_columnar_data_return,
+)
+from .load_excel import (
+    get_all_data_return_file_paths,
+    get_la_code_from_xlsx,
+    get_loading_error_df,
+    try_to_run_on_each_data_return,
+)
+from .service_user_data import (
+    check_service_user_data_column_names,
+    get_header_row_of_initial_expected_columns_as_np_array,
+)
+from .worksheets import (
+    SERVICE_USER_DATA_SHEET_NAME,
+    check_workbook_has_needed_worksheets,
+)
+from .xlsx_reader import XlsxReader
+from .zip_archive import open_data_return_file
+from ascs import params
+
+
+def pre_screen_all_data_returns(
+    directory: Optional[str] = None, number_of_processes: Optional[int] = None
+) -> pd.DataFrame:
+    """
+    Finds the data returns that won't load because of how they are laid out
+    (a missing sheet, no LA code in the Sign Off Sheet, or columns that are missing or in the wrong order)
+    without reading any of the people in them, so it takes seconds rather than the whole loading time.
+
+    Returns a DataFrame in the same format as df_loading_error_by_file.
+    A data return that passes can still fail to load (e.g. because of a problem in one of the rows).
+    """
+    if directory is None:
+        directory = params.DATA_RETURNS_DIRECTORY
+    if number_of_processes is None:
+        number_of_processes = NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS
+
+    data_return_file_paths = get_all_data_return_file_paths(directory)
+
+    pre_screen_errors: list[dict] = []
+
+    for file_path, (_, error_message) in zip(
+        data_return_file_paths,
+        try_to_run_on_each_data_return(
+            try_to_pre_screen_one_data_return,
+            data_return_file_paths,
+            number_of_processes,
+        ),
+    ):
+        if error_message is not None:
+            logging.error(f"Error pre-screening {file_path}")
+            logging.error(error_message)
+            pre_screen_errors.append(
+                {"file_path": file_path, "error_message": error_message}
+            )
+
+    logging.info(
+        f"Pre-screened {len(data_return_file_paths)} data returns, {len(pre_screen_errors)} had problems"
+    )
+
+    return get_loading_error_df(pre_screen_errors)
+
+
+def try_to_pre_screen_one_data_return(
+    file_path: str,
+) -> tuple[Optional[str], Optional[str]]:
+    """
+    Returns (LA code, None) if the data return looks fine and (None, error message) if it doesn't
+    """
+    try:
+        return pre_screen_one_data_return(file_path), None
+    except Exception as err:
+        return None, str(err)
+
+
+def pre_screen_one_data_return(file_path: str) -> str:
+    """
+    Does the same checks as load_one_data_return, apart from those on the people
+    """
+    if is_columnar_data_return(file_path):
+        # These are quick to load in full
+        return load_one_columnar_data_return(file_path)[LA_CODE_COLUMN_NAME].iloc[0]
+
+    with open_data_return_file(file_path) as file, XlsxReader(file) as xlsx_reader:
+        check_workbook_has_needed_worksheets(xlsx_reader)
+
+        la_code = get_la_code_from_xlsx(xlsx_reader)
+
+        check_service_user_data_column_names(
+            get_header_row_of_initial_expected_columns_as_np_array(
+                xlsx_reader, SERVICE_USER_DATA_SHEET_NAME
+            )
+        )
+
+    return la_code
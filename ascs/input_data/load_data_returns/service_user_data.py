@@ -3,16 +3,19 @@ import pandas as pd
 
 from openpyxl import Workbook
 
-from typing import Optional, Union
+from typing import Any, Optional, Union
 
 from ascs import params
 from ascs.input_data.load_data_returns.worksheets import SERVICE_USER_DATA_SHEET_NAME
+from ascs.input_data.load_data_returns.xlsx_reader import XlsxReader
 
 
 COLUMNS_TO_DROP_BECAUSE_WE_RECALCULATE_THEM_LATER = [
     "Stratum",
     "PopInStratum",
 ]
+# Every whole number up to this is exactly the same as a float32
+LARGEST_WHOLE_NUMBER_FLOAT32_HOLDS = 2 ** 24
 
 
 def get_service_user_data_from_workbook(
@@ -23,12 +26,32 @@ def get_service_user_data_from_workbook(
     )
     service_user_data_np = select_only_initial_expected_columns(service_user_data_np)
 
+    return get_service_user_data_from_np_array(service_user_data_np, la_code)
+
+
+def get_service_user_data_from_xlsx(
+    xlsx_reader: XlsxReader, la_code: Union[str, int]
+) -> pd.DataFrame:
+    """
+    The same as get_service_user_data_from_workbook, but streams the sheet
+    (a lot faster, and uses a lot less memory, than openpyxl)
+    """
+    service_user_data_np = get_person_rows_of_initial_expected_columns_as_np_array(
+        xlsx_reader, SERVICE_USER_DATA_SHEET_NAME
+    )
+
+    return get_service_user_data_from_np_array(service_user_data_np, la_code)
+
+
+def get_service_user_data_from_np_array(
+    service_user_data_np: np.ndarray, la_code: Union[str, int]
+) -> pd.DataFrame:
     check_service_user_data_column_names(service_user_data_np)
 
     df_service_user_data = (
         place_service_user_data_in_dataframe(service_user_data_np)
         .pipe(ignore_rows_where_there_isnt_a_person)
-        .infer_objects()
+        .pipe(set_column_types)
         .assign(LaCode=la_code)
         .pipe(set_primary_key)
         .drop(columns=COLUMNS_TO_DROP_BECAUSE_WE_RECALCULATE_THEM_LATER)
@@ -69,6 +92,77 @@ Rows with misalignment (where the first person is at row zero): {df_service_user
     return df_service_user_data[~method_collection_null_by_row]
 
 
+def set_column_types(
+    df_service_user_data: pd.DataFrame, string_column_names: Optional[list[str]] = None
+) -> pd.DataFrame:
+    """
+    The sheet is read as an object array, this gives each column its proper type straight away
+    (rather than later in the cleaning) so that the questionnaire takes up much less memory.
+    String columns become strings (None for blanks).
+    Numeric columns become compact numbers (see make_numbers_compact), with NaN for blanks.
+
+    A numeric column that has anything which isn't a number in it (like "n/a") is left as it is (as objects),
+    so the uncleaned questionnaire keeps what the council sent, and clean_types_in_all_columns finds
+    and reports the value that isn't a number with the same error as before.
+    The values that aren't numbers aren't recorded separately when the data return is read,
+    as they would then have to be carried through every checkpoint next to the questionnaire.
+    Only that data return's column is left as objects, the rest of the data returns' columns are still numbers.
+    """
+    if string_column_names is None:
+        string_column_names = params.DATA_RETURN.STRING_COLUMNS
+
+    return pd.DataFrame(
+        {
+            column_name: (
+                convert_to_strings(column)
+                if column_name in string_column_names
+                else convert_to_numbers_if_all_values_are_numbers(column)
+            )
+            for column_name, column in df_service_user_data.items()
+        },
+        index=df_service_user_data.index,
+    )
+
+
+def convert_to_strings(column: pd.Series) -> pd.Series:
+    is_blank_by_row = column.isna() | (column == "")
+    return column.astype(str).where(~is_blank_by_row, None)
+
+
+def convert_to_numbers_if_all_values_are_numbers(column: pd.Series) -> pd.Series:
+    is_blank_by_row = column.isna() | (column == "")
+    numbers = pd.to_numeric(column.where(~is_blank_by_row, np.nan), errors="coerce")
+
+    # pd.to_numeric would turn TRUE/FALSE cells into 1/0, but they aren't valid numbers
+    is_not_a_number_by_row = (numbers.isna() & ~is_blank_by_row) | (
+        column.apply(type) == bool
+    )
+
+    if is_not_a_number_by_row.any():
+        return column
+    return make_numbers_compact(numbers)
+
+
+def make_numbers_compact(numbers: pd.Series) -> pd.Series:
+    """
+    The answers are small whole numbers, so they are kept in the smallest type that holds them exactly:
+    the smallest integer type (like int8) for a column without blanks,
+    and float32 (with NaN for blanks) for a column of whole numbers with blanks.
+    Anything else (like a column with 2.5 in) stays as it is, so no value is ever changed.
+    The cleaning gives them back their usual types first (see widen_compact_numbers in type_conversions.py).
+    """
+    if pd.api.types.is_integer_dtype(numbers.dtype):
+        return pd.to_numeric(numbers, downcast="integer")
+
+    values = numbers.to_numpy()
+    values_that_arent_blank = values[~np.isnan(values)]
+    if np.all(values_that_arent_blank == np.round(values_that_arent_blank)) and np.all(
+        np.abs(values_that_arent_blank) <= LARGEST_WHOLE_NUMBER_FLOAT32_HOLDS
+    ):
+        return numbers.astype(np.float32)
+    return numbers
+
+
 def place_service_user_data_in_dataframe(
     service_user_data_np: np.ndarray,
 ) -> pd.DataFrame:
@@ -97,6 +191,71 @@ def get_worksheet_as_np_array_from_workbook(wb: Workbook, sheet_name: str) -> np
     return np.array(list(wb[sheet_name].values))
 
 
+def get_header_row_of_initial_expected_columns_as_np_array(
+    xlsx_reader: XlsxReader, sheet_name: str
+) -> np.ndarray:
+    """
+    The first row of the array from get_person_rows_of_initial_expected_columns_as_np_array,
+    without reading any of the people.
+    Enough for check_service_user_data_column_names.
+    """
+    number_of_columns_to_keep = len(
+        params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING
+    )
+    header_row_values = xlsx_reader.get_row_values(
+        sheet_name, 1, max_column=number_of_columns_to_keep
+    )
+    return np.array([header_row_values], dtype=object)
+
+
+def get_person_rows_of_initial_expected_columns_as_np_array(
+    xlsx_reader: XlsxReader, sheet_name: str
+) -> np.ndarray:
+    """
+    Gives the same array as get_worksheet_as_np_array_from_workbook then select_only_initial_expected_columns,
+    except the rows after the last person are never read into the array.
+    The last person is the last row where MethodCollection or Response has a value
+    (see ignore_rows_where_there_isnt_a_person).
+    """
+    new_column_names = list(
+        params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.values()
+    )
+    number_of_columns_to_keep = len(new_column_names)
+    person_column_indexes = [
+        new_column_names.index(column_name)
+        for column_name in ["MethodCollection", "Response"]
+        if column_name in new_column_names
+    ]
+
+    values_by_row_number: dict[int, list[Any]] = {}
+    number_of_rows_up_to_last_person = 1
+
+    for row_number, values in xlsx_reader.iter_rows(
+        sheet_name, max_column=number_of_columns_to_keep
+    ):
+        if all(value is None for value in values):
+            continue
+
+        values_by_row_number[row_number] = values
+
+        row_has_a_person = any(
+            values[column_index] is not None for column_index in person_column_indexes
+        )
+        if row_has_a_person:
+            number_of_rows_up_to_last_person = row_number
+
+    service_user_data_np = np.full(
+        (number_of_rows_up_to_last_person, number_of_columns_to_keep),
+        None,
+        dtype=object,
+    )
+    for row_number, values in values_by_row_number.items():
+        if row_number <= number_of_rows_up_to_last_person:
+            service_user_data_np[row_number - 1] = values
+
+    return service_user_data_np
+
+
 def check_service_user_data_column_names(
     service_user_data_np: np.ndarray,
     expected_column_substrings: Optional[list[str]] = None,
@@ -0,0 +1,150 @@
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from .data_return_config import (
+    NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS,
+    WATCH_FOLDER_POLL_INTERVAL_SECONDS,
+    LoadedDataReturns,
+)
+from .load_excel import (
+    combine_loaded_data_returns,
+    get_all_data_return_file_paths,
+    try_to_load_data_returns_using_parse_cache,
+)
+from .parse_cache import get_parse_cache_directory
+from .zip_archive import split_zip_member_path
+from ..checkpoint.checkpoint_config import (
+    CHECKPOINTS_DIRECTORY,
+    WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME,
+)
+from ..checkpoint.checkpoint_file_handler import save_data_return_checkpoint
+from ascs import params
+
+
+# (modified time in nanoseconds, size in bytes)
+FileSignature = tuple[int, int]
+
+
+class DataReturnsFolderWatcher:
+    """
+    While the data returns are arriving, keeps a checkpoint of them up to date,
+    so that when the last one arrives the publication can be run from the checkpoint straight away.
+
+    The folder is polled, a data return counts as new or changed when its modified time or size changes.
+    The data returns are loaded in the same way as load_all_data_returns_from_excel,
+    and the parse cache means only the new or changed ones are actually read.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        checkpoint_directory: Optional[Path] = None,
+        parse_cache_directory: Optional[Path] = None,
+        number_of_processes: Optional[int] = None,
+    ):
+        if directory is None:
+            directory = params.DATA_RETURNS_DIRECTORY
+        if checkpoint_directory is None:
+            checkpoint_directory = Path(CHECKPOINTS_DIRECTORY + params.PUBLICATION_YEAR)
+        if parse_cache_directory is None:
+            parse_cache_directory = get_parse_cache_directory()
+        if number_of_processes is None:
+            number_of_processes = NUMBER_OF_PROCESSES_FOR_LOADING_DATA_RETURNS
+
+        self.directory = directory
+        self.checkpoint_directory = checkpoint_directory
+        self.parse_cache_directory = parse_cache_directory
+        self.number_of_processes = number_of_processes
+
+        self.loaded_data_returns: Optional[LoadedDataReturns] = None
+        self.signature_by_file_path_at_last_poll: dict[str, FileSignature] = {}
+        self.signature_by_file_path_loaded: Optional[dict[str, FileSignature]] = None
+
+    def run(
+        self,
+        poll_interval_seconds: float = WATCH_FOLDER_POLL_INTERVAL_SECONDS,
+        number_of_polls: Optional[int] = None,
+    ) -> None:
+        """
+        Polls forever, unless number_of_polls is given
+        """
+        logging.info(f"Watching {self.directory} for new or changed data returns")
+
+        polls_done = 0
+        while number_of_polls is None or polls_done < number_of_polls:
+            if polls_done > 0:
+                time.sleep(poll_interval_seconds)
+            self.poll()
+            polls_done += 1
+
+    def poll(self) -> bool:
+        """
+        Looks at the folder once.
+        If data returns have been added, changed or removed since the checkpoint was last saved,
+        they are loaded and the checkpoint is saved again. Returns whether it was.
+
+        Nothing is loaded while any data return is still changing (e.g. it is still being copied into the folder),
+        that is, until every file is the same as it was at the last poll.
+        """
+        signature_by_file_path = get_file_signature_by_file_path(self.directory)
+
+        file_paths_still_changing = [
+            file_path
+            for file_path, signature in signature_by_file_path.items()
+            if self.signature_by_file_path_at_last_poll.get(file_path) != signature
+        ]
+        self.signature_by_file_path_at_last_poll = signature_by_file_path
+
+        if file_paths_still_changing:
+            logging.info(
+                f"Waiting for {len(file_paths_still_changing)} new or changed data returns to stop changing"
+            )
+            return False
+
+        nothing_has_changed_since_last_saved = (
+            signature_by_file_path == self.signature_by_file_path_loaded
+        )
+        if nothing_has_changed_since_last_saved or not signature_by_file_path:
+            return False
+
+        self.load_and_save_data_returns(list(signature_by_file_path.keys()))
+        self.signature_by_file_path_loaded = signature_by_file_path
+        return True
+
+    def load_and_save_data_returns(self, data_return_file_paths: list[str]) -> None:
+        self.loaded_data_returns = combine_loaded_data_returns(
+            data_return_file_paths,
+            try_to_load_data_returns_using_parse_cache(
+                data_return_file_paths,
+                self.number_of_processes,
+                self.parse_cache_directory,
+            ),
+        )
+
+        save_data_return_checkpoint(
+            self.loaded_data_returns,
+            self.checkpoint_directory,
+            checkpoint_filename=WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME,
+        )
+        logging.info(
+            f"Checkpoint {WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME} saved with {len(data_return_file_paths)} data returns"
+        )
+
+
+def get_file_signature_by_file_path(directory: str) -> dict[str, FileSignature]:
+    signature_by_file_path = {}
+
+    for file_path in get_all_data_return_file_paths(directory):
+        zip_member = split_zip_member_path(file_path)
+        try:
+            # A data return in a zip archive changes when the archive does
+            file_stat = os.stat(file_path if zip_member is None else zip_member[0])
+        except FileNotFoundError:
+            # Deleted since the folder was listed
+            continue
+        signature_by_file_path[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+
+    return signature_by_file_path
@@ -1,5 +1,8 @@
+from typing import Union
 from openpyxl import Workbook
 
+from .xlsx_reader import XlsxReader
+
 
 SERVICE_USER_DATA_SHEET_NAME = "Service User Data"
 SIGN_OFF_SHEET_NAME = "Sign Off Sheet"
@@ -7,8 +10,8 @@ SIGN_OFF_SHEET_NAME = "Sign Off Sheet"
 ALL_SHEET_NAMES = [SERVICE_USER_DATA_SHEET_NAME, SIGN_OFF_SHEET_NAME]
 
 
-def check_workbook_has_needed_worksheets(wb: Workbook) -> None:
+def check_workbook_has_needed_worksheets(wb: Union[Workbook, XlsxReader]) -> None:
     for sheet_name in ALL_SHEET_NAMES:
         assert (
-            sheet_name in wb.get_sheet_names()
+            sheet_name in wb.sheetnames
         ), f"Expected worksheet called '{sheet_name}' but couldn't find it - did you change a sheet name?"
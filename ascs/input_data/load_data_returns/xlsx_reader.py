@@ -0,0 +1,396 @@
+import codecs
+import html
+import posixpath
+import re
+import zipfile
+
+from pathlib import Path
+from typing import IO, Any, Iterator, Match, Optional, Pattern, Union
+from xml.etree.ElementTree import iterparse
+
+
+MAIN_NAMESPACE = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+RELATIONSHIPS_NAMESPACE = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "{http://schemas.openxmlformats.org/package/2006/relationships}"
+)
+
+SHEET_TAG = MAIN_NAMESPACE + "sheet"
+SHARED_STRING_TAG = MAIN_NAMESPACE + "si"
+TEXT_TAG = MAIN_NAMESPACE + "t"
+RICH_TEXT_RUN_TAG = MAIN_NAMESPACE + "r"
+RELATIONSHIP_TAG = PACKAGE_RELATIONSHIPS_NAMESPACE + "Relationship"
+
+WORKBOOK_PATH = "xl/workbook.xml"
+WORKBOOK_RELATIONSHIPS_PATH = "xl/_rels/workbook.xml.rels"
+SHARED_STRINGS_PATH = "xl/sharedStrings.xml"
+
+SHEET_XML_CHUNK_SIZE = 1024 * 1024
+
+CELL_REFERENCE_REGEX = re.compile(r"^([A-Z]+)(\d+)$")
+
+# Some programs write the tags with a namespace prefix, like <x:row>, hence the (?:\w+:)?
+ROW_START_REGEX = re.compile(r"<(?:\w+:)?row\b([^>]*)>")
+ROW_END_REGEX = re.compile(r"</(?:\w+:)?row>")
+ROW_NUMBER_ATTRIBUTE_REGEX = re.compile(r'\br="(\d+)"')
+CELL_REGEX = re.compile(
+    r"<(?:\w+:)?c\b([^>]*?)(?:/>|>(.*?)</(?:\w+:)?c>)", flags=re.DOTALL
+)
+CELL_REFERENCE_ATTRIBUTE_REGEX = re.compile(r'\br="([A-Z]+)\d*"')
+CELL_TYPE_ATTRIBUTE_REGEX = re.compile(r'\bt="(\w+)"')
+VALUE_START_REGEX = re.compile(r"<(?:\w+:)?(?:v|is)>")
+VALUE_REGEX = re.compile(r"<(?:\w+:)?v>([^<]+)</(?:\w+:)?v>")
+INLINE_STRING_REGEX = re.compile(r"<(?:\w+:)?is>(.*?)</(?:\w+:)?is>", flags=re.DOTALL)
+PHONETIC_RUN_REGEX = re.compile(r"<(?:\w+:)?rPh\b.*?</(?:\w+:)?rPh>", flags=re.DOTALL)
+TEXT_REGEX = re.compile(r"<(?:\w+:)?t\b[^>/]*>([^<]*)</(?:\w+:)?t>")
+
+
+class XlsxReader:
+    """
+    A minimal reader for the values in an xlsx file.
+
+    openpyxl creates a Python object for every cell in a sheet, including the thousands of
+    blank (but formatted) rows at the bottom of a data return template.
+    This reader instead streams the sheet's XML straight out of the xlsx zip,
+    and only keeps the values from the columns that are asked for.
+
+    It reads the cached value of formula cells (like openpyxl's data_only=True).
+    Dates are returned as the number Excel stores them as, there aren't any in the data returns.
+    """
+
+    def __init__(self, file: Union[str, Path, IO[bytes]]):
+        self.zip_file = zipfile.ZipFile(file)
+        self.sheet_xml_path_by_sheet_name = get_sheet_xml_path_by_sheet_name(
+            self.zip_file
+        )
+        self.sheetnames = list(self.sheet_xml_path_by_sheet_name.keys())
+        self._shared_strings: Optional[list[str]] = None
+        self._column_index_by_column_letters: dict[str, int] = {}
+        # Including the rows with only formatting in, as these take time to read too
+        self.number_of_rows_read_by_sheet_name: dict[str, int] = {}
+
+    def __enter__(self) -> "XlsxReader":
+        return self
+
+    def __exit__(self, *exception_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.zip_file.close()
+
+    @property
+    def shared_strings(self) -> list[str]:
+        """
+        Read once, the first time a sheet needs them
+        """
+        if self._shared_strings is None:
+            self._shared_strings = read_shared_strings(self.zip_file)
+        return self._shared_strings
+
+    def iter_rows(
+        self, sheet_name: str, max_column: int
+    ) -> Iterator[tuple[int, list[Any]]]:
+        """
+        Yields (row number, values) for every row in the sheet's XML, starting from row number 1.
+        Values is a list of length max_column, with None for blank cells.
+        Rows which aren't in the XML (because they were never used) are skipped,
+        use the row number to place the rows.
+
+        Building an XML tree of every cell is what makes openpyxl slow,
+        so the rows are found with regular expressions instead, and only the start of each row
+        (up to the first cell at or past max_column) is looked at.
+        """
+        first_unneeded_cell_regex = get_regex_matching_cells_from_column_index(
+            max_column
+        )
+        previous_row_number = 0
+
+        for row_xml in self._iter_row_xml(sheet_name):
+            # A piece can start with empty self-closing rows like <row r="2"/>, which are yielded as blank,
+            # before the start of the row that the closing </row> belongs to
+            row_start_match = None
+            for row_start_match in ROW_START_REGEX.finditer(row_xml):
+                row_number = self._get_row_number(
+                    sheet_name, row_start_match, previous_row_number
+                )
+                previous_row_number = row_number
+                if row_start_match.group(1).endswith("/"):
+                    yield row_number, [None] * max_column
+            if row_start_match is None or row_start_match.group(1).endswith("/"):
+                continue
+
+            cells_start = row_start_match.end()
+            first_unneeded_cell_match = first_unneeded_cell_regex.search(
+                row_xml, cells_start
+            )
+            cells_end = (
+                first_unneeded_cell_match.start()
+                if first_unneeded_cell_match is not None
+                else len(row_xml)
+            )
+
+            yield row_number, self._get_row_values(
+                row_xml, cells_start, cells_end, max_column
+            )
+
+    def _get_row_number(
+        self, sheet_name: str, row_start_match: Match, previous_row_number: int
+    ) -> int:
+        """
+        Rows without an r attribute are numbered on from the row before, and each row is counted as read
+        """
+        self.number_of_rows_read_by_sheet_name[sheet_name] = (
+            self.number_of_rows_read_by_sheet_name.get(sheet_name, 0) + 1
+        )
+        row_number_match = ROW_NUMBER_ATTRIBUTE_REGEX.search(row_start_match.group(1))
+        if row_number_match is None:
+            return previous_row_number + 1
+        return int(row_number_match.group(1))
+
+    def get_cell_value(self, sheet_name: str, cell_reference: str) -> Any:
+        column_letters, row_number = CELL_REFERENCE_REGEX.match(cell_reference).groups()
+        column_index = convert_column_letters_to_index(column_letters)
+
+        return self.get_row_values(
+            sheet_name, int(row_number), max_column=column_index + 1
+        )[column_index]
+
+    def get_row_values(
+        self, sheet_name: str, row_number: int, max_column: int
+    ) -> list[Any]:
+        """
+        Only reads the sheet as far as the row, so the rows near the top of a sheet are quick to get
+        """
+        for current_row_number, values in self.iter_rows(
+            sheet_name, max_column=max_column
+        ):
+            if current_row_number == row_number:
+                return values
+            if current_row_number > row_number:
+                break
+
+        return [None] * max_column
+
+    def _get_sheet_xml_path(self, sheet_name: str) -> str:
+        if sheet_name not in self.sheet_xml_path_by_sheet_name:
+            raise KeyError(f"Worksheet {sheet_name} does not exist.")
+        return self.sheet_xml_path_by_sheet_name[sheet_name]
+
+    def _iter_row_xml(self, sheet_name: str) -> Iterator[str]:
+        """
+        Yields the XML of the sheet one row at a time, decompressing it in chunks
+        so the whole sheet is never in memory.
+        Each piece is everything up to a closing </row>, so also includes whatever came before the row
+        (the sheet's header, or empty self-closing rows), which is why every row start in it is looked at.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        unfinished_row_xml = ""
+
+        with self.zip_file.open(self._get_sheet_xml_path(sheet_name)) as sheet_xml:
+            while True:
+                chunk = sheet_xml.read(SHEET_XML_CHUNK_SIZE)
+                row_xmls = ROW_END_REGEX.split(
+                    unfinished_row_xml + decoder.decode(chunk, final=not chunk)
+                )
+                unfinished_row_xml = row_xmls.pop()
+                yield from row_xmls
+
+                if not chunk:
+                    break
+
+    def _get_row_values(
+        self, row_xml: str, cells_start: int, cells_end: int, max_column: int
+    ) -> list[Any]:
+        values = [None] * max_column
+
+        if VALUE_START_REGEX.search(row_xml, cells_start, cells_end) is None:
+            # Nearly all the rows in a data return are blank (apart from formatting)
+            return values
+
+        column_index = -1
+        for cell_match in CELL_REGEX.finditer(row_xml, cells_start, cells_end):
+            cell_attributes, cell_contents = cell_match.groups()
+
+            cell_reference_match = CELL_REFERENCE_ATTRIBUTE_REGEX.search(
+                cell_attributes
+            )
+            if cell_reference_match is None:
+                column_index += 1
+            else:
+                column_letters = cell_reference_match.group(1)
+                if column_letters not in self._column_index_by_column_letters:
+                    self._column_index_by_column_letters[
+                        column_letters
+                    ] = convert_column_letters_to_index(column_letters)
+                column_index = self._column_index_by_column_letters[column_letters]
+
+            if column_index >= max_column:
+                break
+
+            if cell_contents:
+                values[column_index] = self._get_cell_value_from_xml(
+                    cell_attributes, cell_contents
+                )
+
+        return values
+
+    def _get_cell_value_from_xml(self, cell_attributes: str, cell_contents: str) -> Any:
+        cell_type_match = CELL_TYPE_ATTRIBUTE_REGEX.search(cell_attributes)
+        cell_type = cell_type_match.group(1) if cell_type_match is not None else "n"
+
+        if cell_type == "inlineStr":
+            inline_string_match = INLINE_STRING_REGEX.search(cell_contents)
+            if inline_string_match is None:
+                return None
+            return get_text_from_string_item_xml(inline_string_match.group(1))
+
+        value_match = VALUE_REGEX.search(cell_contents)
+        if value_match is None:
+            return None
+
+        return convert_cell_text_to_value(
+            unescape_xml_text(value_match.group(1)), cell_type, self.shared_strings
+        )
+
+
+def convert_cell_text_to_value(
+    text: str, cell_type: str, shared_strings: list[str]
+) -> Any:
+    """
+    Converts the text of a cell's <v> element to a value in the same way as openpyxl
+    """
+    if cell_type == "n":
+        if "." in text or "E" in text or "e" in text:
+            return float(text)
+        return int(text)
+    if cell_type == "s":
+        return shared_strings[int(text)]
+    if cell_type == "b":
+        return bool(int(text))
+    # "str" (the result of a formula), "e" (an error like #N/A) and "d" (an ISO date) are kept as text
+    return text
+
+
+def get_regex_matching_cells_from_column_index(column_index: int) -> Pattern:
+    """
+    Matches the start of any cell whose column is at or after column_index,
+    e.g. for column_index 28 ("AC"): <c r="AC..., <c r="AZ..., <c r="BA..., <c r="AAA...
+    """
+    column_letters = convert_column_index_to_letters(column_index)
+
+    # Column letters of the same length are ordered alphabetically
+    same_length_alternatives = [column_letters]
+    for letter_position, letter in enumerate(column_letters):
+        if letter != "Z":
+            same_length_alternatives.append(
+                column_letters[:letter_position]
+                + f"[{chr(ord(letter) + 1)}-Z]"
+                + "[A-Z]" * (len(column_letters) - letter_position - 1)
+            )
+    longer_alternative = f"[A-Z]{{{len(column_letters) + 1},}}"
+
+    column_letters_pattern = "|".join(same_length_alternatives + [longer_alternative])
+    return re.compile(rf'<(?:\w+:)?c\b[^>]*?\br="(?:{column_letters_pattern})\d')
+
+
+def convert_column_index_to_letters(column_index: int) -> str:
+    """
+    0 -> "A", 25 -> "Z", 26 -> "AA"
+    """
+    column_letters = ""
+    column_number = column_index + 1
+    while column_number > 0:
+        column_number, remainder = divmod(column_number - 1, 26)
+        column_letters = chr(ord("A") + remainder) + column_letters
+    return column_letters
+
+
+def convert_column_letters_to_index(column_letters: str) -> int:
+    """
+    "A" -> 0, "Z" -> 25, "AA" -> 26
+    """
+    column_number = 0
+    for letter in column_letters:
+        column_number = column_number * 26 + (ord(letter) - ord("A") + 1)
+    return column_number - 1
+
+
+def get_sheet_xml_path_by_sheet_name(zip_file: zipfile.ZipFile) -> dict[str, str]:
+    with zip_file.open(WORKBOOK_RELATIONSHIPS_PATH) as relationships_xml:
+        target_by_relationship_id = {
+            element.get("Id"): element.get("Target")
+            for _, element in iterparse(relationships_xml)
+            if element.tag == RELATIONSHIP_TAG
+        }
+
+    with zip_file.open(WORKBOOK_PATH) as workbook_xml:
+        relationship_id_by_sheet_name = {
+            element.get("name"): element.get(RELATIONSHIPS_NAMESPACE + "id")
+            for _, element in iterparse(workbook_xml)
+            if element.tag == SHEET_TAG
+        }
+
+    return {
+        sheet_name: get_path_in_zip_from_workbook_target(
+            target_by_relationship_id[relationship_id]
+        )
+        for sheet_name, relationship_id in relationship_id_by_sheet_name.items()
+    }
+
+
+def get_path_in_zip_from_workbook_target(target: str) -> str:
+    """
+    Targets are either relative to the xl folder ("worksheets/sheet1.xml") or absolute ("/xl/worksheets/sheet1.xml")
+    """
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(posixpath.join("xl", target))
+
+
+def read_shared_strings(zip_file: zipfile.ZipFile) -> list[str]:
+    if SHARED_STRINGS_PATH not in zip_file.namelist():
+        return []
+
+    shared_strings = []
+    with zip_file.open(SHARED_STRINGS_PATH) as shared_strings_xml:
+        for _, element in iterparse(shared_strings_xml):
+            if element.tag == SHARED_STRING_TAG:
+                shared_strings.append(get_text_from_string_item_element(element))
+                element.clear()
+    return shared_strings
+
+
+def get_text_from_string_item_element(string_item_element) -> str:
+    """
+    A string is either plain text <t> or rich text made of runs <r><t>...</t></r>.
+    Phonetic hints <rPh> aren't part of the string so are skipped.
+    """
+    text = "".join(
+        text_element.text or ""
+        for child_element in string_item_element
+        if child_element.tag in (TEXT_TAG, RICH_TEXT_RUN_TAG)
+        for text_element in child_element.iter(TEXT_TAG)
+    )
+    return text.replace("x005F_", "")
+
+
+def get_text_from_string_item_xml(string_item_xml: str) -> str:
+    """
+    The same as get_text_from_string_item_element, for the XML of an inline string
+    """
+    string_item_xml = PHONETIC_RUN_REGEX.sub("", string_item_xml)
+    text = "".join(
+        unescape_xml_text(text) for text in TEXT_REGEX.findall(string_item_xml)
+    )
+    return text.replace("x005F_", "")
+
+
+def unescape_xml_text(text: str) -> str:
+    """
+    &amp; -> &, &lt; -> <, &#10; -> newline etc.
+    """
+    if "&" not in text:
+        return text
+    return html.unescape(text)
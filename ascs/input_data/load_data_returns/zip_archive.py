@@ -0,0 +1,94 @@
+import io
+import os
+import zipfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator, Optional, Union
+
+
+ZIP_ARCHIVE_FILE_EXTENSION = ".zip"
+
+# A data return inside a zip archive has the file path "<path of the archive>::<path inside the archive>"
+ZIP_MEMBER_PATH_SEPARATOR = "::"
+
+# Folders of files that macOS adds to the zip archives it makes, which aren't data returns
+MACOS_METADATA_FOLDER_NAME = "__MACOSX"
+
+
+def is_zip_archive(path: Union[str, Path]) -> bool:
+    return Path(path).suffix == ZIP_ARCHIVE_FILE_EXTENSION and Path(path).is_file()
+
+
+def get_zip_member_path(archive_path: Union[str, Path], member_name: str) -> str:
+    return f"{archive_path}{ZIP_MEMBER_PATH_SEPARATOR}{member_name}"
+
+
+def split_zip_member_path(file_path: Union[str, Path]) -> Optional[tuple[str, str]]:
+    """
+    Returns (path of the archive, path inside the archive) for a file in a zip archive,
+    and None for any other file
+    """
+    file_path = str(file_path)
+    if ZIP_MEMBER_PATH_SEPARATOR not in file_path:
+        return None
+
+    archive_path, member_name = file_path.split(ZIP_MEMBER_PATH_SEPARATOR, 1)
+    return archive_path, member_name
+
+
+def get_file_names_in_zip_archive(archive_path: Union[str, Path]) -> list[str]:
+    """
+    Every file in the archive, including those in folders (with the folders in the name, like "returns/a.xlsx")
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        return [
+            zip_info.filename
+            for zip_info in archive.infolist()
+            if not zip_info.is_dir()
+            and MACOS_METADATA_FOLDER_NAME not in zip_info.filename.split("/")
+        ]
+
+
+@contextmanager
+def open_data_return_file(
+    file_path: Union[str, Path], random_access: bool = True
+) -> Iterator[IO[bytes]]:
+    """
+    Opens a data return for reading, whether it is a file on disk or a file in a zip archive.
+
+    A file in an archive is never written to disk. When it is only going to be read from start to end
+    (random_access=False, like a CSV or when hashing the file) it is streamed out of the archive as it is read.
+    Otherwise (like an xlsx or Parquet file, which are read from their end first) it is read into memory,
+    as seeking backwards in a file in an archive decompresses it again from the start.
+    Every call opens the archive again, so this can be used from any number of processes at once.
+    """
+    zip_member = split_zip_member_path(file_path)
+
+    if zip_member is None:
+        with open(file_path, "rb") as file:
+            yield file
+        return
+
+    archive_path, member_name = zip_member
+    with zipfile.ZipFile(archive_path) as archive:
+        if not random_access:
+            with archive.open(member_name) as file:
+                yield file
+            return
+
+        file = io.BytesIO(archive.read(member_name))
+    yield file
+
+
+def get_data_return_file_size(file_path: Union[str, Path]) -> int:
+    """
+    In bytes, the uncompressed size for a file in a zip archive
+    """
+    zip_member = split_zip_member_path(file_path)
+
+    if zip_member is None:
+        return os.path.getsize(file_path)
+
+    archive_path, member_name = zip_member
+    with zipfile.ZipFile(archive_path) as archive:
+        return archive.getinfo(member_name).file_size
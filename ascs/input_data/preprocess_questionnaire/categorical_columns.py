@@ -0,0 +1,58 @@
+import pandas as pd
+
+from ascs import params
+
+
+LA_CODE_COLUMN_NAME = "LaCode"
+
+
+def get_categories_by_categorical_column() -> dict[str, list[str]]:
+    """
+    The LA codes and the grouped demographic columns (like Ethnicity_Grouped and Age_Grouped)
+    only ever hold a few different values, which are all in the params.
+    The LA codes are ints in the params but strings in the questionnaire.
+    """
+    return {
+        LA_CODE_COLUMN_NAME: [str(la_code) for la_code in params.ALL_LA_CODES],
+        **{
+            grouped_column_name: params.DEMOGRAPHIC_VALUES_BY_DEMOGRAPHIC.get(
+                readable_name, []
+            )
+            for readable_name, grouped_column_name in params.get_grouped_demographic_column_by_readable_name().items()
+        },
+    }
+
+
+def make_columns_categorical(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
+    """
+    Keeping these columns as categoricals (each value stored once, with a small code for each row)
+    makes the questionnaire much smaller, and grouping by them much quicker, than keeping them as Python strings.
+    """
+    for column_name, categories in get_categories_by_categorical_column().items():
+        if column_name in df_questionnaire_by_person.columns:
+            df_questionnaire_by_person[column_name] = make_series_categorical(
+                df_questionnaire_by_person[column_name], categories
+            )
+
+    return df_questionnaire_by_person
+
+
+def make_series_categorical(series: pd.Series, categories: list[str]) -> pd.Series:
+    """
+    The categories are the ones in the params together with any other values in the series
+    (so no value is lost by not being in the params), sorted,
+    so the groups sorted (see the categorical columns in docs/design_decisions.md) are in the same order
+    as grouping by the uncategorical column gave
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Like the grouped demographic columns (see demographics_columns.py)
+        codes = series.cat.codes.to_numpy()
+        values_in_series = series.cat.categories.take(pd.unique(codes[codes >= 0]))
+        return series.cat.set_categories(
+            sorted(set(categories).union(values_in_series))
+        )
+
+    values_in_series = pd.unique(series.dropna().astype(object))
+    return series.astype(object).astype(
+        pd.CategoricalDtype(categories=sorted(set(categories).union(values_in_series)))
+    )
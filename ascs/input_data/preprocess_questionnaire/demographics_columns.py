@@ -1,8 +1,10 @@
+from functools import lru_cache
 from numbers import Number
 import numpy as np
 import pandas as pd
 
 from ascs import params
+from .response_code_lookup import convert_to_categorical_with_response_code_lookup
 
 
 def add_all_grouped_demographics_columns(
@@ -33,14 +35,17 @@ def add_grouped_columns_from_demographics_conversions(
         e.g: {"Ethnicity": {1: "White", 2: "White", 7: "Asian" ...} ...}
     and adds new converted, grouped columns
         e.g: col Ethnicity_Grouped = ["White", "White", "Asian" ...]
+    Each grouped column is a categorical, made in one pass with a lookup (see response_code_lookup.py)
     """
     if demographic_conversions is None:
         demographic_conversions = params.DEMOGRAPHICS_CONVERSIONS
 
     for column, conversion in demographic_conversions.items():
-        df_questionnaire_by_person[f"{column}_Grouped"] = df_questionnaire_by_person[
-            column
-        ].replace(conversion)
+        df_questionnaire_by_person[
+            f"{column}_Grouped"
+        ] = convert_to_categorical_with_response_code_lookup(
+            df_questionnaire_by_person[column], conversion
+        )
 
     return df_questionnaire_by_person
 
@@ -66,23 +71,38 @@ def add_age_grouped_columns_to_questionnaire_data(
     """
     From col Age = [18, 89, 36 ...]
     To col Age_Grouped = ["18-24", "85-inf", "35-44", ...]
+    Each bin includes its start age, but not the next bin's. Ages that aren't in any bin are null.
     """
     if age_group_bins is None:
         age_group_bins = params.AGE_GROUP_BINS_START_AGES
 
-    bins = pd.IntervalIndex.from_breaks(age_group_bins, closed="left")
-
-    labels = get_list_of_labels_for_each_age_group_bin(age_group_bins)
+    age_group_breaks, labels = get_age_group_breaks_and_labels(tuple(age_group_bins))
 
-    label_by_bin: dict[str, str] = dict(zip(bins, labels))
+    ages = df_questionnaire_by_person["Age"].to_numpy(dtype=float)
+    # Nulls are put after all the breaks, so they aren't in any bin either
+    bin_code_by_person = np.searchsorted(age_group_breaks, ages, side="right") - 1
+    bin_code_by_person[bin_code_by_person >= len(labels)] = -1
 
-    df_questionnaire_by_person["Age_Grouped"] = pd.cut(
-        df_questionnaire_by_person["Age"], bins=bins
-    ).replace(label_by_bin)
+    df_questionnaire_by_person["Age_Grouped"] = pd.Categorical.from_codes(
+        bin_code_by_person, categories=labels
+    )
 
     return df_questionnaire_by_person
 
 
+@lru_cache(maxsize=None)
+def get_age_group_breaks_and_labels(
+    age_group_bins: tuple[Number, ...]
+) -> tuple[np.ndarray, list[str]]:
+    """
+    Made once for each AGE_GROUP_BINS_START_AGES in the params
+    """
+    return (
+        np.array(age_group_bins, dtype=float),
+        get_list_of_labels_for_each_age_group_bin(list(age_group_bins)),
+    )
+
+
 def get_list_of_labels_for_each_age_group_bin(
     age_group_bins: list[Number],
 ) -> list[str]:
@@ -1,9 +1,10 @@
 import numpy as np
 import pandas as pd
 
-from typing import Optional
+from typing import Optional, Union
 
 from ascs import params
+from ..input_columns_needed import needs_question_columns_not_loaded
 
 
 def add_is_easy_read_column(
@@ -25,28 +26,40 @@ def add_is_easy_read_column(
 def add_easy_read_columns(
     df_questionnaire_by_person: pd.DataFrame,
     easy_read_questions: Optional[list[str]] = None,
+    question_columns_not_loaded: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """
     For each easy read question (like q1) creates easy read columns (like q1ER, q1Std, q1Comb)
+
+    The columns for all the questions are made at once as one block of numbers,
+    rather than with masked assignments question by question
     """
     if easy_read_questions is None:
         easy_read_questions = params.EASY_READ_QUESTIONS
 
-    for easy_read_question in easy_read_questions:
-        add_columns_for_one_easy_read_question(
-            df_questionnaire_by_person, easy_read_question
+    easy_read_questions_loaded = [
+        easy_read_question
+        for easy_read_question in easy_read_questions
+        if not needs_question_columns_not_loaded(
+            [easy_read_question], question_columns_not_loaded
         )
+    ]
 
-    return df_questionnaire_by_person
+    df_easy_read_columns = make_easy_read_columns(
+        df_questionnaire_by_person, easy_read_questions_loaded
+    )
 
+    # Added as one block, rather than a block for each column, so the questionnaire doesn't get fragmented
+    return pd.concat([df_questionnaire_by_person, df_easy_read_columns], axis=1)
 
-def add_columns_for_one_easy_read_question(
-    df_questionnaire_by_person: pd.DataFrame, question: str
-) -> None:
+
+def make_easy_read_columns(
+    df_questionnaire_by_person: pd.DataFrame, questions: list[str]
+) -> pd.DataFrame:
     r"""
-    The question column contains all people's raw untransformed answers
+    The question columns contain all people's raw untransformed answers
 
-    This function creates three columns
+    This function makes three columns for each question
 
     Column 1: question + ER = Only the raw ER answers
 
@@ -58,44 +71,42 @@ def add_columns_for_one_easy_read_question(
         The Std raw answer is a number from 1-7
         We transform it to be in range 1-5 to make it comparable to Std
     """
-
-    initialise_easy_read_columns_to_null(df_questionnaire_by_person, question)
-
-    easy_read = df_questionnaire_by_person["is_easy_read"]
-    standard = ~df_questionnaire_by_person["is_easy_read"]
-
-    df_questionnaire_by_person.loc[
-        easy_read, f"{question}ER"
-    ] = df_questionnaire_by_person.loc[easy_read, question]
-
-    df_questionnaire_by_person.loc[
-        standard, f"{question}Std"
-    ] = df_questionnaire_by_person.loc[standard, question]
-
-    df_questionnaire_by_person.loc[
-        easy_read, f"{question}Comb"
-    ] = df_questionnaire_by_person.loc[easy_read, question]
-
-    df_questionnaire_by_person.loc[
-        standard, f"{question}Comb"
-    ] = clamp_std_answer_to_make_it_between_1_and_5(
-        df_questionnaire_by_person[question]
+    answers_by_person_and_question = df_questionnaire_by_person[questions].to_numpy(
+        dtype=float
     )
+    is_easy_read_by_person = df_questionnaire_by_person["is_easy_read"].to_numpy(
+        dtype=bool
+    )[:, np.newaxis]
 
+    er_answers = np.where(
+        is_easy_read_by_person, answers_by_person_and_question, np.nan
+    )
+    std_answers = np.where(
+        is_easy_read_by_person, np.nan, answers_by_person_and_question
+    )
+    comb_answers = np.where(
+        is_easy_read_by_person,
+        answers_by_person_and_question,
+        clamp_std_answer_to_make_it_between_1_and_5(answers_by_person_and_question),
+    )
 
-def initialise_easy_read_columns_to_null(
-    df_questionnaire_by_person: pd.DataFrame, question: str
-) -> pd.DataFrame:
-    df_questionnaire_by_person[
-        [f"{question}ER", f"{question}Std", f"{question}Comb"]
-    ] = np.nan
-
-    return df_questionnaire_by_person
+    # The columns are in the order q1ER, q1Std, q1Comb, q2ER, ...
+    return pd.DataFrame(
+        np.stack([er_answers, std_answers, comb_answers], axis=2).reshape(
+            len(df_questionnaire_by_person), 3 * len(questions)
+        ),
+        index=df_questionnaire_by_person.index,
+        columns=[
+            f"{question}{easy_read_column_ending}"
+            for question in questions
+            for easy_read_column_ending in ["ER", "Std", "Comb"]
+        ],
+    )
 
 
 def clamp_std_answer_to_make_it_between_1_and_5(
-    question_response_by_person: pd.Series,
-) -> pd.Series:
+    question_response_by_person: Union[pd.Series, np.ndarray],
+) -> Union[pd.Series, np.ndarray]:
     """
     Standard answers are 1-7
     Make them comparable to easy read answers by putting them in range 1-5
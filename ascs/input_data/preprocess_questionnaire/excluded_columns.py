@@ -3,11 +3,13 @@ import numpy as np
 import pandas as pd
 
 from ascs import params
+from ..input_columns_needed import needs_question_columns_not_loaded
 
 
 def add_excluded_columns(
     df_questionnaire_by_person: pd.DataFrame,
     questions_and_values_to_exclude: Optional[dict[str, int]] = None,
+    question_columns_not_loaded: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """
     We want to know how people answered certain questions excluding those who answered a certain way
@@ -19,11 +21,19 @@ def add_excluded_columns(
         questions_and_values_to_exclude = params.QUESTIONS_AND_VALUES_TO_EXCLUDE
 
     for exclude_question, value_to_exclude in questions_and_values_to_exclude.items():
+        if needs_question_columns_not_loaded(
+            [exclude_question], question_columns_not_loaded
+        ):
+            continue
+
         create_exclude_column_non_multichoice_question(
             df_questionnaire_by_person, exclude_question, value_to_exclude
         )
 
-    create_exclude_columns_for_q22_multichoice_question(df_questionnaire_by_person)
+    if not needs_question_columns_not_loaded(
+        Q22_SUBQUESTIONS_IN_EXCLUDED_ORIGINAL_NAMES, question_columns_not_loaded
+    ):
+        create_exclude_columns_for_q22_multichoice_question(df_questionnaire_by_person)
 
     return df_questionnaire_by_person
 
@@ -4,6 +4,10 @@ import numpy as np
 import pandas as pd
 
 from ascs.input_data.preprocess_questionnaire.ascof_config import SimpleAscofConversion
+from ascs.input_data.preprocess_questionnaire.response_code_lookup import (
+    convert_with_response_code_lookup,
+)
+from ascs.input_data.input_columns_needed import needs_question_columns_not_loaded
 
 
 class ScoreCondition(NamedTuple):
@@ -11,13 +15,53 @@ class ScoreCondition(NamedTuple):
     value_to_set: Union[int, float]
 
 
-def generate_all_scores(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
-    df_questionnaire_by_person = (
-        generate_1A(df_questionnaire_by_person)
-        .pipe(generate_simple_conversion_ascof_scores)
-        .pipe(generate_1J)
+COLUMNS_FOR_1A = ["q3a", "q4a", "q5a", "q6a", "q7a", "q8a", "q9a", "q11"]
+COLUMNS_FOR_1J = [
+    "q3a",
+    "q4a",
+    "q5a",
+    "q6a",
+    "q7a",
+    "q8a",
+    "q9a",
+    "q11",
+    "q13",
+    "q15a",
+    "q15b",
+    "q15c",
+    "q15d",
+    "q16a",
+    "q16b",
+    "q16c",
+    "q17",
+    "q18",
+    "age_1864",
+    "can_answer_2c",
+]
+
+
+def generate_all_scores(
+    df_questionnaire_by_person: pd.DataFrame,
+    question_columns_not_loaded: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    The scores made from the questions that weren't loaded are left out
+    """
+    if not needs_question_columns_not_loaded(
+        COLUMNS_FOR_1A, question_columns_not_loaded
+    ):
+        df_questionnaire_by_person = generate_1A(df_questionnaire_by_person)
+
+    df_questionnaire_by_person = generate_simple_conversion_ascof_scores(
+        df_questionnaire_by_person,
+        question_columns_not_loaded=question_columns_not_loaded,
     )
-    
+
+    if not needs_question_columns_not_loaded(
+        COLUMNS_FOR_1J, question_columns_not_loaded
+    ):
+        df_questionnaire_by_person = generate_1J(df_questionnaire_by_person)
+
     return df_questionnaire_by_person
 
 
@@ -26,15 +70,15 @@ def apply_simple_conversion(
 ):
     score_name = ascof_conversion.SCORE_NAME
 
-    df_questionnaire_by_person[score_name] = df_questionnaire_by_person[
-        ascof_conversion.QUESTION_COLUMN
-    ].replace(ascof_conversion.CONVERSION)
+    df_questionnaire_by_person[score_name] = convert_with_response_code_lookup(
+        df_questionnaire_by_person[ascof_conversion.QUESTION_COLUMN],
+        ascof_conversion.CONVERSION,
+    )
 
     return df_questionnaire_by_person
 
 
 def generate_1A(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
-    COLUMNS_FOR_1A = ["q3a", "q4a", "q5a", "q6a", "q7a", "q8a", "q9a", "q11"]
     df_questionnaire_by_person["ASCOF_1A"] = 32 - df_questionnaire_by_person[
         COLUMNS_FOR_1A
     ].sum(axis=1, skipna=False)
@@ -45,6 +89,7 @@ def generate_1A(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
 def generate_simple_conversion_ascof_scores(
     df_questionnaire_by_person: pd.DataFrame,
     simple_ascof_conversions: Optional[list[SimpleAscofConversion]] = None,
+    question_columns_not_loaded: Optional[list[str]] = None,
 ) -> pd.DataFrame:
     """
     This function creates simple ascof scores by applying a conversion dict on a question column
@@ -62,6 +107,11 @@ def generate_simple_conversion_ascof_scores(
         simple_ascof_conversions = params.ASCOF_CONVERSIONS
 
     for ascof_conversion in simple_ascof_conversions:
+        if needs_question_columns_not_loaded(
+            [ascof_conversion.QUESTION_COLUMN], question_columns_not_loaded
+        ):
+            continue
+
         df_questionnaire_by_person = apply_simple_conversion(
             df_questionnaire_by_person, ascof_conversion
         )
@@ -70,8 +120,11 @@ def generate_simple_conversion_ascof_scores(
 
 
 def generate_1J(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
+    """
+    Made from only the columns 1J needs, rather than a copy of the whole questionnaire
+    """
     df_questionnaire_by_person["ASCOF_1J"] = (
-        df_questionnaire_by_person.copy()
+        df_questionnaire_by_person[COLUMNS_FOR_1J]
         .pipe(recode_columns_for_1J)
         .pipe(calculate_weighted_quality_of_life_score)
         .pipe(calculate_count_level_of_assistance_score)
@@ -86,34 +139,31 @@ def generate_1J(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
     return df_questionnaire_by_person
 
 
-def recode_columns_for_1J(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
-    MINUS_ONE_CONVERSION = {1: 0.0, 2: 1.0, 3: 2.0}
-    CONVERSIONS_BY_QUESTION = {
-        "q3a": {1: 1, 2: 0.919, 3: 0.541, 4: 0},
-        "q4a": {1: 0.911, 2: 0.789, 3: 0.265, 4: 0.195},
-        "q5a": {1: 0.879, 2: 0.775, 3: 0.294, 4: 0.184},
-        "q6a": {1: 0.863, 2: 0.78, 3: 0.374, 4: 0.288},
-        "q7a": {1: 0.88, 2: 0.452, 3: 0.298, 4: 0.114},
-        "q8a": {1: 0.873, 2: 0.748, 3: 0.497, 4: 0.241},
-        "q9a": {1: 0.962, 2: 0.927, 3: 0.567, 4: 0.17},
-        "q11": {1: 0.847, 2: 0.637, 3: 0.295, 4: 0.263},
-        "q13": {1: 0.0, 2: 0.0, 3: -0.0148, 4: -0.1090, 5: -0.1090},
-        "q15a": MINUS_ONE_CONVERSION,
-        "q15b": MINUS_ONE_CONVERSION,
-        "q15c": MINUS_ONE_CONVERSION,
-        "q15d": MINUS_ONE_CONVERSION,
-        "q16a": MINUS_ONE_CONVERSION,
-        "q16b": MINUS_ONE_CONVERSION,
-        "q16c": MINUS_ONE_CONVERSION,
-        "q17": {1: 0.0, 2: -0.0308, 3: -0.1250, 4: -0.1250, 5: -0.1250},
-        "q18": {1: 0.0, 2: -0.0603, 3: -0.1100, 4: -0.1100},
-    }
-    df_questionnaire_by_person = df_questionnaire_by_person.replace(
-        CONVERSIONS_BY_QUESTION
+def recode_columns_for_1J(
+    df_questionnaire_by_person: pd.DataFrame,
+    conversions_by_question: Optional[dict[str, dict[int, float]]] = None,
+) -> pd.DataFrame:
+    """
+    Returns a new DataFrame with the same columns, the questions in conversions_by_question
+    recoded with a lookup of each response (see response_code_lookup.py).
+    Responses that aren't in a question's conversion are left as they are.
+    """
+    if conversions_by_question is None:
+        conversions_by_question = params.ASCOF_1J_CONVERSIONS
+
+    return pd.DataFrame(
+        {
+            column_name: convert_with_response_code_lookup(
+                df_questionnaire_by_person[column_name],
+                conversions_by_question[column_name],
+            )
+            if column_name in conversions_by_question
+            else df_questionnaire_by_person[column_name]
+            for column_name in df_questionnaire_by_person.columns
+        },
+        index=df_questionnaire_by_person.index,
     )
 
-    return df_questionnaire_by_person
-
 
 def calculate_weighted_quality_of_life_score(
     df_questionnaire_by_person_recoded: pd.DataFrame,
@@ -173,8 +223,13 @@ def calculate_adjustment_factor(
         "count_level_of_assistance_score",
     ]
     ADJUSTMENT_FACTOR_CONVERSION = {"age_1864": {True: 0, False: 0.0473}}
-    df_questionnaire_by_person_recoded = df_questionnaire_by_person_recoded.replace(
-        ADJUSTMENT_FACTOR_CONVERSION
+    df_questionnaire_by_person_recoded = df_questionnaire_by_person_recoded.assign(
+        **{
+            column_name: convert_with_response_code_lookup(
+                df_questionnaire_by_person_recoded[column_name], conversion
+            )
+            for column_name, conversion in ADJUSTMENT_FACTOR_CONVERSION.items()
+        }
     )
 
     df_questionnaire_by_person_recoded["count_level_of_assistance_score"] = 0.5798 - (
@@ -202,28 +257,7 @@ def set_1J_to_nan_for_invalid_responses(
     columns_that_must_not_contain_null: Optional[list[str]] = None,
 ):
     if columns_that_must_not_contain_null is None:
-        columns_that_must_not_contain_null = [
-            "q3a",
-            "q4a",
-            "q5a",
-            "q6a",
-            "q7a",
-            "q8a",
-            "q9a",
-            "q11",
-            "q13",
-            "q15a",
-            "q15b",
-            "q15c",
-            "q15d",
-            "q16a",
-            "q16b",
-            "q16c",
-            "q17",
-            "q18",
-            "age_1864",
-            "can_answer_2c",
-        ]
+        columns_that_must_not_contain_null = COLUMNS_FOR_1J
 
     can_answer_2c = df_questionnaire_by_person["can_answer_2c"]
     df_questionnaire_by_person.loc[~can_answer_2c, "ASCOF_1J"] = np.nan
@@ -236,4 +270,3 @@ def set_1J_to_nan_for_invalid_responses(
     df_questionnaire_by_person.loc[rows_containing_null, "ASCOF_1J"] = np.nan
 
     return df_questionnaire_by_person
-
@@ -4,12 +4,35 @@ import pandas as pd
 from ascs import params
 
 
-def replace_erroneous_input_value_with_null(
-    df_questionnaire_by_person: pd.DataFrame,
-) -> pd.DataFrame:
-    return df_questionnaire_by_person.replace(
-        params.ERRONEOUS_INPUT_VALUE, np.nan
-    ).replace(str(params.ERRONEOUS_INPUT_VALUE), np.nan)
+def replace_erroneous_input_value_with_null_in_series(series: pd.Series) -> pd.Series:
+    """
+    Returns the series itself if it doesn't have the erroneous input value in,
+    so it only needs to be written back to the DataFrame if it did
+    """
+    if not series_could_have_erroneous_input_value(series):
+        return series
+
+    return series.replace(params.ERRONEOUS_INPUT_VALUE, np.nan).replace(
+        str(params.ERRONEOUS_INPUT_VALUE), np.nan
+    )
+
+
+def series_could_have_erroneous_input_value(series: pd.Series) -> bool:
+    """
+    Compares the values directly, as series.isin would turn a column of numbers into Python objects first
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return False
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return bool((series.to_numpy() == params.ERRONEOUS_INPUT_VALUE).any())
+    if pd.api.types.is_object_dtype(series.dtype):
+        # isin, as comparing an array of objects with == fails when it has pd.NA in
+        return bool(
+            series.isin(
+                [params.ERRONEOUS_INPUT_VALUE, str(params.ERRONEOUS_INPUT_VALUE)]
+            ).any()
+        )
+    return True
 
 
 SUPPORT_SETTING_COMMUNITY = 1
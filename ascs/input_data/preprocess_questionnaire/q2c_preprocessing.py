@@ -1,11 +1,20 @@
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 
+from ..input_columns_needed import needs_question_columns_not_loaded
 
-def do_q2c_preprocessing(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
-    return df_questionnaire_by_person.pipe(add_can_answer_2c_column).pipe(
-        set_q2c_null_for_people_who_shouldnt_answer_2c
-    )
+
+def do_q2c_preprocessing(
+    df_questionnaire_by_person: pd.DataFrame,
+    question_columns_not_loaded: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    df_questionnaire_by_person = add_can_answer_2c_column(df_questionnaire_by_person)
+    if needs_question_columns_not_loaded(["q2c"], question_columns_not_loaded):
+        return df_questionnaire_by_person
+
+    return set_q2c_null_for_people_who_shouldnt_answer_2c(df_questionnaire_by_person)
 
 
 def set_q2c_null_for_people_who_shouldnt_answer_2c(
@@ -0,0 +1,211 @@
+from functools import lru_cache
+from typing import Any, Hashable, NamedTuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class ResponseCodeLookup(NamedTuple):
+    """
+    A conversion (like {1: 1, 2: 1, 3: 2, 4: 2}) as an array of what each response code is converted to,
+    so converting a column is one np.take rather than a Series.replace
+    """
+
+    converted_value_by_response_code: np.ndarray
+    is_converted_by_response_code: np.ndarray
+
+
+def make_response_code_lookup(conversion: dict[int, Any]) -> ResponseCodeLookup:
+    """
+    The response codes are small whole numbers (True and False count as 1 and 0),
+    so the arrays only need to be as long as the biggest one
+    """
+    assert all(
+        int(response_code) == response_code and response_code >= 0
+        for response_code in conversion
+    ), f"The response codes of a conversion must be whole numbers, not less than 0: {list(conversion)}"
+
+    lookup_length = int(max(conversion, default=-1)) + 1
+    converted_value_by_response_code = np.full(lookup_length, np.nan)
+    is_converted_by_response_code = np.zeros(lookup_length, dtype=bool)
+    for response_code, converted_value in conversion.items():
+        converted_value_by_response_code[int(response_code)] = converted_value
+        is_converted_by_response_code[int(response_code)] = True
+
+    return ResponseCodeLookup(
+        converted_value_by_response_code=converted_value_by_response_code,
+        is_converted_by_response_code=is_converted_by_response_code,
+    )
+
+
+def get_response_code_positions(
+    values: np.ndarray, lookup: ResponseCodeLookup
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The position of each value in the lookup (0 for values that aren't converted),
+    and whether it is converted: nulls, and values that aren't one of the response codes, aren't
+    """
+    lookup_length = len(lookup.is_converted_by_response_code)
+    is_a_response_code = (values >= 0) & (values < lookup_length)
+    is_a_response_code &= values == np.floor(values)
+
+    positions = np.where(is_a_response_code, values, 0).astype(np.intp)
+    is_converted = is_a_response_code & lookup.is_converted_by_response_code.take(
+        positions, mode="clip"
+    )
+    return positions, is_converted
+
+
+def convert_with_response_code_lookup(
+    series: pd.Series, conversion: dict[int, Any]
+) -> pd.Series:
+    """
+    The same as series.replace(conversion) for a column of numbers (or True and False) and a conversion to numbers:
+    the values that aren't in the conversion are left as they are.
+    Anything else is left to series.replace.
+    """
+    if not conversion:
+        return series.copy()
+    if not (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        or pd.api.types.is_object_dtype(series.dtype)
+    ):
+        return series.replace(conversion)
+    # Series.replace doesn't match True and False to 1 and 0, or the other way round
+    if is_conversion_of_booleans(conversion) != is_series_of_booleans(series):
+        return series.replace(conversion)
+    try:
+        values = series.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        return series.replace(conversion)
+
+    lookup = make_response_code_lookup(conversion)
+    with np.errstate(invalid="ignore"):
+        positions, is_converted = get_response_code_positions(values, lookup)
+    converted_values = np.where(
+        is_converted,
+        lookup.converted_value_by_response_code.take(positions, mode="clip"),
+        values,
+    )
+
+    if pd.api.types.is_integer_dtype(series.dtype) and np.array_equal(
+        converted_values, np.round(converted_values)
+    ):
+        converted_values = converted_values.astype(series.dtype)
+    return pd.Series(converted_values, index=series.index, name=series.name)
+
+
+class CategoryLookup(NamedTuple):
+    """
+    A conversion to labels (like {1: "White", 2: "White", 5: "Mixed"}) as the labels,
+    and the position of each response code's label (-1 for response codes that aren't converted)
+    """
+
+    categories: list[Hashable]
+    response_code_lookup: ResponseCodeLookup
+    category_code_by_response_code: np.ndarray
+
+
+@lru_cache(maxsize=None)
+def get_category_lookup(
+    conversion_items: tuple[tuple[Union[int, tuple[int, ...]], Hashable], ...]
+) -> CategoryLookup:
+    """
+    Made once for each conversion in the params (the conversion is passed as a tuple of its items, so it can be cached).
+    A tuple of response codes (like (1, 2, 3, 4): "White") converts each of them, as it does in Series.replace.
+    The labels are in the order they first appear in the conversion.
+    """
+    categories = list(dict.fromkeys(label for _, label in conversion_items))
+    category_code_by_label = {label: code for code, label in enumerate(categories)}
+    response_code_lookup = make_response_code_lookup(
+        {
+            response_code: category_code_by_label[label]
+            for response_codes, label in conversion_items
+            for response_code in (
+                response_codes
+                if isinstance(response_codes, tuple)
+                else (response_codes,)
+            )
+        }
+    )
+    return CategoryLookup(
+        categories=categories,
+        response_code_lookup=response_code_lookup,
+        category_code_by_response_code=np.where(
+            response_code_lookup.is_converted_by_response_code,
+            response_code_lookup.converted_value_by_response_code,
+            -1,
+        ).astype(np.intp),
+    )
+
+
+def convert_to_categorical_with_response_code_lookup(
+    series: pd.Series, conversion: dict[int, Hashable]
+) -> pd.Series:
+    """
+    The same values as series.replace(conversion) for a column of numbers and a conversion to labels,
+    as a categorical: the labels are the first categories,
+    then the values that aren't in the conversion (in the order they first appear), which are left as they are.
+    Anything else is left to series.replace.
+    """
+    if not conversion or any(pd.isna(label) for label in conversion.values()):
+        return series.replace(conversion)
+    if not (
+        pd.api.types.is_numeric_dtype(series.dtype)
+        or pd.api.types.is_object_dtype(series.dtype)
+    ):
+        return series.replace(conversion)
+    # Series.replace doesn't match True and False to 1 and 0, or the other way round
+    if is_conversion_of_booleans(conversion) or is_series_of_booleans(series):
+        return series.replace(conversion)
+    try:
+        values = series.to_numpy(dtype=float)
+    except (TypeError, ValueError):
+        return series.replace(conversion)
+
+    category_lookup = get_category_lookup(tuple(conversion.items()))
+    with np.errstate(invalid="ignore"):
+        positions, is_converted = get_response_code_positions(
+            values, category_lookup.response_code_lookup
+        )
+    category_code_by_row = np.where(
+        is_converted, category_lookup.category_code_by_response_code[positions], -1
+    )
+    categories = pd.Index(category_lookup.categories, dtype=object)
+
+    is_left_as_it_is = ~is_converted & ~np.isnan(values)
+    if is_left_as_it_is.any():
+        other_value_code_by_row, other_values = pd.factorize(
+            series.to_numpy()[is_left_as_it_is]
+        )
+        other_values = other_values.astype(object)
+        if categories.isin(other_values).any():
+            # A value that is left as it is is also one of the labels
+            return series.replace(conversion)
+        category_code_by_row[is_left_as_it_is] = (
+            len(categories) + other_value_code_by_row
+        )
+        categories = categories.append(pd.Index(other_values, dtype=object))
+
+    return pd.Series(
+        pd.Categorical.from_codes(category_code_by_row, categories=categories),
+        index=series.index,
+        name=series.name,
+    )
+
+
+def is_conversion_of_booleans(conversion: dict[int, Any]) -> bool:
+    return all(
+        isinstance(response_code, (bool, np.bool_)) for response_code in conversion
+    )
+
+
+def is_series_of_booleans(series: pd.Series) -> bool:
+    """
+    A column of True and False with nulls in has the object dtype
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return True
+    return pd.api.types.is_object_dtype(series.dtype) and (
+        pd.api.types.infer_dtype(series, skipna=True) == "boolean"
+    )
@@ -1,10 +1,11 @@
 import numpy as np
 import pandas as pd
 
-from typing import Optional
-
 from ..preprocess_utilities import get_numeric_columns_from_df_questionnaire_by_person
-from ..df_with_errors import DFWithErrors
+from ..df_with_errors import ERROR_DF_ID_COLUMNS, DFWithErrors
+from .miscellaneous_preprocessing import (
+    replace_erroneous_input_value_with_null_in_series,
+)
 
 from ..validators.numeric_column_validator import NumericColumnValidator
 
@@ -13,89 +14,197 @@ from ascs import params
 
 def clean_all_types(df_questionnaire_w_errs: DFWithErrors,) -> DFWithErrors:
     """
+    Sets the erroneous input value (like -9) null
     Makes string column string
     Number columns number
     And also makes sure that nulls are a consistent data type (None for string cols, np.nan for number cols)
     """
-    return df_questionnaire_w_errs.run_transformer_on_df(
-        make_string_columns_either_string_or_none
-    ).run_validator_function_on_df(clean_types_in_numeric_columns)
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        clean_types_in_all_columns
+    )
 
 
-def clean_types_in_numeric_columns(
+def clean_types_in_all_columns(
     df_questionnaire_by_person: pd.DataFrame,
-    numeric_column_names: Optional[list[str]] = None,
 ) -> DFWithErrors:
     """
-    Numeric columns could contain a string like "5"
-    Convert that string to a number, 5
-    If there are strings like "a" in the column, they will be set to np.nan
-    and there will be a warning in the error df
+    Sets the erroneous input value null in every column,
+    makes the string columns (params.DATA_RETURN.STRING_COLUMNS) either string or None,
+    and the other columns numbers, with an error for each value that isn't a number.
+
+    The columns that are already numbers (nearly all of them, as columns are given their types when the data return is loaded)
+    are cleaned together as one block, see clean_number_columns.
+    Only the string columns, and the columns that need converting to numbers, are cleaned one column at a time.
     """
-    if numeric_column_names is None:
-        numeric_column_names = get_numeric_columns_from_df_questionnaire_by_person(
+    number_column_names = [
+        column_name
+        for column_name in get_numeric_columns_from_df_questionnaire_by_person(
             df_questionnaire_by_person
         )
+        if column_is_already_numeric(df_questionnaire_by_person[column_name])
+    ]
+    df_number_columns = clean_number_columns(
+        df_questionnaire_by_person[number_column_names]
+    )
+
+    series_by_column_name = {}
+    for column_name, series in df_questionnaire_by_person.items():
+        if column_name in df_number_columns.columns:
+            continue
+        series = widen_compact_numbers(series)
+        series = replace_erroneous_input_value_with_null_in_series(series)
+        if column_name in params.DATA_RETURN.STRING_COLUMNS:
+            series = make_string_series_either_string_or_none(series)
+        series_by_column_name[column_name] = series
+
+    error_dfs = clean_types_in_numeric_series(
+        series_by_column_name,
+        [
+            column_name
+            for column_name in get_numeric_columns_from_df_questionnaire_by_person(
+                df_questionnaire_by_person
+            )
+            if column_name in series_by_column_name
+        ],
+    )
+
+    return DFWithErrors(
+        df=pd.concat(
+            [
+                df_number_columns,
+                pd.DataFrame(
+                    series_by_column_name, index=df_questionnaire_by_person.index
+                ),
+            ],
+            axis=1,
+        )[df_questionnaire_by_person.columns],
+        error_dfs=error_dfs,
+    )
+
+
+def clean_number_columns(df_number_columns: pd.DataFrame) -> pd.DataFrame:
+    """
+    Widens the compact numbers (see make_numbers_compact in service_user_data.py) to int64 and float64,
+    as the cleaning and everything after it works on those, and sets the erroneous input value null,
+    for all the columns at once.
 
+    An integer column with the erroneous input value in becomes a float column, as it then has nulls in.
+    The float columns come back as one block, and the integer columns as another.
+    """
+    values = df_number_columns.to_numpy(dtype=np.float64)
+    is_erroneous_input_value = values == params.ERRONEOUS_INPUT_VALUE
+    values[is_erroneous_input_value] = np.nan
+
+    is_integer_column = np.array(
+        [pd.api.types.is_integer_dtype(dtype) for dtype in df_number_columns.dtypes],
+        dtype=bool,
+    ) & ~is_erroneous_input_value.any(axis=0)
+
+    return pd.concat(
+        [
+            pd.DataFrame(
+                values[:, ~is_integer_column],
+                index=df_number_columns.index,
+                columns=df_number_columns.columns[~is_integer_column],
+            ),
+            pd.DataFrame(
+                # Taken from the integers themselves, as the floats could have lost precision
+                df_number_columns.loc[:, is_integer_column].to_numpy(dtype=np.int64),
+                index=df_number_columns.index,
+                columns=df_number_columns.columns[is_integer_column],
+            ),
+        ],
+        axis=1,
+    )
+
+
+def clean_types_in_numeric_series(
+    series_by_column_name: dict[str, pd.Series], numeric_column_names: list[str]
+) -> list[pd.DataFrame]:
+    """
+    Replaces the numeric columns in series_by_column_name with the cleaned ones,
+    and returns the error DataFrames for the values that weren't numbers.
+    These are made from only the rows with errors, and are the same as NumericColumnValidator.run_check would make.
+    """
     error_dfs: list[pd.DataFrame] = []
 
     for column_name in numeric_column_names:
-        df_questionnaire_by_person[column_name] = (
-            df_questionnaire_by_person[column_name]
+        if column_is_already_numeric(series_by_column_name[column_name]):
+            # Usually the case, as columns are given their types when the data return is loaded
+            continue
+
+        series = (
+            series_by_column_name[column_name]
             .copy()
             .pipe(make_all_null_values_consistent, output_null_value=np.nan)
             .pipe(convert_strings_that_are_numbers_into_numbers)
         )
 
-        (
-            df_questionnaire_by_person,
-            error_dfs_from_one_validator,
-        ) = NumericColumnValidator(column=column_name).run_check(
-            df_questionnaire_by_person
+        numeric_column_validator = NumericColumnValidator(column=column_name)
+        incorrect_by_person = numeric_column_validator.get_where_incorrect(
+            series.to_frame()
         )
-
-        error_dfs.extend(error_dfs_from_one_validator)
-
-        df_questionnaire_by_person[column_name] = df_questionnaire_by_person[
-            column_name
-        ].infer_objects()
+        if incorrect_by_person.any():
+            incorrect_row_numbers = np.flatnonzero(incorrect_by_person)
+            df_incorrect_rows = pd.DataFrame(
+                {
+                    error_df_column_name: series_by_column_name[
+                        error_df_column_name
+                    ].iloc[incorrect_row_numbers]
+                    for error_df_column_name in ERROR_DF_ID_COLUMNS
+                }
+            )
+            df_incorrect_rows[column_name] = series.iloc[incorrect_row_numbers]
+            error_dfs.append(
+                numeric_column_validator.get_error_df(
+                    df_incorrect_rows, pd.Series(True, index=df_incorrect_rows.index)
+                )
+            )
+            series[incorrect_by_person] = np.nan
+
+        series_by_column_name[column_name] = series.infer_objects()
 
         assert np.issubdtype(
-            df_questionnaire_by_person[column_name].dtype, np.number  # type: ignore
+            series_by_column_name[column_name].dtype, np.number  # type: ignore
         ), f"Column {column_name} was still not a numeric dtype even after conversion. This is a bug that could cause later issues."
 
-    return DFWithErrors(df=df_questionnaire_by_person, error_dfs=error_dfs)
-
+    return error_dfs
 
-def convert_strings_that_are_numbers_into_numbers(series: pd.Series) -> pd.Series:
-    series_converted_to_number = pd.to_numeric(series, errors="coerce")
-    series[~series_converted_to_number.isna()] = series_converted_to_number
 
+def widen_compact_numbers(series: pd.Series) -> pd.Series:
+    """
+    The data returns are read into compact numbers (see make_numbers_compact in service_user_data.py),
+    the cleaning and everything after it works on int64 and float64
+    """
+    if pd.api.types.is_integer_dtype(series.dtype) and series.dtype != np.int64:
+        return series.astype(np.int64)
+    if pd.api.types.is_float_dtype(series.dtype) and series.dtype != np.float64:
+        return series.astype(np.float64)
     return series
 
 
-def make_string_columns_either_string_or_none(
-    df_questionnaire_by_person: pd.DataFrame,
-    string_column_names: Optional[list[str]] = None,
-) -> pd.DataFrame:
+def column_is_already_numeric(series: pd.Series) -> bool:
     """
-    Ensures string columns have consistent format
-    Either the value is a string
-    Or the value is a None, standing for null
-    Empty strings -> None
+    Booleans count as numeric to pandas, but the NumericColumnValidator says they aren't numbers
     """
-    if string_column_names is None:
-        string_column_names = params.DATA_RETURN.STRING_COLUMNS
+    return pd.api.types.is_numeric_dtype(
+        series.dtype
+    ) and not pd.api.types.is_bool_dtype(series.dtype)
+
+
+def convert_strings_that_are_numbers_into_numbers(series: pd.Series) -> pd.Series:
+    series_converted_to_number = pd.to_numeric(series, errors="coerce")
+    series[~series_converted_to_number.isna()] = series_converted_to_number
+
+    return series
 
-    for column_name in string_column_names:
-        df_questionnaire_by_person[column_name] = (
-            df_questionnaire_by_person[column_name]
-            .copy()
-            .pipe(make_all_null_values_consistent, output_null_value=None)
-            .pipe(convert_to_string_where_series_isnt_null)
-        )
 
-    return df_questionnaire_by_person
+def make_string_series_either_string_or_none(series: pd.Series) -> pd.Series:
+    return (
+        series.copy()
+        .pipe(make_all_null_values_consistent, output_null_value=None)
+        .pipe(convert_to_string_where_series_isnt_null)
+    )
 
 
 def make_all_null_values_consistent(
@@ -0,0 +1,245 @@
+import functools
+import inspect
+import logging
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Iterator, NamedTuple, Optional, TypeVar
+
+import pandas as pd
+import psutil
+
+from .step_profiler_config import (
+    BASELINE_STEP_PROFILE_FILE_PATH,
+    MINIMUM_INCREASE_TO_WARN_ABOUT_BY_MEASURE,
+    STEP_PROFILE_REGRESSION_RATIO,
+)
+
+ReturnType = TypeVar("ReturnType")
+
+
+class StepProfile(NamedTuple):
+    """
+    How one run_transformer_on_df or run_validator_function_on_df went, to find the steps that are slow or use a lot of memory.
+
+    la_shard is the shard the step was run on (see la_shards.py), None when the questionnaire wasn't split.
+    rss_delta_bytes is how much more memory the process was using after the step than before it,
+    so it leaves out the memory a step only used while it ran.
+    traced_peak_delta_bytes is the most memory the step allocated while it ran (None unless memory allocations were traced).
+    errors_added is the number of invalid values (rows of the error DataFrames) the step found.
+    """
+
+    step: str
+    la_shard: Optional[int]
+    wall_seconds: float
+    cpu_seconds: float
+    rss_delta_bytes: int
+    traced_peak_delta_bytes: Optional[int]
+    rows_before: int
+    columns_before: int
+    rows_after: int
+    columns_after: int
+    errors_added: int
+
+
+# The profiles of the steps run in this process while profile_steps is on, None when it is off
+step_profiles_being_recorded: Optional[list[StepProfile]] = None
+
+
+@contextmanager
+def profile_steps(
+    trace_memory_allocations: bool = False,
+) -> Iterator[list[StepProfile]]:
+    """
+    While this is on, a StepProfile of every step run in this process is added to the list it gives
+    """
+    global step_profiles_being_recorded
+    step_profiles_being_recorded = []
+    if trace_memory_allocations:
+        tracemalloc.start()
+    try:
+        yield step_profiles_being_recorded
+    finally:
+        if trace_memory_allocations:
+            tracemalloc.stop()
+        step_profiles_being_recorded = None
+
+
+def is_profiling_steps() -> bool:
+    return step_profiles_being_recorded is not None
+
+
+def is_tracing_memory_allocations() -> bool:
+    return is_profiling_steps() and tracemalloc.is_tracing()
+
+
+def add_step_profiles(step_profiles: list[StepProfile]) -> None:
+    """
+    For the steps run in another process (see la_shards.py)
+    """
+    if step_profiles_being_recorded is not None:
+        step_profiles_being_recorded.extend(step_profiles)
+
+
+def profiled_step(run_step_method: Callable) -> Callable:
+    """
+    Records a StepProfile of each run of a DFWithErrors method that runs a step, while profile_steps is on
+    """
+
+    @functools.wraps(run_step_method)
+    def run_step_and_record_profile(df_w_errs, step_function, *args, **kwargs):
+        if step_profiles_being_recorded is None:
+            return run_step_method(df_w_errs, step_function, *args, **kwargs)
+
+        # Taken before the step, as a transformer can change the DataFrame it is given
+        rows_before, columns_before = df_w_errs.df.shape
+        process = psutil.Process()
+        rss_before = process.memory_info().rss
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            traced_memory_before, _ = tracemalloc.get_traced_memory()
+        wall_seconds_before = time.perf_counter()
+        cpu_seconds_before = time.process_time()
+
+        processed_df_w_errs = run_step_method(df_w_errs, step_function, *args, **kwargs)
+
+        cpu_seconds = time.process_time() - cpu_seconds_before
+        wall_seconds = time.perf_counter() - wall_seconds_before
+        traced_peak_delta_bytes = (
+            tracemalloc.get_traced_memory()[1] - traced_memory_before
+            if tracemalloc.is_tracing()
+            else None
+        )
+        step_profiles_being_recorded.append(
+            StepProfile(
+                step=get_step_name(step_function, args),
+                la_shard=None,
+                wall_seconds=wall_seconds,
+                cpu_seconds=cpu_seconds,
+                rss_delta_bytes=process.memory_info().rss - rss_before,
+                traced_peak_delta_bytes=traced_peak_delta_bytes,
+                rows_before=rows_before,
+                columns_before=columns_before,
+                rows_after=processed_df_w_errs.df.shape[0],
+                columns_after=processed_df_w_errs.df.shape[1],
+                errors_added=processed_df_w_errs.get_number_of_errors()
+                - df_w_errs.get_number_of_errors(),
+            )
+        )
+        return processed_df_w_errs
+
+    return run_step_and_record_profile
+
+
+def get_step_name(step_function: Callable, step_args: tuple = ()) -> str:
+    """
+    The name of the function, or for a method of a validator (like validator.run_check), the validator's class too.
+    For a step given a list of validators (like run_validators_in_one_pass) the types of the validators are added,
+    so the steps checking different validators can be told apart
+    """
+    step_name = getattr(step_function, "__name__", repr(step_function))
+    if inspect.ismethod(step_function):
+        step_name = f"{type(step_function.__self__).__name__}.{step_name}"
+
+    validator_type_names = get_validator_type_names(step_args)
+    if validator_type_names:
+        step_name += f"[{','.join(validator_type_names)}]"
+    return step_name
+
+
+def get_validator_type_names(step_args: tuple) -> list[str]:
+    # Imported here, as the validators import df_with_errors.py, which imports this
+    from .validators.base_validator import BaseValidator
+
+    return sorted(
+        {
+            type(validator).__name__
+            for step_arg in step_args
+            if isinstance(step_arg, list)
+            for validator in step_arg
+            if isinstance(validator, BaseValidator)
+        }
+    )
+
+
+def get_step_profile_df(step_profiles: list[StepProfile]) -> pd.DataFrame:
+    return pd.DataFrame(step_profiles, columns=StepProfile._fields).astype(
+        # Float so that the values which aren't known are NaN, and so the table can be saved in a checkpoint
+        {"la_shard": float, "traced_peak_delta_bytes": float}
+    )
+
+
+def run_with_step_profile(
+    function: Callable[..., ReturnType],
+    *args,
+    trace_memory_allocations: bool = False,
+    **kwargs,
+) -> tuple[ReturnType, pd.DataFrame]:
+    """
+    Gives what the function returns, and the report of the steps it ran
+    """
+    with profile_steps(trace_memory_allocations) as step_profiles:
+        result = function(*args, **kwargs)
+    return result, get_step_profile_df(step_profiles)
+
+
+def warn_about_steps_that_regressed(
+    df_step_profile: pd.DataFrame, df_baseline_step_profile: pd.DataFrame = None
+) -> pd.DataFrame:
+    """
+    Logs a warning for each step that took much more time or memory than in the baseline (by default the report saved by the last run),
+    and gives those steps.
+
+    The steps are matched by name, with the runs of a step (like run_validators_in_one_pass, or a step run on each LA shard) added up.
+    Each measure is compared for each row the step was given,
+    so a baseline made from a different number of data returns can still be compared to.
+    """
+    if df_baseline_step_profile is None:
+        df_baseline_step_profile = load_baseline_step_profile()
+        if df_baseline_step_profile is None:
+            logging.info(
+                f"There is no step profile at {BASELINE_STEP_PROFILE_FILE_PATH} to compare this one to"
+            )
+            return df_step_profile.iloc[:0]
+
+    measures = list(MINIMUM_INCREASE_TO_WARN_ABOUT_BY_MEASURE)
+    df_total_by_step = df_step_profile.groupby("step", sort=False)[
+        measures + ["rows_before"]
+    ].sum()
+    df_baseline_total_by_step = (
+        df_baseline_step_profile.groupby("step", sort=False)[measures + ["rows_before"]]
+        .sum()
+        .reindex(df_total_by_step.index)
+    )
+
+    is_regression_by_step = pd.Series(False, index=df_total_by_step.index)
+    for measure, minimum_increase in MINIMUM_INCREASE_TO_WARN_ABOUT_BY_MEASURE.items():
+        expected_by_step = (
+            df_baseline_total_by_step[measure]
+            / df_baseline_total_by_step["rows_before"]
+            * df_total_by_step["rows_before"]
+        )
+        is_regression_of_measure_by_step = (
+            df_total_by_step[measure] > STEP_PROFILE_REGRESSION_RATIO * expected_by_step
+        ) & (df_total_by_step[measure] - expected_by_step >= minimum_increase)
+        for step in df_total_by_step.index[is_regression_of_measure_by_step]:
+            logging.warning(
+                f"The step {step} regressed: {measure} was {df_total_by_step.at[step, measure]:.6g}, "
+                f"against {expected_by_step[step]:.6g} for the same number of rows in the baseline"
+            )
+        is_regression_by_step |= is_regression_of_measure_by_step
+
+    return df_total_by_step[is_regression_by_step].reset_index()
+
+
+def load_baseline_step_profile() -> Optional[pd.DataFrame]:
+    """
+    None if there isn't one, or the last run saved the table without profiling the preprocessing
+    """
+    if not os.path.exists(BASELINE_STEP_PROFILE_FILE_PATH):
+        return None
+    df_baseline_step_profile = pd.read_csv(BASELINE_STEP_PROFILE_FILE_PATH, index_col=0)
+    if "step" not in df_baseline_step_profile.columns:
+        return None
+    return df_baseline_step_profile
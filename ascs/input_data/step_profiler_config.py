@@ -0,0 +1,14 @@
+# Record how long each step of the validation and preprocessing takes, and how much memory it uses (see step_profiler.py).
+# The report is the "Preprocessing Step Profile" table
+PROFILE_PREPROCESSING_STEPS = False
+# Also record the most memory each step allocated (tracemalloc), which makes the steps a few times slower
+TRACE_MEMORY_ALLOCATIONS_WHEN_PROFILING = False
+# The report saved by the last run, which each new report is compared to
+BASELINE_STEP_PROFILE_FILE_PATH = "./outputs/preprocessing_step_profile.csv"
+# A step is warned about when it takes this many times as much, for each row, as it did in the baseline
+STEP_PROFILE_REGRESSION_RATIO = 1.5
+# and at least this much more, so the small differences between runs of quick steps aren't warned about
+MINIMUM_INCREASE_TO_WARN_ABOUT_BY_MEASURE = {
+    "wall_seconds": 1.0,
+    "rss_delta_bytes": 100_000_000,
+}
@@ -2,7 +2,7 @@ from typing import Union
 import pandas as pd
 import numpy as np
 
-from ..df_with_errors import DFWithErrors
+from ..df_with_errors import ERROR_DF_ID_COLUMNS, DFWithErrors
 
 
 class BaseValidator:
@@ -51,6 +51,25 @@ class BaseValidator:
         """
         raise NotImplementedError()
 
+    @classmethod
+    def get_where_incorrect_for_validators(
+        cls, df_questionnaire_by_person: pd.DataFrame, validators: list["BaseValidator"]
+    ) -> list[pd.Series]:
+        """
+        get_where_incorrect for each of the validators (all of this type), see fused_validation.py.
+        Validators that can check all their columns at once do that instead.
+        """
+        return [
+            validator.get_where_incorrect(df_questionnaire_by_person)
+            for validator in validators
+        ]
+
+    def get_columns_read(self) -> list[str]:
+        """
+        The columns get_where_incorrect and get_error_message use
+        """
+        return self.columns_to_set_null_for_invalid_rows
+
     def get_error_df(
         self, df_questionnaire_by_person: pd.DataFrame, incorrect_by_person: pd.Series
     ) -> pd.DataFrame:
@@ -65,9 +84,7 @@ class BaseValidator:
     def get_rows_and_columns_of_questionnaire_needed_in_error_df(
         self, df_questionnaire_by_person: pd.DataFrame, incorrect_by_person: pd.Series
     ) -> pd.DataFrame:
-        return df_questionnaire_by_person.loc[
-            incorrect_by_person, ["LaCode", "PrimaryKey", "SerialNo"]
-        ]
+        return df_questionnaire_by_person.loc[incorrect_by_person, ERROR_DF_ID_COLUMNS]
 
     def get_error_message(
         self, df_questionnaire_by_person: pd.DataFrame
@@ -76,4 +93,3 @@ class BaseValidator:
         Return a human readable error message describing the problem (for the rows with a problem)
         """
         raise NotImplementedError()
-
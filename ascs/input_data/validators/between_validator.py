@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 
 from typing import Optional
 from ..df_with_errors import DFWithErrors
 
 from .base_validator import BaseValidator
+from .fused_validation import get_values_of_numeric_columns, run_validators_in_one_pass
 
 from ascs import params
 
@@ -12,17 +14,27 @@ def run_all_between_validations(
     df_questionnaire_w_errs: DFWithErrors,
     acceptable_range_by_column: Optional[dict[str, list[int, int]]] = None,
 ) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        get_all_between_validators(acceptable_range_by_column),
+    )
+
+
+def get_all_between_validators(
+    acceptable_range_by_column: Optional[dict[str, list[int, int]]] = None,
+) -> list[BaseValidator]:
     if acceptable_range_by_column is None:
         acceptable_range_by_column = params.DATA_RETURN.ACCEPTABLE_RANGE
 
-    for (column_name, (lower_limit, upper_limit)) in acceptable_range_by_column.items():
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            BetweenValidator(
-                column=column_name, lower_limit=lower_limit, upper_limit=upper_limit
-            )
+    return [
+        BetweenValidator(
+            column=column_name, lower_limit=lower_limit, upper_limit=upper_limit
         )
-
-    return df_questionnaire_w_errs
+        for (
+            column_name,
+            (lower_limit, upper_limit),
+        ) in acceptable_range_by_column.items()
+    ]
 
 
 class BetweenValidator(BaseValidator):
@@ -45,6 +57,29 @@ class BetweenValidator(BaseValidator):
         )
         return ~(column_between_values_by_person | column_series.isna())
 
+    @classmethod
+    def get_where_incorrect_for_validators(
+        cls, df_questionnaire_by_person: pd.DataFrame, validators: list[BaseValidator]
+    ) -> list[pd.Series]:
+        values = get_values_of_numeric_columns(
+            df_questionnaire_by_person, [validator.column for validator in validators]
+        )
+        if values is None:
+            return super().get_where_incorrect_for_validators(
+                df_questionnaire_by_person, validators
+            )
+
+        lower_limits = np.array([validator.lower_limit for validator in validators])
+        upper_limits = np.array([validator.upper_limit for validator in validators])
+        with np.errstate(invalid="ignore"):
+            between_values = (values >= lower_limits) & (values <= upper_limits)
+
+        incorrect = ~(between_values | np.isnan(values))
+        return [
+            pd.Series(incorrect[:, i], index=df_questionnaire_by_person.index)
+            for i in range(len(validators))
+        ]
+
     def get_error_message(self, df_questionnaire_by_person: pd.DataFrame) -> pd.Series:
         return (
             f"Column {self.column} was "
@@ -4,6 +4,7 @@ from typing import Any, Optional
 from ..df_with_errors import DFWithErrors
 
 from .base_validator import BaseValidator
+from .fused_validation import run_validators_in_one_pass
 
 from ascs import params
 
@@ -12,20 +13,29 @@ def run_all_column_should_be_certain_value_for_non_respondents_validations(
     df_questionnaire_w_errs: DFWithErrors,
     columns_that_should_be_no_for_non_respondents: Optional[list[str]] = None,
 ) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        get_all_column_should_be_certain_value_for_non_respondents_validators(
+            columns_that_should_be_no_for_non_respondents
+        ),
+    )
+
+
+def get_all_column_should_be_certain_value_for_non_respondents_validators(
+    columns_that_should_be_no_for_non_respondents: Optional[list[str]] = None,
+) -> list[BaseValidator]:
     if columns_that_should_be_no_for_non_respondents is None:
         columns_that_should_be_no_for_non_respondents = (
             params.VALIDATION_COLUMNS_THAT_SHOULD_BE_NO_FOR_NON_RESPONDENTS
         )
 
-    for column_name in columns_that_should_be_no_for_non_respondents:
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            ColumnShouldBeCertainValueForNonRespondentsValidator(
-                column=column_name,
-                the_value_the_column_should_be_when_person_didnt_respond=params.ANSWERED_NO_TO_SUBQUESTION_RESPONSE,
-            )
+    return [
+        ColumnShouldBeCertainValueForNonRespondentsValidator(
+            column=column_name,
+            the_value_the_column_should_be_when_person_didnt_respond=params.ANSWERED_NO_TO_SUBQUESTION_RESPONSE,
         )
-
-    return df_questionnaire_w_errs
+        for column_name in columns_that_should_be_no_for_non_respondents
+    ]
 
 
 class ColumnShouldBeCertainValueForNonRespondentsValidator(BaseValidator):
@@ -52,5 +62,8 @@ class ColumnShouldBeCertainValueForNonRespondentsValidator(BaseValidator):
             & ~column_is_the_value_column_should_be_for_non_respondents
         )
 
+    def get_columns_read(self) -> list[str]:
+        return [self.column, "Response"]
+
     def get_error_message(self, df_questionnaire_by_person: pd.DataFrame) -> str:
         return f"Column {self.column} must be {self.the_value_the_column_should_be_when_person_didnt_respond} when the person did not respond to the questionnaire"
@@ -1,9 +1,11 @@
+import numpy as np
 import pandas as pd
 
 from typing import Optional
 from ..df_with_errors import DFWithErrors
 
 from .base_validator import BaseValidator
+from .fused_validation import run_validators_in_one_pass
 
 from ascs import params
 
@@ -12,17 +14,26 @@ def run_all_column_should_be_null_for_non_respondents_validations(
     df_questionnaire_w_errs: DFWithErrors,
     columns_that_should_be_null: Optional[list[str]] = None,
 ) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        get_all_column_should_be_null_for_non_respondents_validators(
+            columns_that_should_be_null
+        ),
+    )
+
+
+def get_all_column_should_be_null_for_non_respondents_validators(
+    columns_that_should_be_null: Optional[list[str]] = None,
+) -> list[BaseValidator]:
     if columns_that_should_be_null is None:
         columns_that_should_be_null = (
             params.get_input_columns_that_should_be_null_for_non_respondents_for_validations()
         )
 
-    for column_name in columns_that_should_be_null:
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            ColumnShouldBeNullForNonRespondentsValidator(column=column_name)
-        )
-
-    return df_questionnaire_w_errs
+    return [
+        ColumnShouldBeNullForNonRespondentsValidator(column=column_name)
+        for column_name in columns_that_should_be_null
+    ]
 
 
 class ColumnShouldBeNullForNonRespondentsValidator(BaseValidator):
@@ -36,6 +47,28 @@ class ColumnShouldBeNullForNonRespondentsValidator(BaseValidator):
         )
         return person_didnt_respond_to_survey & ~questionnaire_data[self.column].isna()
 
+    @classmethod
+    def get_where_incorrect_for_validators(
+        cls, questionnaire_data: pd.DataFrame, validators: list[BaseValidator]
+    ) -> list[pd.Series]:
+        person_didnt_respond_to_survey = (
+            questionnaire_data["Response"] != params.RESPONSE_RESPONDED_TO_SURVEY
+        ).to_numpy()
+        not_null = (
+            questionnaire_data[[validator.column for validator in validators]]
+            .notna()
+            .to_numpy()
+        )
+
+        incorrect = person_didnt_respond_to_survey[:, np.newaxis] & not_null
+        return [
+            pd.Series(incorrect[:, i], index=questionnaire_data.index)
+            for i in range(len(validators))
+        ]
+
+    def get_columns_read(self) -> list[str]:
+        return [self.column, "Response"]
+
     def get_error_message(self, df_questionnaire_by_person: pd.DataFrame) -> pd.Series:
         return (
             f"Column {self.column} was "
@@ -5,6 +5,7 @@ from typing import Optional
 from ..df_with_errors import DFWithErrors
 
 from .base_validator import BaseValidator
+from .fused_validation import run_validators_in_one_pass
 
 from ascs import params
 
@@ -13,15 +14,20 @@ def run_all_easy_read_validations(
     df_questionnaire_w_errs: DFWithErrors,
     easy_read_questions: Optional[list[str]] = None,
 ) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass, get_all_easy_read_validators(easy_read_questions)
+    )
+
+
+def get_all_easy_read_validators(
+    easy_read_questions: Optional[list[str]] = None,
+) -> list[BaseValidator]:
     if easy_read_questions is None:
         easy_read_questions = params.EASY_READ_QUESTIONS
 
-    for column_name in params.EASY_READ_QUESTIONS:
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            EasyReadValidator(column=column_name)
-        )
-
-    return df_questionnaire_w_errs
+    return [
+        EasyReadValidator(column=column_name) for column_name in easy_read_questions
+    ]
 
 
 class EasyReadValidator(BaseValidator):
@@ -51,6 +57,9 @@ class EasyReadValidator(BaseValidator):
             | (is_in_standard_accepted_values_by_person & ~is_er_by_person)
         )
 
+    def get_columns_read(self) -> list[str]:
+        return [self.column, "is_easy_read"]
+
     def get_error_message(self, df_questionnaire_by_person: pd.DataFrame) -> pd.Series:
         return (
             f"Column {self.column} was "
@@ -0,0 +1,163 @@
+from collections import defaultdict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..df_with_errors import (
+    ERROR_DF_ID_COLUMNS,
+    DeferredErrors,
+    DFWithErrors,
+    get_rows_and_columns,
+)
+from .base_validator import BaseValidator
+
+
+def run_validators_in_one_pass(
+    df_questionnaire_by_person: pd.DataFrame, validators: list[BaseValidator]
+) -> DFWithErrors:
+    """
+    Gives the same DataFrame and errors (in the same order) as running the validators one after another
+    with run_check, but checks them together rather than each scanning the DataFrame and setting its own nulls.
+
+    A validator has to see the nulls set by the validators before it,
+    so the validators are split into blocks where no validator reads a column an earlier one in the block sets null.
+    For each block, the validators of each type check all their columns at once (see get_where_incorrect_for_validators),
+    the errors are kept as DeferredErrors (the invalid rows and the values the validator read),
+    and the invalid cells are set null in one go.
+    The error DataFrames are made from the DeferredErrors when the errors are concatenated.
+    """
+    assert not any(
+        set(validator.columns_to_set_null_for_invalid_rows) & set(ERROR_DF_ID_COLUMNS)
+        for validator in validators
+    ), "The DeferredErrors take the columns in every error DataFrame from the DataFrame at the end, so they can't be set null"
+
+    error_dfs: list[DeferredErrors] = []
+    for independent_validators in split_validators_into_independent_blocks(validators):
+        (
+            df_questionnaire_by_person,
+            error_dfs_from_block,
+        ) = run_independent_validators(
+            df_questionnaire_by_person, independent_validators
+        )
+        error_dfs.extend(error_dfs_from_block)
+
+    return DFWithErrors(df=df_questionnaire_by_person, error_dfs=error_dfs)
+
+
+def split_validators_into_independent_blocks(
+    validators: list[BaseValidator],
+) -> list[list[BaseValidator]]:
+    blocks: list[list[BaseValidator]] = []
+    columns_set_null_in_block: set[str] = set()
+
+    for validator in validators:
+        columns_read = set(validator.get_columns_read())
+        if not blocks or columns_read & columns_set_null_in_block:
+            blocks.append([])
+            columns_set_null_in_block = set()
+
+        blocks[-1].append(validator)
+        columns_set_null_in_block.update(validator.columns_to_set_null_for_invalid_rows)
+
+    return blocks
+
+
+def run_independent_validators(
+    df_questionnaire_by_person: pd.DataFrame, validators: list[BaseValidator]
+) -> tuple[pd.DataFrame, list[DeferredErrors]]:
+    incorrect_by_person_by_validator = get_where_incorrect_by_validator(
+        df_questionnaire_by_person, validators
+    )
+
+    error_dfs: list[DeferredErrors] = []
+    incorrect_by_person_by_column_to_set_null: dict[str, pd.Series] = {}
+
+    for validator, incorrect_by_person in zip(
+        validators, incorrect_by_person_by_validator
+    ):
+        # Added even when there are no errors, so every run gives one DeferredErrors for each validator,
+        # and the errors of the LA shards can be merged validator by validator (see la_shards.py)
+        incorrect_row_numbers = np.flatnonzero(incorrect_by_person)
+        error_dfs.append(
+            DeferredErrors(
+                validator=validator,
+                row_numbers=incorrect_row_numbers,
+                df_values_read=get_rows_and_columns(
+                    df_questionnaire_by_person,
+                    incorrect_row_numbers,
+                    validator.get_columns_read(),
+                ),
+            )
+        )
+
+        if len(incorrect_row_numbers) == 0:
+            continue
+
+        for column_name in validator.columns_to_set_null_for_invalid_rows:
+            incorrect_by_person_by_column_to_set_null[column_name] = incorrect_by_person
+
+    if incorrect_by_person_by_column_to_set_null:
+        df_questionnaire_by_person = set_incorrect_to_nan_at_end_of_block(
+            df_questionnaire_by_person, incorrect_by_person_by_column_to_set_null
+        )
+
+    return df_questionnaire_by_person, error_dfs
+
+
+def set_incorrect_to_nan_at_end_of_block(
+    df_questionnaire_by_person: pd.DataFrame,
+    incorrect_by_person_by_column: dict[str, pd.Series],
+) -> pd.DataFrame:
+    """
+    Setting each column's invalid cells null in place is quicker than replacing all the columns at once,
+    which makes pandas copy the rest of the DataFrame
+    """
+    for column_name, incorrect_by_person in incorrect_by_person_by_column.items():
+        df_questionnaire_by_person.loc[incorrect_by_person, [column_name]] = np.nan
+
+    return df_questionnaire_by_person
+
+
+def get_values_of_numeric_columns(
+    df_questionnaire_by_person: pd.DataFrame, column_names: list[str]
+) -> Optional[np.ndarray]:
+    """
+    The columns as one 2D float array (one column for each column name), for validators that check them all at once.
+    None if any of them isn't a number column (or is a boolean one), as they are then checked one at a time.
+    """
+    if not all(
+        pd.api.types.is_numeric_dtype(df_questionnaire_by_person[column_name])
+        and not pd.api.types.is_bool_dtype(df_questionnaire_by_person[column_name])
+        for column_name in column_names
+    ):
+        return None
+
+    return df_questionnaire_by_person[column_names].to_numpy(dtype=float)
+
+
+def get_where_incorrect_by_validator(
+    df_questionnaire_by_person: pd.DataFrame, validators: list[BaseValidator]
+) -> list[pd.Series]:
+    """
+    In the same order as the validators
+    """
+    positions_by_validator_type = defaultdict(list)
+    for position, validator in enumerate(validators):
+        positions_by_validator_type[type(validator)].append(position)
+
+    incorrect_by_person_by_position: dict[int, pd.Series] = {}
+    for validator_type, positions in positions_by_validator_type.items():
+        incorrect_by_person_by_position.update(
+            zip(
+                positions,
+                validator_type.get_where_incorrect_for_validators(
+                    df_questionnaire_by_person,
+                    [validators[position] for position in positions],
+                ),
+            )
+        )
+
+    return [
+        incorrect_by_person_by_position[position] for position in range(len(validators))
+    ]
@@ -5,6 +5,7 @@ from typing import Any, Optional
 from ..df_with_errors import DFWithErrors
 
 from .base_validator import BaseValidator
+from .fused_validation import run_validators_in_one_pass
 
 from ascs import params
 
@@ -16,21 +17,27 @@ def run_all_is_in_validations_for_demographic_columns(
     """
     Checks the demographic columns have the values listed in params.DEMOGRAPHICS_CONVERSIONS
     """
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        get_all_is_in_validators_for_demographic_columns(demographics_coversions),
+    )
+
+
+def get_all_is_in_validators_for_demographic_columns(
+    demographics_coversions: Optional[dict[str, dict[int, Any]]] = None,
+) -> list[BaseValidator]:
     if demographics_coversions is None:
         demographics_coversions = params.DEMOGRAPHICS_CONVERSIONS
 
-    for demog_column_name, demog_conversions in demographics_coversions.items():
-        if demog_column_name == "Stratum":
-            continue  # Stratum is a derived column, no need to check it
-
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            IsInValidator(
-                column=demog_column_name,
-                accepted_values=list(demog_conversions.keys()) + [np.nan],
-            )
+    return [
+        IsInValidator(
+            column=demog_column_name,
+            accepted_values=list(demog_conversions.keys()) + [np.nan],
         )
-
-    return df_questionnaire_w_errs
+        for demog_column_name, demog_conversions in demographics_coversions.items()
+        # Stratum is a derived column, no need to check it
+        if demog_column_name != "Stratum"
+    ]
 
 
 class IsInValidator(BaseValidator):
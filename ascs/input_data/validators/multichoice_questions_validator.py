@@ -6,6 +6,7 @@ from ..df_with_errors import DFWithErrors
 from ascs.params_utils.params_transformations import get_questions_with_all_suffixes
 
 from .base_validator import BaseValidator
+from .fused_validation import run_validators_in_one_pass
 
 from ascs import params
 
@@ -14,24 +15,29 @@ def run_all_multichoice_validations(
     df_questionnaire_w_errs: DFWithErrors,
     multichoice_questions: Optional[dict[str, list[str]]] = None,
 ) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        get_all_multichoice_validators(multichoice_questions),
+    )
+
+
+def get_all_multichoice_validators(
+    multichoice_questions: Optional[dict[str, list[str]]] = None,
+) -> list[BaseValidator]:
     if multichoice_questions is None:
         multichoice_questions = params.MULTIPLE_CHOICE_QUESTIONS
 
-    for (
-        multichoice_question,
-        multichoice_subquestions_unexpanded,
-    ) in multichoice_questions.items():
-        multichoice_subquestions_expanded = get_questions_with_all_suffixes(
-            [multichoice_question], multichoice_subquestions_unexpanded
-        )
-
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            MultichoiceQuestionsValidator(
-                sub_questions=multichoice_subquestions_expanded
+    return [
+        MultichoiceQuestionsValidator(
+            sub_questions=get_questions_with_all_suffixes(
+                [multichoice_question], multichoice_subquestions_unexpanded
             )
         )
-
-    return df_questionnaire_w_errs
+        for (
+            multichoice_question,
+            multichoice_subquestions_unexpanded,
+        ) in multichoice_questions.items()
+    ]
 
 
 class MultichoiceQuestionsValidator(BaseValidator):
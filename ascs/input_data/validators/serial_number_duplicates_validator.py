@@ -13,6 +13,9 @@ class SerialNumberDuplicatesValidator(BaseValidator):
             subset=["LaCode", "SerialNo"], keep=False
         )
 
+    def get_columns_read(self) -> list[str]:
+        return ["LaCode", "SerialNo"]
+
     def get_error_message(self, df_questionnaire_by_person: pd.DataFrame) -> pd.Series:
         return (
             "serial number "
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from typing import Optional
@@ -6,22 +7,28 @@ from ..df_with_errors import DFWithErrors
 from ..preprocess_utilities import get_numeric_columns_from_df_questionnaire_by_person
 
 from .base_validator import BaseValidator
+from .fused_validation import get_values_of_numeric_columns, run_validators_in_one_pass
 
 
 def run_all_whole_number_validations(
     df_questionnaire_w_errs: DFWithErrors, numeric_columns: Optional[list[str]] = None,
 ) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        get_all_whole_number_validators(df_questionnaire_w_errs.df, numeric_columns),
+    )
+
+
+def get_all_whole_number_validators(
+    df_questionnaire_by_person: pd.DataFrame,
+    numeric_columns: Optional[list[str]] = None,
+) -> list[BaseValidator]:
     if numeric_columns is None:
         numeric_columns = get_numeric_columns_from_df_questionnaire_by_person(
-            df_questionnaire_w_errs.df
-        )
-
-    for column_name in numeric_columns:
-        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(
-            WholeNumberValidator(column=column_name)
+            df_questionnaire_by_person
         )
 
-    return df_questionnaire_w_errs
+    return [WholeNumberValidator(column=column_name) for column_name in numeric_columns]
 
 
 class WholeNumberValidator(BaseValidator):
@@ -39,6 +46,24 @@ class WholeNumberValidator(BaseValidator):
         )
         return ~column_is_whole_num_by_person
 
+    @classmethod
+    def get_where_incorrect_for_validators(
+        cls, df_questionnaire_by_person: pd.DataFrame, validators: list[BaseValidator]
+    ) -> list[pd.Series]:
+        values = get_values_of_numeric_columns(
+            df_questionnaire_by_person, [validator.column for validator in validators]
+        )
+        if values is None:
+            return super().get_where_incorrect_for_validators(
+                df_questionnaire_by_person, validators
+            )
+
+        incorrect = ~((values == np.round(values)) | np.isnan(values))
+        return [
+            pd.Series(incorrect[:, i], index=df_questionnaire_by_person.index)
+            for i in range(len(validators))
+        ]
+
     def get_error_message(self, df_questionnaire_by_person: pd.DataFrame) -> pd.Series:
         return (
             f"Column {self.column} was "
@@ -30,8 +30,9 @@ def get_sample_population_by_how_responded(
     df_questionnaire_by_person: pd.DataFrame, column_to_split_by: str
 ) -> pd.Series:
     return (
-        df_questionnaire_by_person.groupby(column_to_split_by)
+        df_questionnaire_by_person.groupby(column_to_split_by, observed=True)
         .size()
+        .sort_index()
         .rename("population")
     )
 
@@ -42,6 +42,10 @@ def do_all_dictionary_keys_to_integer_conversions(params_dict: dict) -> dict:
         }
         for simple_conversion_dict in params_dict["ASCOF_CONVERSIONS"]
     ]
+    params_dict["ASCOF_1J_CONVERSIONS"] = {
+        question: convert_dictionary_keys_to_integers(conversion)
+        for question, conversion in params_dict["ASCOF_1J_CONVERSIONS"].items()
+    }
     return params_dict
 
 
@@ -95,6 +95,7 @@ class Params(BaseModel):
     VALIDATION_COLUMNS_THAT_SHOULD_BE_NO_FOR_NON_RESPONDENTS: list[str]
     DATA_RETURN: DataReturnParams
     ASCOF_CONVERSIONS: list[SimpleAscofConversion]
+    ASCOF_1J_CONVERSIONS: dict[str, dict[int, float]]
 
     def run_validations(self):
         self.check_column_responses_by_question_is_in_order()
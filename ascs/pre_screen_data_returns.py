@@ -0,0 +1,34 @@
+import logging
+import timeit
+
+from ascs.input_data.load_data_returns.pre_screen import pre_screen_all_data_returns
+from ascs.menu import choose_which_params_file_to_use
+from ascs.utilities.save_to_file import save_all_tables_to_csv
+from ascs.utilities.setup_logging import setup_logging
+
+
+PRE_SCREEN_OUTPUT_TABLE_NAME = "pre_screen_errors_loading_data_returns"
+
+
+def main() -> None:
+    """
+    Checks the layout of every data return (without loading them) and saves the problems to the outputs folder
+    """
+    setup_logging()
+
+    choose_which_params_file_to_use()
+
+    start_time = timeit.default_timer()
+
+    df_pre_screen_error_by_file = pre_screen_all_data_returns()
+
+    save_all_tables_to_csv({PRE_SCREEN_OUTPUT_TABLE_NAME: df_pre_screen_error_by_file})
+
+    total_time = timeit.default_timer() - start_time
+    logging.info(
+        f"Running time of pre_screen_data_returns: {round(total_time)} seconds."
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import pandas as pd
 
+from ascs import params
 from ascs.input_data.data_needed_for_table_creation import DataNeededForTableCreation
+from ascs.input_data.input_columns_needed import (
+    get_input_question_columns_needed_for_columns,
+)
 
 from .response_rate_by_la import create_response_rate_by_la_table
 from .response_rate_by_average_group import add_response_rate_by_average_group
@@ -23,3 +27,9 @@ def create_response_rate_by_area_table(
     )
 
     return {"4": df_response_rate_by_area}
+
+
+def get_input_question_columns_needed_for_response_rate_by_area_table() -> list[str]:
+    return get_input_question_columns_needed_for_columns(
+        params.ANNEX_TABLE_4_QUESTIONS_TO_COUNT + ["q2c"]
+    )
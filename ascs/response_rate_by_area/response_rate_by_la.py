@@ -48,8 +48,9 @@ def calc_question_response_rate_by_la(
         df_questionnaire_by_person.pipe(
             filter_out_people_who_didnt_respond_to_the_overall_questionnaire
         )
-        .groupby("LaCode")[questions_to_count]
+        .groupby("LaCode", observed=True)[questions_to_count]
         .apply(calc_proportion_of_series_that_is_null)
+        .sort_index()
     )
 
 
@@ -63,13 +64,13 @@ def calc_total_response_rate_column(
     """
     This adds a column that for each LA has the percentage of people who responded to the overall questionnaire
     """
-    annex_table4["total_response_rate"] = df_questionnaire_by_person.groupby("LaCode")[
-        "Response"
-    ].apply(
+    annex_table4["total_response_rate"] = df_questionnaire_by_person.groupby(
+        "LaCode", observed=True
+    )["Response"].apply(
         lambda responses_in_la: (
             responses_in_la == params.RESPONSE_RESPONDED_TO_SURVEY
         ).sum()
         / len(responses_in_la)
-    )
+    ).sort_index()
 
     return annex_table4
@@ -40,9 +40,9 @@ def create_admin_data_table(
 def calculate_proportion_missing_in_columns_by_la(
     df_specific_annex_table: pd.DataFrame,
 ) -> pd.DataFrame:
-    df_grouped_by_la = df_specific_annex_table.groupby("LaCode")
+    df_grouped_by_la = df_specific_annex_table.groupby("LaCode", observed=True)
     proportions = 1 - (df_grouped_by_la.count().divide(df_grouped_by_la.size(), axis=0))
-    return proportions
+    return proportions.sort_index()
 
 
 def format_output(df_input) -> pd.DataFrame:
@@ -9,9 +9,10 @@ def create_eligible_population_questionnaire_data_disparity_dq_table(
 ) -> dict[str, pd.DataFrame]:
     actual_sample_population = (
         data_needed_for_table_creation.df_questionnaire_by_person.groupby(
-            ["LaCode", "Stratum"]
+            ["LaCode", "Stratum"], observed=True
         )
         .size()
+        .sort_index()
         .rename("actual_sample_population")
     )
     expected_sample_population = (
@@ -17,6 +17,38 @@ def get_dq_errors_loading_validating(
     }
 
 
+def get_ingest_telemetry(
+    data_needed_for_table_creation: DataNeededForTableCreation,
+) -> dict[str, pd.DataFrame]:
+    df_ingest_telemetry_by_file = (
+        data_needed_for_table_creation.df_ingest_telemetry_by_file
+    )
+    return {
+        "ingest_telemetry_by_file": df_ingest_telemetry_by_file
+        if df_ingest_telemetry_by_file is not None
+        else pd.DataFrame([["No ingest telemetry was saved with this checkpoint"]])
+    }
+
+
+def get_preprocessing_step_profile(
+    data_needed_for_table_creation: DataNeededForTableCreation,
+) -> dict[str, pd.DataFrame]:
+    df_preprocessing_profile_by_step = (
+        data_needed_for_table_creation.df_preprocessing_profile_by_step
+    )
+    return {
+        "preprocessing_step_profile": df_preprocessing_profile_by_step
+        if df_preprocessing_profile_by_step is not None
+        else pd.DataFrame(
+            [
+                [
+                    "The preprocessing wasn't profiled, turn on PROFILE_PREPROCESSING_STEPS in step_profiler_config.py"
+                ]
+            ]
+        )
+    }
+
+
 def get_cleaned_questionnaire(
     data_needed_for_table_creation: DataNeededForTableCreation,
 ) -> dict[str, pd.DataFrame]:
@@ -28,6 +60,14 @@ def get_cleaned_questionnaire(
 def get_unclean_questionnaire(
     data_needed_for_table_creation: DataNeededForTableCreation,
 ) -> dict[str, pd.DataFrame]:
+    df_questionnaire_unclean_by_person = (
+        data_needed_for_table_creation.df_questionnaire_unclean_by_person
+    )
     return {
-        "uncleaned_questionnaire": data_needed_for_table_creation.df_questionnaire_unclean_by_person
+        "uncleaned_questionnaire": df_questionnaire_unclean_by_person
+        if df_questionnaire_unclean_by_person is not None
+        # It isn't saved in the prepared data checkpoint
+        else pd.DataFrame(
+            [["Load the data returns checkpoint to output the uncleaned questionnaire"]]
+        )
     }
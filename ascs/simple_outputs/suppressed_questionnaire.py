@@ -27,7 +27,7 @@ def create_suppressed_questionnaire(
         columns_to_suppress = params.COLUMNS_TO_SUPPRESS_IN_QUESTIONNAIRE_CSV
 
     size_by_identifier_group = data_needed_for_table_creation.df_questionnaire_by_person.groupby(
-        identifier_cols, dropna=False,
+        identifier_cols, dropna=False, observed=True,
     ).size()
 
     should_suppress_by_identifier_group = (
@@ -40,6 +40,15 @@ def create_suppressed_questionnaire(
     ).astype(
         columns_to_change_type
     )
+    # The suppressed values aren't one of the categories of the categorical columns (like LaCode)
+    df_questionnaire_by_person = df_questionnaire_by_person.astype(
+        {
+            column_name: object
+            for column_name in df_questionnaire_by_person.select_dtypes(
+                "category"
+            ).columns
+        }
+    )
 
     df_questionnaire_by_person.loc[
         df_questionnaire_by_person["Should_Suppress"], columns_to_suppress
@@ -97,20 +97,23 @@ class Stratification:
     def get_number_of_respondents_that_responded_each_way_in_subgroup(
         self, df_questionnaire_by_person: pd.DataFrame
     ) -> pd.Series:
-        prop_by_subgroup_series = df_questionnaire_by_person.groupby(
-            self.get_subgroup_columns()
-        )["response"].value_counts(normalize=False, sort=False)
-
-        prop_by_subgroup_series.index.set_names("response", level=-1, inplace=True)
-
-        return prop_by_subgroup_series.reset_index(name="respondents")
+        # Counting the responses by grouping on them too, rather than with value_counts,
+        # leaves out the subgroups and responses nobody is in when the columns are categorical
+        return (
+            df_questionnaire_by_person.groupby(
+                self.get_subgroup_columns() + ["response"], observed=True
+            )
+            .size()
+            .sort_index()
+            .reset_index(name="respondents")
+        )
 
     def get_proportion_that_responded_each_way_in_subgroup(
         self, df_by_subgroup_response: pd.DataFrame
     ) -> pd.Series:
         df_by_subgroup_response["proportion"] = df_by_subgroup_response[
             "respondents"
-        ] / df_by_subgroup_response.groupby(self.get_subgroup_columns())[
+        ] / df_by_subgroup_response.groupby(self.get_subgroup_columns(), observed=True)[
             "respondents"
         ].transform(
             "sum"
@@ -184,9 +187,13 @@ class Stratification:
         Adding the subgroups (like males in LA 211 strat 1, males in LA 213 strat 3)
         in each bigger supergroup (males)
         """
-        return df_by_subgroup_response.groupby(self.supergroup_columns + ["response"])[
-            ["est_population", "variance", "respondents"]
-        ].sum()
+        return (
+            df_by_subgroup_response.groupby(
+                self.supergroup_columns + ["response"], observed=True
+            )[["est_population", "variance", "respondents"]]
+            .sum()
+            .sort_index()
+        )
 
     def calc_population_in_supergroup(
         self, df_by_supergroup_response: pd.DataFrame
@@ -195,7 +202,9 @@ class Stratification:
         if more_than_one_supergroup:
             df_by_supergroup_response[
                 "supergroup_population"
-            ] = df_by_supergroup_response.groupby(self.supergroup_columns)[
+            ] = df_by_supergroup_response.groupby(
+                self.supergroup_columns, observed=True
+            )[
                 "est_population"
             ].transform(
                 "sum"
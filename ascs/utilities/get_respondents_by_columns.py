@@ -34,4 +34,8 @@ def get_respondents_by_columns(
             | str/int | int |
             +---------+-----+
     """
-    return df_questionnaire_by_person.groupby(groupby_columns)[question].count()
+    return (
+        df_questionnaire_by_person.groupby(groupby_columns, observed=True)[question]
+        .count()
+        .sort_index()
+    )
@@ -0,0 +1,23 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from ascs import params
+
+
+def get_process_pool_with_current_params(
+    number_of_processes: Optional[int] = None,
+) -> ProcessPoolExecutor:
+    """
+    Each worker process imports ascs from scratch, so it would start with the startup params
+    rather than the params chosen in the menu (or patched in a test).
+    This pool copies the current params into every worker as it starts.
+    """
+    return ProcessPoolExecutor(
+        max_workers=number_of_processes,
+        initializer=set_params_in_worker_process,
+        initargs=(vars(params),),
+    )
+
+
+def set_params_in_worker_process(params_attributes: dict) -> None:
+    vars(params).update(params_attributes)
@@ -0,0 +1,23 @@
+import logging
+
+from ascs.input_data.load_data_returns.watch_folder import DataReturnsFolderWatcher
+from ascs.menu import choose_which_params_file_to_use
+from ascs.utilities.setup_logging import setup_logging
+
+
+def main() -> None:
+    """
+    Keeps the watched data returns checkpoint up to date until stopped with Ctrl+C
+    """
+    setup_logging()
+
+    choose_which_params_file_to_use()
+
+    try:
+        DataReturnsFolderWatcher().run()
+    except KeyboardInterrupt:
+        logging.info("Stopped watching the data returns")
+
+
+if __name__ == "__main__":
+    main()
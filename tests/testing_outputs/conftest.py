@@ -28,7 +28,7 @@ from ascs.response_rate_by_area.response_rate_by_area import (
 from ascs.simple_outputs.demographics_table import create_demographics_table
 from ascs.simple_outputs.admin_data_table import create_admin_data_table
 
-from ascs.create_publication import (
+from ascs.input_data.get_data_needed_for_table_creation import (
     get_data_needed_for_table_creation_from_loaded_data_returns,
 )
 from ascs.input_data.load_data_returns.load_excel import (
@@ -76,3 +76,176 @@ def test_load_data_returns_from_checkpoint(tmp_path: pathlib.Path):
     pd.testing.assert_frame_equal(
         loaded_data_returns.df_loading_error_by_file, df_loading_error_by_file_to_save
     )
+
+
+def test_checkpoint_keeps_ingest_telemetry(tmp_path: pathlib.Path):
+    df_ingest_telemetry_by_file_to_save = pd.DataFrame(
+        {"file_path": ["a.xlsx", "b.xlsx"], "parse_seconds": [0.5, np.nan]}
+    )
+    checkpoint_data_to_save = LoadedDataReturns(
+        pd.DataFrame({"col_1": [1, 2]}),
+        pd.DataFrame([["No errors while loading files!"]]),
+        df_ingest_telemetry_by_file_to_save,
+    )
+
+    checkpoint_file_handler.save_data_return_checkpoint(
+        checkpoint_data_to_save, tmp_path, checkpoint_filename="test.h5"
+    )
+    loaded_data_returns = checkpoint_file_handler.load_data_returns_from_checkpoint(
+        str(tmp_path / "test.h5")
+    )
+
+    pd.testing.assert_frame_equal(
+        loaded_data_returns.df_ingest_telemetry_by_file,
+        df_ingest_telemetry_by_file_to_save,
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_csv(tmp_path / "test_ingest_telemetry.csv"),
+        df_ingest_telemetry_by_file_to_save,
+    )
+
+
+def test_load_data_returns_from_checkpoint__without_ingest_telemetry(
+    tmp_path: pathlib.Path,
+):
+    checkpoint_file_handler.save_data_return_checkpoint(
+        LoadedDataReturns(
+            pd.DataFrame({"col_1": [1, 2]}),
+            pd.DataFrame([["No errors while loading files!"]]),
+        ),
+        tmp_path,
+        checkpoint_filename="test.h5",
+    )
+
+    loaded_data_returns = checkpoint_file_handler.load_data_returns_from_checkpoint(
+        str(tmp_path / "test.h5")
+    )
+
+    assert loaded_data_returns.df_ingest_telemetry_by_file is None
+    assert os.listdir(tmp_path) == ["test.h5"]
+
+
+def test_save_data_return_checkpoint_in_background(tmp_path: pathlib.Path):
+    df_questionnaire_unclean_by_person = pd.DataFrame({"col_1": [1, 2]})
+    checkpoint_data_to_save = LoadedDataReturns(
+        df_questionnaire_unclean_by_person,
+        pd.DataFrame([["No errors while loading files!"]]),
+    )
+
+    checkpoint_file_handler.save_data_return_checkpoint_in_background(
+        checkpoint_data_to_save, tmp_path, checkpoint_filename="test.h5"
+    )
+    # Only the data as it was when the checkpoint was asked for is saved
+    df_questionnaire_unclean_by_person["col_2"] = [3, 4]
+    checkpoint_file_handler.wait_for_checkpoints_to_be_saved()
+
+    loaded_data_returns = checkpoint_file_handler.load_data_returns_from_checkpoint(
+        str(tmp_path / "test.h5")
+    )
+    pd.testing.assert_frame_equal(
+        loaded_data_returns.df_questionnaire_unclean_by_person,
+        pd.DataFrame({"col_1": [1, 2]}),
+    )
+    assert os.listdir(tmp_path) == ["test.h5"]
+
+
+def test_wait_for_checkpoints_to_be_saved__logs_errors(tmp_path: pathlib.Path, caplog):
+    (tmp_path / "not_a_directory").write_text("")
+
+    checkpoint_file_handler.save_data_return_checkpoint_in_background(
+        LoadedDataReturns(pd.DataFrame({"col_1": [1]}), pd.DataFrame([["None"]])),
+        tmp_path / "not_a_directory",
+    )
+    checkpoint_file_handler.wait_for_checkpoints_to_be_saved()
+
+    assert "Error saving the checkpoint" in caplog.text
+
+
+def test_save_data_return_checkpoint__arrow_round_trip(tmp_path: pathlib.Path):
+    df_questionnaire_unclean_by_person_to_save = pd.DataFrame(
+        {
+            "string_column": ["a", "b", None, "d"],
+            # Mixed numbers and text, as in a question with an invalid answer
+            "mixed_column": [1, "n/a", None, 4],
+            "number_column": [1.0, 2.0, np.nan, 4.0],
+        }
+    )
+    df_loading_error_by_file_to_save = pd.DataFrame(
+        [["No errors while loading files!"]]
+    )
+    df_ingest_telemetry_by_file_to_save = pd.DataFrame(
+        {"file_path": ["a.xlsx"], "file_size_bytes": [10.0]}
+    )
+
+    checkpoint_file_handler.save_data_return_checkpoint(
+        LoadedDataReturns(
+            df_questionnaire_unclean_by_person_to_save,
+            df_loading_error_by_file_to_save,
+            df_ingest_telemetry_by_file_to_save,
+        ),
+        tmp_path,
+        checkpoint_filename="test.arrow",
+    )
+    loaded_data_returns = checkpoint_file_handler.load_data_returns_from_checkpoint(
+        str(tmp_path / "test.arrow")
+    )
+
+    assert sorted(os.listdir(tmp_path)) == ["test.arrow", "test_ingest_telemetry.csv"]
+    pd.testing.assert_frame_equal(
+        loaded_data_returns.df_questionnaire_unclean_by_person,
+        df_questionnaire_unclean_by_person_to_save,
+    )
+    pd.testing.assert_frame_equal(
+        loaded_data_returns.df_loading_error_by_file, df_loading_error_by_file_to_save
+    )
+    pd.testing.assert_frame_equal(
+        loaded_data_returns.df_ingest_telemetry_by_file,
+        df_ingest_telemetry_by_file_to_save,
+    )
+
+
+def test_load_data_returns_from_checkpoint__only_loads_columns_asked_for(
+    tmp_path: pathlib.Path,
+):
+    df_questionnaire_unclean_by_person_to_save = pd.DataFrame(
+        {"a": [1, 2], "b": ["x", 3], "c": ["y", "z"]}
+    )
+    checkpoint_data_to_save = LoadedDataReturns(
+        df_questionnaire_unclean_by_person_to_save, pd.DataFrame({"d": [1]})
+    )
+
+    for checkpoint_filename in ["test.h5", "test.arrow"]:
+        checkpoint_file_handler.save_data_return_checkpoint(
+            checkpoint_data_to_save, tmp_path, checkpoint_filename=checkpoint_filename
+        )
+        loaded_data_returns = checkpoint_file_handler.load_data_returns_from_checkpoint(
+            str(tmp_path / checkpoint_filename), columns=["c", "b"]
+        )
+
+        pd.testing.assert_frame_equal(
+            loaded_data_returns.df_questionnaire_unclean_by_person,
+            df_questionnaire_unclean_by_person_to_save[["b", "c"]],
+        )
+
+
+def test_get_current_year_checkpoint_files__lists_both_formats(
+    tmp_path: pathlib.Path, monkeypatch
+):
+    monkeypatch.setattr(
+        checkpoint_file_handler, "CHECKPOINTS_DIRECTORY", str(tmp_path) + "/"
+    )
+    monkeypatch.setattr(checkpoint_file_handler.params, "PUBLICATION_YEAR", "2022")
+    checkpoint_data_to_save = LoadedDataReturns(
+        pd.DataFrame({"a": [1]}), pd.DataFrame({"d": [1]})
+    )
+    for checkpoint_filename in ["a.h5", "b.arrow"]:
+        checkpoint_file_handler.save_data_return_checkpoint(
+            checkpoint_data_to_save,
+            tmp_path / "2022",
+            checkpoint_filename=checkpoint_filename,
+        )
+
+    assert sorted(
+        pathlib.Path(file).name
+        for file in checkpoint_file_handler.get_current_year_checkpoint_files()
+    ) == ["a.h5", "b.arrow"]
@@ -0,0 +1,128 @@
+import pathlib
+
+import pytest
+
+import ascs
+from ascs import params
+from ascs.input_data.checkpoint.checkpoint_config import (
+    PREPARED_DATA_SOURCE_CODE_PATHS,
+    PREPARED_DATA_SOURCE_CODE_PATHS_LEFT_OUT,
+)
+from ascs.input_data.checkpoint.checkpoint_fingerprint import (
+    get_data_returns_fingerprint,
+    get_prepared_data_fingerprint,
+    get_source_code_hash,
+)
+
+
+@pytest.fixture
+def data_return_file_paths(tmp_path: pathlib.Path) -> list[str]:
+    data_return_file_paths = []
+    for file_name in ["a.xlsx", "b.xlsx"]:
+        (tmp_path / file_name).write_bytes(file_name.encode())
+        data_return_file_paths.append(str(tmp_path / file_name))
+    return data_return_file_paths
+
+
+@pytest.fixture
+def eligible_population_data_filename(tmp_path: pathlib.Path) -> str:
+    (tmp_path / "population.csv").write_text("LaCode,Population\n211,10\n")
+    return str(tmp_path / "population.csv")
+
+
+def test_get_data_returns_fingerprint__changes_with_the_data_returns(
+    data_return_file_paths: list[str],
+):
+    fingerprint = get_data_returns_fingerprint(data_return_file_paths)
+
+    assert get_data_returns_fingerprint(data_return_file_paths) == fingerprint
+    assert get_data_returns_fingerprint(data_return_file_paths[:1]) != fingerprint
+
+    pathlib.Path(data_return_file_paths[1]).write_bytes(b"changed")
+
+    assert get_data_returns_fingerprint(data_return_file_paths) != fingerprint
+
+
+def test_get_prepared_data_fingerprint__changes_with_population_data(
+    eligible_population_data_filename: str,
+):
+    fingerprint = get_prepared_data_fingerprint("1", eligible_population_data_filename)
+
+    assert get_prepared_data_fingerprint("2", eligible_population_data_filename) != (
+        fingerprint
+    )
+
+    pathlib.Path(eligible_population_data_filename).write_text("LaCode,Population\n")
+
+    assert get_prepared_data_fingerprint("1", eligible_population_data_filename) != (
+        fingerprint
+    )
+
+
+def test_get_prepared_data_fingerprint__changes_with_params_used_for_the_data(
+    eligible_population_data_filename: str, monkeypatch: pytest.MonkeyPatch
+):
+    fingerprint = get_prepared_data_fingerprint("1", eligible_population_data_filename)
+
+    monkeypatch.setattr(params, "OUTPUT_ANNEX_TABLE_FILE_NAME", "other.xlsx")
+
+    assert (
+        get_prepared_data_fingerprint("1", eligible_population_data_filename)
+        == fingerprint
+    )
+
+    monkeypatch.setattr(
+        params, "AGE_GROUP_BINS_START_AGES", params.AGE_GROUP_BINS_START_AGES + [100]
+    )
+
+    assert (
+        get_prepared_data_fingerprint("1", eligible_population_data_filename)
+        != fingerprint
+    )
+
+
+def test_get_source_code_hash__changes_with_the_code(tmp_path: pathlib.Path):
+    (tmp_path / "input_data").mkdir()
+    (tmp_path / "input_data" / "cleaning.py").write_text("x = 1\n")
+    (tmp_path / "input_data" / "notes.md").write_text("Not code\n")
+    (tmp_path / "average_rows.py").write_text("y = 2\n")
+    source_code_paths = ["input_data", "average_rows.py"]
+    source_code_hash = get_source_code_hash(tmp_path, source_code_paths)
+
+    (tmp_path / "input_data" / "notes.md").write_text("Changed\n")
+
+    assert get_source_code_hash(tmp_path, source_code_paths) == source_code_hash
+
+    (tmp_path / "input_data" / "cleaning.py").write_text("x = 2\n")
+
+    assert get_source_code_hash(tmp_path, source_code_paths) != source_code_hash
+
+
+def test_prepared_data_source_code_paths_exist():
+    ascs_directory = pathlib.Path(ascs.__file__).parent
+
+    for source_code_path in (
+        PREPARED_DATA_SOURCE_CODE_PATHS + PREPARED_DATA_SOURCE_CODE_PATHS_LEFT_OUT
+    ):
+        assert (ascs_directory / source_code_path).exists()
+
+
+def test_get_source_code_hash__not_changed_by_the_code_left_out(
+    tmp_path: pathlib.Path,
+):
+    (tmp_path / "stratification").mkdir()
+    (tmp_path / "stratification" / "stratification.py").write_text("x = 1\n")
+    (tmp_path / "write_outputs.py").write_text("y = 1\n")
+    source_code_hash = get_source_code_hash(tmp_path, ["."], ["write_outputs.py"])
+
+    (tmp_path / "write_outputs.py").write_text("y = 2\n")
+
+    assert (
+        get_source_code_hash(tmp_path, ["."], ["write_outputs.py"]) == source_code_hash
+    )
+
+    (tmp_path / "stratification" / "stratification.py").write_text("x = 2\n")
+
+    assert (
+        get_source_code_hash(tmp_path, ["."], ["write_outputs.py"]) != source_code_hash
+    )
@@ -0,0 +1,85 @@
+import pathlib
+
+import pandas as pd
+
+from ascs.input_data.checkpoint import checkpoint_file_handler
+from ascs.input_data.checkpoint.checkpoint_config import (
+    CHECKPOINT_INDEX_FILENAME,
+    DATA_RETURNS_CHECKPOINT_KIND,
+    PREPARED_DATA_CHECKPOINT_KIND,
+)
+from ascs.input_data.checkpoint.checkpoint_index import (
+    add_checkpoint_to_index,
+    find_checkpoint_in_index,
+    load_checkpoint_index,
+)
+from ascs.input_data.load_data_returns.data_return_config import LoadedDataReturns
+
+
+def test_find_checkpoint_in_index(tmp_path: pathlib.Path):
+    checkpoint_path = tmp_path / "prepared_data" / "a.pkl"
+    checkpoint_path.parent.mkdir()
+    checkpoint_path.write_bytes(b"")
+
+    assert (
+        find_checkpoint_in_index(tmp_path, PREPARED_DATA_CHECKPOINT_KIND, "1") is None
+    )
+
+    add_checkpoint_to_index(
+        tmp_path, PREPARED_DATA_CHECKPOINT_KIND, "1", checkpoint_path
+    )
+
+    assert (
+        find_checkpoint_in_index(tmp_path, PREPARED_DATA_CHECKPOINT_KIND, "1")
+        == checkpoint_path
+    )
+    assert (
+        find_checkpoint_in_index(tmp_path, PREPARED_DATA_CHECKPOINT_KIND, "2") is None
+    )
+    assert find_checkpoint_in_index(tmp_path, DATA_RETURNS_CHECKPOINT_KIND, "1") is None
+    assert load_checkpoint_index(tmp_path) == {
+        PREPARED_DATA_CHECKPOINT_KIND: {"1": "prepared_data/a.pkl"}
+    }
+
+
+def test_add_checkpoint_to_index__forgets_deleted_checkpoints(tmp_path: pathlib.Path):
+    for checkpoint_filename, fingerprint in [("a.h5", "1"), ("b.h5", "2")]:
+        (tmp_path / checkpoint_filename).write_bytes(b"")
+        add_checkpoint_to_index(
+            tmp_path,
+            DATA_RETURNS_CHECKPOINT_KIND,
+            fingerprint,
+            tmp_path / checkpoint_filename,
+        )
+    (tmp_path / "a.h5").unlink()
+
+    assert find_checkpoint_in_index(tmp_path, DATA_RETURNS_CHECKPOINT_KIND, "1") is None
+
+    (tmp_path / "c.h5").write_bytes(b"")
+    add_checkpoint_to_index(
+        tmp_path, DATA_RETURNS_CHECKPOINT_KIND, "3", tmp_path / "c.h5"
+    )
+
+    assert load_checkpoint_index(tmp_path) == {
+        DATA_RETURNS_CHECKPOINT_KIND: {"2": "b.h5", "3": "c.h5"}
+    }
+
+
+def test_load_checkpoint_index__ignores_an_unreadable_index(tmp_path: pathlib.Path):
+    (tmp_path / CHECKPOINT_INDEX_FILENAME).write_text("{not json")
+
+    assert load_checkpoint_index(tmp_path) == {}
+
+
+def test_save_data_return_checkpoint__adds_it_to_the_index(tmp_path: pathlib.Path):
+    checkpoint_file_handler.save_data_return_checkpoint(
+        LoadedDataReturns(pd.DataFrame({"a": [1]}), pd.DataFrame({"b": [1]})),
+        tmp_path,
+        checkpoint_filename="test.h5",
+        fingerprint="1",
+    )
+
+    assert (
+        find_checkpoint_in_index(tmp_path, DATA_RETURNS_CHECKPOINT_KIND, "1")
+        == tmp_path / "test.h5"
+    )
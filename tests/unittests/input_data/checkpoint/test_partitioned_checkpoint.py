@@ -0,0 +1,146 @@
+import pickle
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+from ascs.input_data.checkpoint import checkpoint_file_handler
+from ascs.input_data.checkpoint.partitioned_checkpoint import (
+    MANIFESTS_DIRECTORY_NAME,
+    PARTITIONS_DIRECTORY_NAME,
+    compact_partitioned_checkpoint,
+    get_manifest_paths,
+    get_partition_file_name,
+)
+from ascs.input_data.load_data_returns.data_return_config import LoadedDataReturns
+
+CHECKPOINT_FILENAME = "data_returns.partitioned"
+
+
+def get_loaded_data_returns(answers_of_la_212: list) -> LoadedDataReturns:
+    return LoadedDataReturns(
+        pd.DataFrame(
+            {
+                "LaCode": ["211", "211", "212", "213", "211"],
+                "q1": [1, "n/a", None] + answers_of_la_212,
+                "q2": [1.0, 2.0, np.nan, 4.0, 5.0],
+            }
+        ),
+        pd.DataFrame([["No errors while loading files!"]]),
+        pd.DataFrame({"file_path": ["a.xlsx"], "file_size_bytes": [10.0]}),
+    )
+
+
+def save_and_load(
+    loaded_data_returns: LoadedDataReturns, checkpoint_directory: pathlib.Path
+) -> LoadedDataReturns:
+    checkpoint_file_handler.save_data_return_checkpoint(
+        loaded_data_returns, checkpoint_directory, CHECKPOINT_FILENAME
+    )
+    return checkpoint_file_handler.load_data_returns_from_checkpoint(
+        str(checkpoint_directory / CHECKPOINT_FILENAME)
+    )
+
+
+def get_partition_file_names(checkpoint_directory: pathlib.Path) -> list[str]:
+    return sorted(
+        partition_path.name
+        for partition_path in (
+            checkpoint_directory / CHECKPOINT_FILENAME / PARTITIONS_DIRECTORY_NAME
+        ).iterdir()
+    )
+
+
+def test_save_data_return_checkpoint__partitioned_round_trip(tmp_path: pathlib.Path):
+    loaded_data_returns = get_loaded_data_returns([4, 5])
+
+    loaded = save_and_load(loaded_data_returns, tmp_path)
+
+    for df, loaded_df in zip(loaded_data_returns, loaded):
+        pd.testing.assert_frame_equal(loaded_df, df)
+    # One partition for each run of rows from the same LA
+    assert [
+        partition_file_name.split("_")[0]
+        for partition_file_name in get_partition_file_names(tmp_path)
+    ] == ["211", "211", "212", "213"]
+
+
+def test_save_data_return_checkpoint__only_writes_changed_partitions(
+    tmp_path: pathlib.Path,
+):
+    first_loaded_data_returns = get_loaded_data_returns([4, 5])
+    save_and_load(first_loaded_data_returns, tmp_path)
+    partition_file_names_at_first = get_partition_file_names(tmp_path)
+
+    second_loaded_data_returns = get_loaded_data_returns(["4", 5])
+    loaded = save_and_load(second_loaded_data_returns, tmp_path)
+
+    new_partition_file_names = set(get_partition_file_names(tmp_path)) - set(
+        partition_file_names_at_first
+    )
+    assert [
+        partition_file_name.split("_")[0]
+        for partition_file_name in new_partition_file_names
+    ] == ["213"]
+    pd.testing.assert_frame_equal(
+        loaded.df_questionnaire_unclean_by_person,
+        second_loaded_data_returns.df_questionnaire_unclean_by_person,
+    )
+
+    first_manifest_path = get_manifest_paths(tmp_path / CHECKPOINT_FILENAME)[0]
+    pd.testing.assert_frame_equal(
+        checkpoint_file_handler.load_data_returns_from_checkpoint(
+            str(first_manifest_path)
+        ).df_questionnaire_unclean_by_person,
+        first_loaded_data_returns.df_questionnaire_unclean_by_person,
+    )
+
+
+def test_load_data_returns_from_checkpoint__partitioned_columns(
+    tmp_path: pathlib.Path,
+):
+    loaded_data_returns = get_loaded_data_returns([4, 5])
+    checkpoint_file_handler.save_data_return_checkpoint(
+        loaded_data_returns, tmp_path, CHECKPOINT_FILENAME
+    )
+
+    loaded = checkpoint_file_handler.load_data_returns_from_checkpoint(
+        str(tmp_path / CHECKPOINT_FILENAME), columns=["q2", "LaCode"]
+    )
+
+    pd.testing.assert_frame_equal(
+        loaded.df_questionnaire_unclean_by_person,
+        loaded_data_returns.df_questionnaire_unclean_by_person[["LaCode", "q2"]],
+    )
+
+
+def test_compact_partitioned_checkpoint(tmp_path: pathlib.Path):
+    save_and_load(get_loaded_data_returns([4, 5]), tmp_path)
+    latest_loaded_data_returns = get_loaded_data_returns(["4", 5])
+    save_and_load(latest_loaded_data_returns, tmp_path)
+
+    number_of_files_deleted = compact_partitioned_checkpoint(
+        tmp_path / CHECKPOINT_FILENAME
+    )
+
+    # The older manifest, its tables and LA 213's old partition
+    assert number_of_files_deleted == 3
+    assert (
+        len(list((tmp_path / CHECKPOINT_FILENAME / MANIFESTS_DIRECTORY_NAME).iterdir()))
+        == 2
+    )
+    assert len(get_partition_file_names(tmp_path)) == 4
+    pd.testing.assert_frame_equal(
+        checkpoint_file_handler.load_data_returns_from_checkpoint(
+            str(tmp_path / CHECKPOINT_FILENAME)
+        ).df_questionnaire_unclean_by_person,
+        latest_loaded_data_returns.df_questionnaire_unclean_by_person,
+    )
+
+
+def test_get_partition_file_name__tells_numbers_from_text():
+    assert get_partition_file_name(
+        "211", pickle.dumps(pd.DataFrame({"q1": [1, "a"]}, dtype=object))
+    ) != get_partition_file_name(
+        "211", pickle.dumps(pd.DataFrame({"q1": ["1", "a"]}, dtype=object))
+    )
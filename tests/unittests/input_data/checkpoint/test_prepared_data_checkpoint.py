@@ -0,0 +1,131 @@
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+from ascs.input_data import (
+    get_data_needed_for_table_creation as get_data_needed_for_table_creation_module,
+)
+from ascs.input_data.checkpoint import prepared_data_checkpoint
+from ascs.input_data.data_needed_for_table_creation import DataNeededForTableCreation
+
+
+def get_data_needed_for_table_creation() -> DataNeededForTableCreation:
+    population_index = pd.MultiIndex.from_tuples(
+        [("211", 1), ("211", 2), ("212", 1)], names=["LaCode", "Stratum"]
+    )
+    return DataNeededForTableCreation(
+        df_questionnaire_by_person=pd.DataFrame(
+            {
+                "LaCode": ["211", "212"],
+                "q1": pd.Series([1, np.nan], dtype=float),
+                "q2": [1, "n/a"],
+                "Age_Grouped": pd.Categorical(["18-64", "65+"]),
+            }
+        ),
+        population_by_la_stratum=pd.Series([10, 20, 30], index=population_index),
+        population_sample_by_la_stratum=pd.Series([1, 2, 3], index=population_index),
+        population_2c_by_la_stratum=pd.Series([4, 5, 6], index=population_index),
+        average_rows=pd.DataFrame(
+            {("England", "Total"): [1.5]}, index=pd.Index(["q1"], name="Question")
+        ),
+        df_by_validation_error=pd.DataFrame({"error": ["Invalid answer"]}),
+        df_loading_error_by_file=pd.DataFrame([["No errors while loading files!"]]),
+        df_questionnaire_unclean_by_person=pd.DataFrame({"LaCode": ["211", "212"]}),
+    )
+
+
+def test_save_prepared_data_checkpoint__round_trip(tmp_path: pathlib.Path):
+    data_needed_for_table_creation = get_data_needed_for_table_creation()
+
+    checkpoint_path = prepared_data_checkpoint.save_prepared_data_checkpoint(
+        data_needed_for_table_creation, tmp_path / "prepared_data", "test.pkl"
+    )
+    loaded = prepared_data_checkpoint.load_prepared_data_checkpoint(
+        str(checkpoint_path)
+    )
+
+    assert list((tmp_path / "prepared_data").iterdir()) == [checkpoint_path]
+    for field_name in DataNeededForTableCreation._fields:
+        value = getattr(data_needed_for_table_creation, field_name)
+        loaded_value = getattr(loaded, field_name)
+        if field_name == "df_questionnaire_unclean_by_person":
+            # Already in the data returns checkpoint
+            assert loaded_value is None
+        elif isinstance(value, pd.Series):
+            pd.testing.assert_series_equal(loaded_value, value)
+        elif isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(loaded_value, value)
+        else:
+            assert loaded_value is value is None
+
+
+def test_get_current_year_prepared_data_checkpoint_files(
+    tmp_path: pathlib.Path, monkeypatch
+):
+    monkeypatch.setattr(
+        prepared_data_checkpoint, "CHECKPOINTS_DIRECTORY", str(tmp_path) + "/"
+    )
+    monkeypatch.setattr(prepared_data_checkpoint.params, "PUBLICATION_YEAR", "2022")
+
+    assert (
+        prepared_data_checkpoint.get_current_year_prepared_data_checkpoint_files() == []
+    )
+
+    for checkpoint_filename in ["b.pkl", "a.pkl"]:
+        prepared_data_checkpoint.save_prepared_data_checkpoint(
+            get_data_needed_for_table_creation(),
+            prepared_data_checkpoint.get_prepared_data_checkpoints_directory(),
+            checkpoint_filename,
+        )
+
+    assert [
+        pathlib.Path(file).name
+        for file in prepared_data_checkpoint.get_current_year_prepared_data_checkpoint_files()
+    ] == ["a.pkl", "b.pkl"]
+
+
+def test_get_data_needed_for_table_creation_with_menu__not_from_a_checkpoint_when_the_unclean_questionnaire_is_needed(
+    tmp_path: pathlib.Path, monkeypatch
+):
+    checkpoint_path = prepared_data_checkpoint.save_prepared_data_checkpoint(
+        get_data_needed_for_table_creation(), tmp_path, "test.pkl"
+    )
+    data_needed_for_table_creation = get_data_needed_for_table_creation()
+    monkeypatch.setattr(
+        get_data_needed_for_table_creation_module,
+        "get_fingerprints_of_inputs",
+        lambda: ("data_returns", "prepared_data"),
+    )
+    monkeypatch.setattr(
+        get_data_needed_for_table_creation_module,
+        "find_checkpoint_in_index",
+        lambda *args: checkpoint_path,
+    )
+    monkeypatch.setattr(
+        get_data_needed_for_table_creation_module,
+        "want_to_load_prepared_data_checkpoint",
+        lambda: True,
+    )
+    monkeypatch.setattr(
+        get_data_needed_for_table_creation_module,
+        "load_data_from_data_return_and_check_inputs_with_menu",
+        lambda *args: (None, True),
+    )
+    monkeypatch.setattr(
+        get_data_needed_for_table_creation_module,
+        "get_data_needed_for_table_creation_from_loaded_data_returns",
+        lambda *args: data_needed_for_table_creation,
+    )
+
+    assert (
+        get_data_needed_for_table_creation_module.get_data_needed_for_table_creation_with_menu().df_questionnaire_unclean_by_person
+        is None
+    )
+    assert (
+        get_data_needed_for_table_creation_module.get_data_needed_for_table_creation_with_menu(
+            unclean_questionnaire_needed=True
+        )
+        is data_needed_for_table_creation
+    )
+    assert list(tmp_path.iterdir()) == [checkpoint_path]
@@ -0,0 +1,68 @@
+from pathlib import Path
+from typing import Any, Callable, Optional
+from openpyxl import Workbook
+
+import pytest
+
+from ascs import params
+from ascs.input_data.load_data_returns.worksheets import (
+    SERVICE_USER_DATA_SHEET_NAME,
+    SIGN_OFF_SHEET_NAME,
+)
+
+
+TEST_NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING = {
+    "la code": "LaCode",
+    "serial number": "SerialNo",
+    "primary key": "PrimaryKey",
+    "stratum": "Stratum",
+    "population in stratum": "PopInStratum",
+    "method of collection": "MethodCollection",
+    "response": "Response",
+}
+
+
+@pytest.fixture
+def small_data_return_columns(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        params.DATA_RETURN,
+        "NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING",
+        TEST_NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING,
+    )
+
+
+@pytest.fixture
+def make_data_return(
+    tmp_path: Path, small_data_return_columns: None
+) -> Callable[..., Path]:
+    """
+    Returns a function that saves a small data return (with the columns above) to tmp_path
+    """
+
+    def make_data_return(
+        file_name: str,
+        la_code: Any,
+        rows: list[list[Any]],
+        header: Optional[list[str]] = None,
+        directory: Optional[Path] = None,
+    ) -> Path:
+        if header is None:
+            header = list(TEST_NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.keys())
+        if directory is None:
+            directory = tmp_path
+
+        wb = Workbook()
+        sign_off_sheet = wb.active
+        sign_off_sheet.title = SIGN_OFF_SHEET_NAME
+        sign_off_sheet["E2"] = la_code
+
+        service_user_data_sheet = wb.create_sheet(SERVICE_USER_DATA_SHEET_NAME)
+        service_user_data_sheet.append(header)
+        for row in rows:
+            service_user_data_sheet.append(row)
+
+        file_path = directory / file_name
+        wb.save(file_path)
+        return file_path
+
+    return make_data_return
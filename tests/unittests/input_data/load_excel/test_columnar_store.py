@@ -0,0 +1,108 @@
+import tracemalloc
+from typing import Callable, Iterator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ascs.input_data.load_data_returns.columnar_store import ColumnarDataReturnStore
+from ascs.input_data.load_data_returns.ingest_telemetry import DataReturnIngestTelemetry
+from ascs.input_data.load_data_returns.load_excel import combine_loaded_data_returns
+
+
+def get_data_return_dfs() -> list[pd.DataFrame]:
+    return [
+        pd.DataFrame(
+            {
+                "LaCode": ["211", "211"],
+                "Q1": [1, 2],
+                "Q2": [1.5, np.nan],
+                "Q3": ["a", None],
+            }
+        ),
+        # Q2 all blank, Q3 missing, Q4 only in this data return
+        pd.DataFrame({"LaCode": ["212"], "Q1": [3], "Q2": [None], "Q4": [True],}),
+        pd.DataFrame({"LaCode": [], "Q1": [], "Q2": [], "Q3": []}),
+        # Q1 has a value that isn't a number
+        pd.DataFrame(
+            {
+                "LaCode": ["213", "213", "213"],
+                "Q1": [1, "n/a", None],
+                "Q2": [2.0, 3.0, 4.0],
+                "Q3": [None, None, None],
+            }
+        ),
+    ]
+
+
+def test_pop_df__matches_concat() -> None:
+    columnar_data_return_store = ColumnarDataReturnStore()
+    for df in get_data_return_dfs():
+        columnar_data_return_store.append(df)
+
+    assert len(columnar_data_return_store) == 6
+    pd.testing.assert_frame_equal(
+        columnar_data_return_store.pop_df(),
+        pd.concat(get_data_return_dfs(), ignore_index=True),
+    )
+    pd.testing.assert_frame_equal(columnar_data_return_store.pop_df(), pd.DataFrame())
+
+
+@pytest.mark.parametrize("merge_into_columnar_store", [True, False])
+def test_combine_loaded_data_returns__same_either_way(
+    merge_into_columnar_store: bool,
+) -> None:
+    data_return_dfs = get_data_return_dfs()
+
+    loaded_data_returns = combine_loaded_data_returns(
+        [f"{la_code}.xlsx" for la_code in range(len(data_return_dfs) + 1)],
+        [(df, None, DataReturnIngestTelemetry(None, False)) for df in data_return_dfs]
+        + [(None, "Broken", DataReturnIngestTelemetry(None, False))],
+        merge_into_columnar_store=merge_into_columnar_store,
+    )
+
+    pd.testing.assert_frame_equal(
+        loaded_data_returns.df_questionnaire_unclean_by_person,
+        pd.concat(get_data_return_dfs(), ignore_index=True),
+    )
+    assert loaded_data_returns.df_loading_error_by_file.file_path.to_list() == [
+        "4.xlsx"
+    ]
+
+
+def generate_large_data_return_dfs() -> Iterator[pd.DataFrame]:
+    for la_code in range(20):
+        yield pd.DataFrame(
+            {
+                "LaCode": str(la_code),
+                **{f"Q{i}": np.arange(5_000, dtype=float) for i in range(20)},
+            }
+        )
+
+
+def get_peak_memory_in_bytes(function: Callable[[], pd.DataFrame]) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_columnar_data_return_store__uses_less_memory_than_concat() -> None:
+    def combine_with_concat() -> pd.DataFrame:
+        return pd.concat(list(generate_large_data_return_dfs()), ignore_index=True)
+
+    def combine_with_columnar_data_return_store() -> pd.DataFrame:
+        columnar_data_return_store = ColumnarDataReturnStore()
+        for df in generate_large_data_return_dfs():
+            columnar_data_return_store.append(df)
+        return columnar_data_return_store.pop_df()
+
+    pd.testing.assert_frame_equal(
+        combine_with_columnar_data_return_store(), combine_with_concat()
+    )
+    # Concat holds every data return and the result, so needs about twice the memory
+    assert get_peak_memory_in_bytes(
+        combine_with_columnar_data_return_store
+    ) < 0.7 * get_peak_memory_in_bytes(combine_with_concat)
@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+from ascs.input_data.load_data_returns import load_excel
+from ascs.input_data.load_data_returns.load_columnar import (
+    load_one_columnar_data_return,
+)
+
+from ascs import params
+
+ROWS = [
+    [211, 1, None, 1, 10, 1, 1],
+    [None, None, None, None, None, None, None],
+    [211, 2, None, 1, 10, 2, 3],
+]
+
+
+def save_columnar_data_return(
+    file_path: Path, rows: list[list], header: list[str] = None
+) -> Path:
+    if header is None:
+        header = list(
+            params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.keys()
+        )
+
+    df_data_return = pd.DataFrame(rows, columns=header, dtype=object)
+    if file_path.suffix == ".csv":
+        df_data_return.to_csv(file_path, index=False)
+    else:
+        df_data_return.astype(str).replace({"None": None}).to_parquet(file_path)
+    return file_path
+
+
+@pytest.mark.parametrize("file_extension", [".csv", ".parquet"])
+def test_load_one_columnar_data_return__matches_excel(
+    tmp_path: Path, make_data_return: Callable[..., Path], file_extension: str
+) -> None:
+    excel_file_path = make_data_return("a.xlsx", 211, ROWS)
+    columnar_file_path = save_columnar_data_return(
+        tmp_path / f"a{file_extension}", ROWS
+    )
+
+    pd.testing.assert_frame_equal(
+        load_one_columnar_data_return(columnar_file_path),
+        load_excel.load_one_data_return(excel_file_path),
+    )
+
+
+def test_load_one_columnar_data_return__keeps_values_that_arent_numbers(
+    tmp_path: Path, small_data_return_columns: None
+) -> None:
+    file_path = save_columnar_data_return(
+        tmp_path / "a.csv", [ROWS[0], ROWS[2][:-1] + ["n/a"]]
+    )
+
+    df_questionnaire_in_la_by_person = load_one_columnar_data_return(file_path)
+
+    assert df_questionnaire_in_la_by_person["Response"].to_list() == ["1", "n/a"]
+    assert df_questionnaire_in_la_by_person["MethodCollection"].to_list() == [1, 2]
+
+
+def test_load_one_columnar_data_return__checks_columns(
+    tmp_path: Path, small_data_return_columns: None
+) -> None:
+    header = list(
+        params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.keys()
+    )
+    header[5], header[6] = header[6], header[5]
+    file_path = save_columnar_data_return(tmp_path / "a.csv", ROWS, header)
+
+    with pytest.raises(AssertionError) as err:
+        load_one_columnar_data_return(file_path)
+
+    assert "expected a column like 'method of collection'" in str(err.value)
+
+
+def test_load_one_columnar_data_return__needs_one_la_code(
+    tmp_path: Path, small_data_return_columns: None
+) -> None:
+    file_path = save_columnar_data_return(
+        tmp_path / "a.csv", [ROWS[0], [212] + ROWS[2][1:]]
+    )
+
+    with pytest.raises(AssertionError) as err:
+        load_one_columnar_data_return(file_path)
+
+    assert "['211', '212']" in str(err.value)
+
+
+def test_load_all_data_returns_from_excel__loads_a_mixed_directory(
+    tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    make_data_return: Callable[..., Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        load_excel,
+        "save_data_return_checkpoint_in_background",
+        lambda *args, **kwargs: None,
+    )
+    make_data_return("a.xlsx", 211, ROWS)
+    save_columnar_data_return(tmp_path / "b.csv", [[212] + ROWS[0][1:]])
+    save_columnar_data_return(tmp_path / "c.parquet", [[213] + ROWS[0][1:]])
+    save_columnar_data_return(tmp_path / "d.csv", [[None] + ROWS[0][1:]])
+    (tmp_path / "e.txt").write_text("not a data return")
+
+    loaded = load_excel.load_all_data_returns_from_excel(
+        tmp_path,
+        number_of_processes=2,
+        parse_cache_directory=tmp_path_factory.mktemp("parse_cache"),
+    )
+
+    assert loaded.df_questionnaire_unclean_by_person["PrimaryKey"].to_list() == [
+        "211_0",
+        "211_2",
+        "212_0",
+        "213_0",
+    ]
+    assert [
+        Path(file_path).name for file_path in loaded.df_loading_error_by_file.file_path
+    ] == ["d.csv"]
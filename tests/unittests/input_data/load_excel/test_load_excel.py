@@ -0,0 +1,306 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+from ascs import params
+from ascs.input_data.load_data_returns import load_excel
+
+
+@pytest.fixture
+def data_return_directory(
+    tmp_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    make_data_return: Callable[..., Path],
+    monkeypatch: pytest.MonkeyPatch,
+) -> Path:
+    monkeypatch.setattr(
+        load_excel,
+        "save_data_return_checkpoint_in_background",
+        lambda *args, **kwargs: None,
+    )
+    monkeypatch.setattr(
+        load_excel,
+        "get_parse_cache_directory",
+        lambda: tmp_path_factory.mktemp("parse_cache"),
+    )
+
+    make_data_return(
+        "a.xlsx", 211, [[None, 1, None, 1, 10, 1, 1], [None, 2, None, 1, 10, 2, 2]]
+    )
+    make_data_return("b.xlsx", "", [[None, 1, None, 1, 10, 1, 1]])
+    make_data_return("c.xlsx", 212, [[None, 7, None, 2, 20, 3, 1]])
+    (tmp_path / "d.xlsx").write_bytes(b"this is not an excel file")
+    make_data_return("e.xlsx", 213, [[None, 9, None, 3, 30, 1, 3]])
+
+    return tmp_path
+
+
+def test_load_all_data_returns_from_excel__parallel_matches_serial(
+    data_return_directory: Path,
+) -> None:
+    loaded_serial = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, number_of_processes=1
+    )
+    loaded_parallel = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, number_of_processes=2
+    )
+
+    pd.testing.assert_frame_equal(
+        loaded_parallel.df_questionnaire_unclean_by_person,
+        loaded_serial.df_questionnaire_unclean_by_person,
+    )
+    pd.testing.assert_frame_equal(
+        loaded_parallel.df_loading_error_by_file,
+        loaded_serial.df_loading_error_by_file,
+    )
+
+
+def test_load_all_data_returns_from_excel__broken_files_become_error_rows(
+    data_return_directory: Path,
+) -> None:
+    loaded = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, number_of_processes=2
+    )
+
+    df_questionnaire = loaded.df_questionnaire_unclean_by_person
+    assert df_questionnaire["LaCode"].to_list() == ["211", "211", "212", "213"]
+    assert df_questionnaire["PrimaryKey"].to_list() == [
+        "211_0",
+        "211_1",
+        "212_0",
+        "213_0",
+    ]
+
+    df_errors = loaded.df_loading_error_by_file
+    assert df_errors.columns.to_list() == ["file_path", "error_message"]
+    assert [Path(file_path).name for file_path in df_errors["file_path"]] == [
+        "b.xlsx",
+        "d.xlsx",
+    ]
+    assert "LA Code (cell E2" in df_errors.iloc[0]["error_message"]
+
+
+def exit_worker_process_on_file_c(file_path: str) -> tuple[str, None]:
+    if file_path == "c.xlsx":
+        os._exit(1)
+    return file_path, None
+
+
+def test_try_to_run_on_each_data_return__only_the_file_that_killed_a_worker_fails() -> None:
+    file_paths = ["a.xlsx", "b.xlsx", "c.xlsx", "d.xlsx", "e.xlsx"]
+
+    results = list(
+        load_excel.try_to_run_on_each_data_return(
+            exit_worker_process_on_file_c, file_paths, number_of_processes=2
+        )
+    )
+
+    assert [result for result, _ in results] == [
+        "a.xlsx",
+        "b.xlsx",
+        None,
+        "d.xlsx",
+        "e.xlsx",
+    ]
+    assert [error_message is None for _, error_message in results] == [
+        True,
+        True,
+        False,
+        True,
+        True,
+    ]
+    assert "terminated abruptly" in results[2][1]
+
+
+class RecordingProcessPool(ProcessPoolExecutor):
+    def __init__(self, file_paths_submitted: list[str], shutdowns: list[bool]):
+        super().__init__(max_workers=2)
+        self.file_paths_submitted = file_paths_submitted
+        self.shutdowns = shutdowns
+
+    def submit(self, function, file_path):
+        self.file_paths_submitted.append(file_path)
+        return super().submit(function, file_path)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdowns.append(cancel_futures)
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+
+def test_try_to_run_on_each_data_return__only_a_few_files_in_flight_and_the_pool_shut_down_when_stopped_early(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    file_paths_submitted = []
+    shutdowns = []
+    monkeypatch.setattr(
+        load_excel,
+        "get_process_pool_with_current_params",
+        lambda number_of_processes: RecordingProcessPool(
+            file_paths_submitted, shutdowns
+        ),
+    )
+    monkeypatch.setattr(load_excel, "DATA_RETURNS_IN_FLIGHT_PER_PROCESS", 2)
+    file_paths = [f"{file_number}.xlsx" for file_number in range(20)]
+
+    results = load_excel.try_to_run_on_each_data_return(
+        exit_worker_process_on_file_c, file_paths, number_of_processes=2
+    )
+    assert next(results) == ("0.xlsx", None)
+    results.close()
+
+    assert file_paths_submitted == file_paths[:4]
+    assert shutdowns == [True]
+
+
+def test_load_all_data_returns_from_excel__only_reads_new_or_changed_files(
+    data_return_directory: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    make_data_return: Callable[..., Path],
+    mocker,
+) -> None:
+    parse_cache_directory = tmp_path_factory.mktemp("shared_parse_cache")
+    first_load = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, 1, parse_cache_directory
+    )
+
+    make_data_return("c.xlsx", 212, [[None, 8, None, 2, 20, 3, 1]])
+    load_one_data_return_spy = mocker.spy(
+        load_excel, "load_one_data_return_and_count_rows_read"
+    )
+    second_load = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, 1, parse_cache_directory
+    )
+
+    # b.xlsx and d.xlsx failed to load, so aren't cached
+    assert [
+        Path(call.args[0]).name for call in load_one_data_return_spy.call_args_list
+    ] == ["b.xlsx", "c.xlsx", "d.xlsx"]
+    assert first_load.df_questionnaire_unclean_by_person["SerialNo"].to_list() == [
+        "1",
+        "2",
+        "7",
+        "9",
+    ]
+    assert second_load.df_questionnaire_unclean_by_person["SerialNo"].to_list() == [
+        "1",
+        "2",
+        "8",
+        "9",
+    ]
+    pd.testing.assert_frame_equal(
+        second_load.df_loading_error_by_file, first_load.df_loading_error_by_file
+    )
+
+
+def test_load_all_data_returns_from_excel__rereads_files_when_data_return_params_change(
+    data_return_directory: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    mocker,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    parse_cache_directory = tmp_path_factory.mktemp("shared_parse_cache")
+    load_excel.load_all_data_returns_from_excel(
+        data_return_directory, 1, parse_cache_directory
+    )
+
+    monkeypatch.setattr(
+        params.DATA_RETURN,
+        "STRING_COLUMNS",
+        params.DATA_RETURN.STRING_COLUMNS + ["Response"],
+    )
+    load_one_data_return_spy = mocker.spy(
+        load_excel, "load_one_data_return_and_count_rows_read"
+    )
+    load_excel.load_all_data_returns_from_excel(
+        data_return_directory, 1, parse_cache_directory
+    )
+
+    assert load_one_data_return_spy.call_count == 5
+
+
+def test_load_all_data_returns_from_excel__identical_files_are_errors(
+    data_return_directory: Path,
+) -> None:
+    (data_return_directory / "f.xlsx").write_bytes(
+        (data_return_directory / "a.xlsx").read_bytes()
+    )
+
+    loaded = load_excel.load_all_data_returns_from_excel(data_return_directory, 1)
+
+    assert loaded.df_questionnaire_unclean_by_person["LaCode"].to_list() == [
+        "211",
+        "211",
+        "212",
+        "213",
+    ]
+    df_errors = loaded.df_loading_error_by_file
+    assert [Path(file_path).name for file_path in df_errors["file_path"]] == [
+        "b.xlsx",
+        "d.xlsx",
+        "f.xlsx",
+    ]
+    assert "identical to" in df_errors.iloc[2]["error_message"]
+    assert "a.xlsx" in df_errors.iloc[2]["error_message"]
+
+
+def test_load_all_data_returns_from_excel__ingest_telemetry(
+    data_return_directory: Path, tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    parse_cache_directory = tmp_path_factory.mktemp("shared_parse_cache")
+    first_load = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, 2, parse_cache_directory
+    )
+    second_load = load_excel.load_all_data_returns_from_excel(
+        data_return_directory, 1, parse_cache_directory
+    )
+
+    df_telemetry = first_load.df_ingest_telemetry_by_file
+    assert [Path(file_path).name for file_path in df_telemetry["file_path"]] == [
+        "a.xlsx",
+        "b.xlsx",
+        "c.xlsx",
+        "d.xlsx",
+        "e.xlsx",
+    ]
+    assert df_telemetry["file_size_bytes"].to_list() == [
+        (data_return_directory / Path(file_path).name).stat().st_size
+        for file_path in df_telemetry["file_path"]
+    ]
+    assert df_telemetry["persons_kept"].fillna(-1).to_list() == [2, -1, 1, -1, 1]
+    # The header, both people and the blank rows after them in the template
+    assert df_telemetry.loc[0, "rows_read"] >= 3
+    assert df_telemetry.loc[0, "columns"] == len(
+        first_load.df_questionnaire_unclean_by_person.columns
+    )
+    assert (df_telemetry["parse_seconds"].dropna() > 0).all()
+    assert df_telemetry["parse_seconds"].isna().to_list() == [
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert not df_telemetry["from_parse_cache"].any()
+
+    df_cached_telemetry = second_load.df_ingest_telemetry_by_file
+    assert df_cached_telemetry["from_parse_cache"].to_list() == [
+        True,
+        False,
+        True,
+        False,
+        True,
+    ]
+    assert df_cached_telemetry["rows_read"].isna().to_list() == [
+        True,
+        True,
+        True,
+        True,
+        True,
+    ]
+    pd.testing.assert_series_equal(
+        df_cached_telemetry["persons_kept"], df_telemetry["persons_kept"]
+    )
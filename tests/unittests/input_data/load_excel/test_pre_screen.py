@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from ascs.input_data.load_data_returns import load_excel
+from ascs.input_data.load_data_returns.pre_screen import pre_screen_all_data_returns
+from ascs.input_data.load_data_returns.worksheets import SIGN_OFF_SHEET_NAME
+
+
+@pytest.fixture
+def data_return_directory(
+    tmp_path: Path, make_data_return: Callable[..., Path]
+) -> Path:
+    make_data_return("a.xlsx", 211, [[None, 1, None, 1, 10, 1, 1]])
+    make_data_return("b.xlsx", "", [[None, 1, None, 1, 10, 1, 1]])
+    make_data_return(
+        "c.xlsx",
+        212,
+        [[None, 7, None, 2, 20, 3, 1]],
+        header=[
+            "la code",
+            "serial number",
+            "primary key",
+            "stratum",
+            "population in stratum",
+            "response",
+            "method of collection",
+        ],
+    )
+    (tmp_path / "d.xlsx").write_bytes(b"this is not an excel file")
+
+    wb = Workbook()
+    wb.active.title = SIGN_OFF_SHEET_NAME
+    wb.active["E2"] = 213
+    wb.save(tmp_path / "e.xlsx")
+
+    return tmp_path
+
+
+def test_pre_screen_all_data_returns__finds_the_broken_files(
+    data_return_directory: Path,
+) -> None:
+    df_pre_screen_error_by_file = pre_screen_all_data_returns(
+        data_return_directory, number_of_processes=1
+    )
+
+    assert df_pre_screen_error_by_file.columns.to_list() == [
+        "file_path",
+        "error_message",
+    ]
+    assert [
+        Path(file_path).name for file_path in df_pre_screen_error_by_file["file_path"]
+    ] == ["b.xlsx", "c.xlsx", "d.xlsx", "e.xlsx"]
+    error_messages = df_pre_screen_error_by_file["error_message"].to_list()
+    assert "LA Code (cell E2" in error_messages[0]
+    assert "expected a column like 'method of collection'" in error_messages[1]
+    assert "Service User Data" in error_messages[3]
+
+
+def test_pre_screen_all_data_returns__matches_loading_errors(
+    data_return_directory: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(
+        load_excel,
+        "save_data_return_checkpoint_in_background",
+        lambda *args, **kwargs: None,
+    )
+
+    df_loading_error_by_file = load_excel.load_all_data_returns_from_excel(
+        data_return_directory,
+        number_of_processes=1,
+        parse_cache_directory=tmp_path_factory.mktemp("parse_cache"),
+    ).df_loading_error_by_file
+    df_pre_screen_error_by_file = pre_screen_all_data_returns(
+        data_return_directory, number_of_processes=2
+    )
+
+    pd.testing.assert_frame_equal(df_pre_screen_error_by_file, df_loading_error_by_file)
+
+
+def test_pre_screen_all_data_returns__no_errors(
+    tmp_path: Path, make_data_return: Callable[..., Path]
+) -> None:
+    make_data_return("a.xlsx", 211, [[None, 1, None, 1, 10, 1, 1]])
+
+    df_pre_screen_error_by_file = pre_screen_all_data_returns(tmp_path)
+
+    pd.testing.assert_frame_equal(
+        df_pre_screen_error_by_file, pd.DataFrame([["No errors while loading files!"]]),
+    )
@@ -14,6 +14,7 @@ from ascs.input_data.load_data_returns.service_user_data import (
     get_worksheet_as_np_array_from_workbook,
     ignore_rows_where_there_isnt_a_person,
     select_only_initial_expected_columns,
+    set_column_types,
 )
 
 from ascs import params
@@ -64,9 +65,9 @@ def test_get_service_user_data_from_workbook(
     )
 
     df_service_user_data_expected = pd.DataFrame(
-        [[555, 1, "555_0", 1, 1], [555, 5, "555_1", 1, 2]],
+        [[555, "1", "555_0", 1, 1], [555, "5", "555_1", 1, 2]],
         columns=["LaCode", "SerialNo", "PrimaryKey", "MethodCollection", "Response"],
-    )
+    ).astype({"MethodCollection": np.int8, "Response": np.int8})
 
     pd.testing.assert_frame_equal(
         df_service_user_data_actual, df_service_user_data_expected
@@ -167,3 +168,32 @@ def test_ignore_rows_where_there_isnt_a_person__correctly_ignores_rows():
     df_actual = ignore_rows_where_there_isnt_a_person(df_in)
 
     pd.testing.assert_frame_equal(df_actual, df_expected)
+
+
+def test_set_column_types():
+    df_in = pd.DataFrame(
+        {
+            "SerialNo": [1, "abc", None, ""],
+            "Whole": [1, 2, 3, 4],
+            "WholeWithBlanks": [1, None, "", 300],
+            "WithBlanks": [1, None, "", 2.5],
+            "NotANumber": [1, "n/a", None, 2],
+            "Boolean": [1, True, None, 2],
+        },
+        dtype=object,
+    )
+
+    df_expected = pd.DataFrame(
+        {
+            "SerialNo": ["1", "abc", None, None],
+            "Whole": np.array([1, 2, 3, 4], dtype=np.int8),
+            "WholeWithBlanks": np.array([1, np.nan, np.nan, 300], dtype=np.float32),
+            "WithBlanks": [1.0, np.nan, np.nan, 2.5],
+            "NotANumber": [1, "n/a", None, 2],
+            "Boolean": [1, True, None, 2],
+        }
+    )
+
+    df_actual = set_column_types(df_in, string_column_names=["SerialNo"])
+
+    pd.testing.assert_frame_equal(df_actual, df_expected)
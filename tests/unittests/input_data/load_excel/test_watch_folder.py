@@ -0,0 +1,138 @@
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+from ascs.input_data.checkpoint.checkpoint_config import (
+    WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME,
+)
+from ascs.input_data.checkpoint.checkpoint_file_handler import (
+    load_data_returns_from_checkpoint,
+)
+from ascs.input_data.load_data_returns.watch_folder import DataReturnsFolderWatcher
+
+
+@pytest.fixture
+def data_return_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("data_returns")
+
+
+@pytest.fixture
+def checkpoint_directory(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("checkpoints")
+
+
+@pytest.fixture
+def watcher(
+    data_return_directory: Path,
+    checkpoint_directory: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> DataReturnsFolderWatcher:
+    return DataReturnsFolderWatcher(
+        directory=str(data_return_directory),
+        checkpoint_directory=checkpoint_directory,
+        parse_cache_directory=tmp_path_factory.mktemp("parse_cache"),
+        number_of_processes=1,
+    )
+
+
+def load_watched_checkpoint(checkpoint_directory: Path):
+    return load_data_returns_from_checkpoint(
+        str(checkpoint_directory / WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME)
+    )
+
+
+def test_poll__saves_checkpoint_once_files_stop_changing(
+    watcher: DataReturnsFolderWatcher,
+    data_return_directory: Path,
+    checkpoint_directory: Path,
+    make_data_return: Callable[..., Path],
+) -> None:
+    assert not watcher.poll()
+
+    make_data_return(
+        "a.xlsx", 211, [[None, 1, None, 1, 10, 1, 1]], directory=data_return_directory,
+    )
+
+    # The new file might still be being copied in, so isn't loaded yet
+    assert not watcher.poll()
+    assert watcher.poll()
+    assert not watcher.poll()
+
+    loaded = load_watched_checkpoint(checkpoint_directory)
+    assert loaded.df_questionnaire_unclean_by_person["LaCode"].to_list() == ["211"]
+    pd.testing.assert_frame_equal(
+        loaded.df_questionnaire_unclean_by_person,
+        watcher.loaded_data_returns.df_questionnaire_unclean_by_person,
+    )
+    pd.testing.assert_frame_equal(
+        loaded.df_loading_error_by_file,
+        pd.DataFrame([["No errors while loading files!"]]),
+    )
+
+
+def test_poll__reloads_new_changed_and_removed_files(
+    watcher: DataReturnsFolderWatcher,
+    data_return_directory: Path,
+    checkpoint_directory: Path,
+    make_data_return: Callable[..., Path],
+) -> None:
+    for file_name, la_code in [("a.xlsx", 211), ("b.xlsx", 212)]:
+        make_data_return(
+            file_name,
+            la_code,
+            [[None, 1, None, 1, 10, 1, 1]],
+            directory=data_return_directory,
+        )
+    watcher.poll()
+    assert watcher.poll()
+
+    make_data_return(
+        "b.xlsx", "", [[None, 1, None, 1, 10, 1, 1]], directory=data_return_directory,
+    )
+    make_data_return(
+        "c.xlsx",
+        213,
+        [[None, 1, None, 1, 10, 1, 1], [None, 2, None, 1, 10, 1, 1]],
+        directory=data_return_directory,
+    )
+    assert not watcher.poll()
+    assert watcher.poll()
+
+    loaded = load_watched_checkpoint(checkpoint_directory)
+    assert loaded.df_questionnaire_unclean_by_person["LaCode"].to_list() == [
+        "211",
+        "213",
+        "213",
+    ]
+    assert [
+        Path(file_path).name for file_path in loaded.df_loading_error_by_file.file_path
+    ] == ["b.xlsx"]
+
+    (data_return_directory / "a.xlsx").unlink()
+    assert watcher.poll()
+
+    loaded = load_watched_checkpoint(checkpoint_directory)
+    assert loaded.df_questionnaire_unclean_by_person["LaCode"].to_list() == [
+        "213",
+        "213",
+    ]
+
+
+def test_run__polls_the_given_number_of_times(
+    watcher: DataReturnsFolderWatcher,
+    data_return_directory: Path,
+    checkpoint_directory: Path,
+    make_data_return: Callable[..., Path],
+) -> None:
+    make_data_return(
+        "a.xlsx", 211, [[None, 1, None, 1, 10, 1, 1]], directory=data_return_directory,
+    )
+
+    watcher.run(poll_interval_seconds=0, number_of_polls=2)
+
+    assert (checkpoint_directory / WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME).exists()
+    assert not (
+        checkpoint_directory / (WATCHED_DATA_RETURNS_CHECKPOINT_FILENAME + ".tmp")
+    ).exists()
@@ -0,0 +1,198 @@
+import re
+import zipfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from ascs.input_data.load_data_returns.service_user_data import (
+    get_service_user_data_from_workbook,
+    get_service_user_data_from_xlsx,
+)
+from ascs.input_data.load_data_returns.worksheets import (
+    SERVICE_USER_DATA_SHEET_NAME,
+    SIGN_OFF_SHEET_NAME,
+)
+from ascs.input_data.load_data_returns.xlsx_reader import (
+    XlsxReader,
+    convert_column_index_to_letters,
+    convert_column_letters_to_index,
+    get_regex_matching_cells_from_column_index,
+)
+
+this_directory = Path(__file__).parent
+
+
+@pytest.fixture
+def workbook_path(tmp_path) -> Path:
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Values"
+    ws.append(["Text", "Integer", "Float", "Boolean", "Formula"])
+    ws.append(["Fish & <chips>", 3, 2.5, True, "=1+1"])
+    ws.append([None, None, None, None, None])
+    ws["B5"] = "After a gap"
+    ws["AB5"] = "Far to the right"
+    wb.create_sheet("Other")
+
+    file_path = tmp_path / "values.xlsx"
+    wb.save(file_path)
+    return file_path
+
+
+def test_sheetnames(workbook_path):
+    with XlsxReader(workbook_path) as xlsx_reader:
+        assert xlsx_reader.sheetnames == ["Values", "Other"]
+
+
+def test_iter_rows_gives_the_same_values_as_openpyxl(workbook_path):
+    with XlsxReader(workbook_path) as xlsx_reader:
+        values_by_row_number = dict(xlsx_reader.iter_rows("Values", max_column=3))
+
+    assert values_by_row_number[1] == ["Text", "Integer", "Float"]
+    assert values_by_row_number[2] == ["Fish & <chips>", 3, 2.5]
+    assert values_by_row_number[5] == [None, "After a gap", None]
+    assert 4 not in values_by_row_number
+
+
+def test_iter_rows_keeps_types(workbook_path):
+    with XlsxReader(workbook_path) as xlsx_reader:
+        values_by_row_number = dict(xlsx_reader.iter_rows("Values", max_column=4))
+
+    assert [type(value) for value in values_by_row_number[2]] == [
+        str,
+        int,
+        float,
+        bool,
+    ]
+
+
+def test_iter_rows_after_an_empty_self_closing_row(tmp_path):
+    wb = Workbook()
+    wb.active.title = "Values"
+    openpyxl_file_path = tmp_path / "openpyxl.xlsx"
+    wb.save(openpyxl_file_path)
+
+    sheet_data_xml = (
+        "<sheetData>"
+        '<row r="1"><c r="A1"><v>1</v></c><c r="B1"><v>2</v></c></row>'
+        '<row r="2"/>'
+        '<row r="3"><c r="A3"><v>5</v></c><c r="B3"><v>6</v></c></row>'
+        '<row r="4" ht="15"/><row r="5" ht="15"/>'
+        '<row r="6"><c r="A6"><v>7</v></c></row>'
+        "</sheetData>"
+    )
+    file_path = tmp_path / "self_closing_rows.xlsx"
+    with zipfile.ZipFile(openpyxl_file_path) as openpyxl_zip, zipfile.ZipFile(
+        file_path, "w"
+    ) as new_zip:
+        for item in openpyxl_zip.infolist():
+            xml = openpyxl_zip.read(item.filename)
+            if item.filename == "xl/worksheets/sheet1.xml":
+                xml = re.sub(
+                    rb"<sheetData\s*/>|<sheetData>.*</sheetData>",
+                    sheet_data_xml.encode(),
+                    xml,
+                )
+            new_zip.writestr(item, xml)
+
+    with XlsxReader(file_path) as xlsx_reader:
+        rows = list(xlsx_reader.iter_rows("Values", max_column=2))
+
+    assert rows == [
+        (1, [1, 2]),
+        (2, [None, None]),
+        (3, [5, 6]),
+        (4, [None, None]),
+        (5, [None, None]),
+        (6, [7, None]),
+    ]
+
+
+def test_get_cell_value(workbook_path):
+    with XlsxReader(workbook_path) as xlsx_reader:
+        assert xlsx_reader.get_cell_value("Values", "AB5") == "Far to the right"
+        assert xlsx_reader.get_cell_value("Values", "A5") is None
+        assert xlsx_reader.get_cell_value("Values", "A100") is None
+
+
+def test_missing_sheet_raises_key_error(workbook_path):
+    with XlsxReader(workbook_path) as xlsx_reader:
+        with pytest.raises(KeyError):
+            list(xlsx_reader.iter_rows("Missing", max_column=1))
+
+
+def test_blank_data_return_matches_openpyxl():
+    file_path = this_directory / "blank_test_data_return.xlsx"
+    number_of_columns = 20
+
+    wb = load_workbook(file_path, data_only=True, read_only=True)
+    expected_la_code = wb[SIGN_OFF_SHEET_NAME]["E2"].value
+    expected_rows = [
+        row[:number_of_columns]
+        for row in wb[SERVICE_USER_DATA_SHEET_NAME].iter_rows(
+            max_row=10, values_only=True
+        )
+    ]
+    wb.close()
+
+    with XlsxReader(file_path) as xlsx_reader:
+        assert xlsx_reader.get_cell_value(SIGN_OFF_SHEET_NAME, "E2") == expected_la_code
+
+        values_by_row_number = dict(
+            xlsx_reader.iter_rows(
+                SERVICE_USER_DATA_SHEET_NAME, max_column=number_of_columns
+            )
+        )
+
+    for row_index, expected_row in enumerate(expected_rows):
+        assert values_by_row_number.get(
+            row_index + 1, [None] * number_of_columns
+        ) == list(expected_row)
+
+
+def test_get_service_user_data_from_xlsx_matches_workbook(
+    small_data_return_columns, make_data_return
+):
+    file_path = make_data_return(
+        "data_return.xlsx",
+        "211",
+        [
+            [None, 1, None, 1, 10, 1, 1],
+            [None, None, None, None, None, None, None],
+            [None, 2, None, 1, 10, 3, 2],
+        ],
+    )
+
+    df_from_workbook = get_service_user_data_from_workbook(
+        load_workbook(file_path, data_only=True, read_only=True), "211"
+    )
+    with XlsxReader(file_path) as xlsx_reader:
+        df_from_xlsx = get_service_user_data_from_xlsx(xlsx_reader, "211")
+
+    pd.testing.assert_frame_equal(df_from_xlsx, df_from_workbook)
+
+
+@pytest.mark.parametrize(
+    "column_index,column_letters",
+    [(0, "A"), (25, "Z"), (26, "AA"), (94, "CQ"), (701, "ZZ"), (702, "AAA")],
+)
+def test_column_letters_conversion(column_index, column_letters):
+    assert convert_column_index_to_letters(column_index) == column_letters
+    assert convert_column_letters_to_index(column_letters) == column_index
+
+
+def test_regex_matching_cells_from_column_index():
+    regex = get_regex_matching_cells_from_column_index(28)  # AC
+
+    matching_column_letters = [
+        convert_column_index_to_letters(column_index)
+        for column_index in np.arange(800)
+        if regex.match(f'<c r="{convert_column_index_to_letters(column_index)}7"/>')
+    ]
+
+    assert matching_column_letters == [
+        convert_column_index_to_letters(column_index) for column_index in range(28, 800)
+    ]
@@ -0,0 +1,137 @@
+import io
+import zipfile
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+import pytest
+
+from ascs.input_data.load_data_returns import load_excel
+from ascs.input_data.load_data_returns.pre_screen import pre_screen_all_data_returns
+from ascs.input_data.load_data_returns.zip_archive import (
+    get_zip_member_path,
+    open_data_return_file,
+    split_zip_member_path,
+)
+
+from ascs import params
+
+ROW = [None, 1, None, 1, 10, 1, 1]
+
+
+@pytest.fixture
+def data_return_directory(
+    tmp_path: Path, make_data_return: Callable[..., Path]
+) -> Path:
+    make_data_return("a.xlsx", 211, [ROW])
+    make_data_return("b.xlsx", "", [ROW])
+    pd.DataFrame(
+        [["212", "1", None, "1", "10", "1", "1"]],
+        columns=list(
+            params.DATA_RETURN.NEW_COLUMN_NAMES_BY_EXPECTED_COLUMN_SUBSTRING.keys()
+        ),
+    ).to_csv(tmp_path / "c.csv", index=False)
+    return tmp_path
+
+
+@pytest.fixture
+def archive_path(
+    data_return_directory: Path, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    archive_path = tmp_path_factory.mktemp("archive") / "data_returns.zip"
+    with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.write(data_return_directory / "a.xlsx", "returns/a.xlsx")
+        archive.write(data_return_directory / "b.xlsx", "returns/b.xlsx")
+        archive.write(data_return_directory / "c.csv", "c.csv")
+        archive.write(data_return_directory / "a.xlsx", "returns/~$a.xlsx")
+        archive.write(data_return_directory / "a.xlsx", "__MACOSX/returns/._a.xlsx")
+        archive.writestr("notes.txt", "not a data return")
+    return archive_path
+
+
+@pytest.fixture
+def no_checkpoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        load_excel,
+        "save_data_return_checkpoint_in_background",
+        lambda *args, **kwargs: None,
+    )
+
+
+def test_split_zip_member_path() -> None:
+    assert split_zip_member_path(
+        get_zip_member_path("C:\\returns.zip", "returns/a.xlsx")
+    ) == ("C:\\returns.zip", "returns/a.xlsx")
+    assert split_zip_member_path("C:\\returns\\a.xlsx") is None
+
+
+def test_get_all_data_return_file_paths__lists_the_archive(archive_path: Path) -> None:
+    assert load_excel.get_all_data_return_file_paths(archive_path) == [
+        get_zip_member_path(archive_path.resolve(), file_name)
+        for file_name in ["c.csv", "returns/a.xlsx", "returns/b.xlsx"]
+    ]
+
+
+def test_open_data_return_file__gives_the_file_in_the_archive(
+    archive_path: Path, data_return_directory: Path
+) -> None:
+    with open_data_return_file(
+        get_zip_member_path(archive_path, "returns/a.xlsx")
+    ) as file:
+        assert file.read() == (data_return_directory / "a.xlsx").read_bytes()
+
+
+def test_open_data_return_file__streams_the_file_in_the_archive(
+    archive_path: Path, data_return_directory: Path
+) -> None:
+    with open_data_return_file(
+        get_zip_member_path(archive_path, "c.csv"), random_access=False
+    ) as file:
+        assert not isinstance(file, io.BytesIO)
+        assert file.read() == (data_return_directory / "c.csv").read_bytes()
+
+
+@pytest.mark.parametrize("number_of_processes", [1, 2])
+def test_load_all_data_returns_from_excel__zip_matches_directory(
+    archive_path: Path,
+    data_return_directory: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+    no_checkpoint: None,
+    number_of_processes: int,
+) -> None:
+    loaded_from_zip = load_excel.load_all_data_returns_from_excel(
+        archive_path,
+        number_of_processes=number_of_processes,
+        parse_cache_directory=tmp_path_factory.mktemp("parse_cache"),
+    )
+    loaded_from_directory = load_excel.load_all_data_returns_from_excel(
+        data_return_directory,
+        number_of_processes=1,
+        parse_cache_directory=tmp_path_factory.mktemp("parse_cache"),
+    )
+
+    pd.testing.assert_frame_equal(
+        loaded_from_zip.df_questionnaire_unclean_by_person.sort_values(
+            "PrimaryKey"
+        ).reset_index(drop=True),
+        loaded_from_directory.df_questionnaire_unclean_by_person.sort_values(
+            "PrimaryKey"
+        ).reset_index(drop=True),
+    )
+    assert loaded_from_zip.df_loading_error_by_file.file_path.to_list() == [
+        get_zip_member_path(archive_path.resolve(), "returns/b.xlsx")
+    ]
+    assert (
+        loaded_from_zip.df_loading_error_by_file.error_message.to_list()
+        == loaded_from_directory.df_loading_error_by_file.error_message.to_list()
+    )
+
+
+def test_pre_screen_all_data_returns__reads_the_archive(archive_path: Path) -> None:
+    df_pre_screen_error_by_file = pre_screen_all_data_returns(
+        archive_path, number_of_processes=2
+    )
+
+    assert df_pre_screen_error_by_file.file_path.to_list() == [
+        get_zip_member_path(archive_path.resolve(), "returns/b.xlsx")
+    ]
@@ -1,12 +1,15 @@
+import warnings
+
 import pandas as pd
 import numpy as np
+import pytest
 from ascs.input_data.preprocess_questionnaire.easy_read_columns import (
-    add_columns_for_one_easy_read_question,
+    add_easy_read_columns,
     clamp_std_answer_to_make_it_between_1_and_5,
 )
 
 
-def test_add_columns_for_one_easy_read_question():
+def test_add_easy_read_columns():
     df_input = pd.DataFrame(
         [[False, 3], [True, 5], [False, 7], [False, 1], [True, 1], [False, 6]],
         columns=["is_easy_read", "q99"],
@@ -24,9 +27,9 @@ def test_add_columns_for_one_easy_read_question():
         columns=["is_easy_read", "q99", "q99ER", "q99Std", "q99Comb"],
     )
 
-    add_columns_for_one_easy_read_question(df_input, "q99")
+    df_actual = add_easy_read_columns(df_input, ["q99"])
 
-    pd.testing.assert_frame_equal(df_input, df_expected)
+    pd.testing.assert_frame_equal(df_actual, df_expected)
 
 
 def test_clamp_std_answer_to_make_it_between_1_and_5():
@@ -37,3 +40,57 @@ def test_clamp_std_answer_to_make_it_between_1_and_5():
     series_actual = clamp_std_answer_to_make_it_between_1_and_5(series_input)
 
     pd.testing.assert_series_equal(series_actual, series_expected)
+
+
+def test_add_easy_read_columns__skips_questions_that_werent_loaded():
+    df_input = pd.DataFrame([[False, 3]], columns=["is_easy_read", "q2a"])
+
+    df_output = add_easy_read_columns(
+        df_input, ["q1", "q2a"], question_columns_not_loaded=["q1"]
+    )
+
+    assert df_output.columns.to_list() == [
+        "is_easy_read",
+        "q2a",
+        "q2aER",
+        "q2aStd",
+        "q2aComb",
+    ]
+
+
+def test_add_easy_read_columns__fails_on_a_missing_question_when_all_were_loaded():
+    df_input = pd.DataFrame([[False, 3]], columns=["is_easy_read", "q2a"])
+
+    with pytest.raises(KeyError):
+        add_easy_read_columns(df_input, ["q1", "q2a"])
+
+
+def test_add_easy_read_columns__columns_in_order_of_questions():
+    df_input = pd.DataFrame(
+        [[True, 3, 2], [False, 7, 1]], columns=["is_easy_read", "q98", "q99"]
+    )
+
+    df_output = add_easy_read_columns(df_input, ["q99", "q98"])
+
+    pd.testing.assert_frame_equal(
+        df_output.iloc[:, 3:],
+        pd.DataFrame(
+            [[2, np.nan, 2, 3, np.nan, 3], [np.nan, 1, 1, np.nan, 7, 5]],
+            columns=["q99ER", "q99Std", "q99Comb", "q98ER", "q98Std", "q98Comb"],
+            dtype=float,
+        ),
+    )
+
+
+def test_add_easy_read_columns__doesnt_fragment_the_questionnaire():
+    questions = [f"q{question_number}" for question_number in range(50)]
+    df_input = pd.DataFrame(
+        [[True] + [3] * len(questions), [False] + [7] * len(questions)],
+        columns=["is_easy_read"] + questions,
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pd.errors.PerformanceWarning)
+        df_output = add_easy_read_columns(df_input, questions)
+        # Adding a column to a fragmented DataFrame warns about it
+        df_output["new_column"] = 1
@@ -0,0 +1,124 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ascs import params
+from ascs.input_data.preprocess_questionnaire.categorical_columns import (
+    make_columns_categorical,
+    make_series_categorical,
+)
+from ascs.response_rate_by_area.response_rate_by_la import (
+    create_response_rate_by_la_table,
+)
+from ascs.response_rate_by_area.response_rate_formatting import (
+    format_annex_table4_for_output,
+)
+from ascs.stratification.stratification import Stratification
+
+
+def test_make_series_categorical():
+    series_in = pd.Series(["Female", np.nan, "Unknown", "Male", "Female"])
+
+    series_actual = make_series_categorical(series_in, ["Male", "Female", "Other"])
+
+    assert list(series_actual.cat.categories) == ["Female", "Male", "Other", "Unknown"]
+    pd.testing.assert_series_equal(
+        series_actual.astype(object), series_in.astype(object)
+    )
+
+
+def test_make_series_categorical__same_for_a_categorical_series():
+    series_in = pd.Series(["Female", np.nan, "Unknown", "Male", "Female"])
+
+    series_expected = make_series_categorical(series_in, ["Male", "Female", "Other"])
+
+    series_actual = make_series_categorical(
+        series_in.astype(
+            pd.CategoricalDtype(["Other", "Unknown", "Female", "Male", "Unused"])
+        ),
+        ["Male", "Female", "Other"],
+    )
+
+    pd.testing.assert_series_equal(series_actual, series_expected)
+
+
+def get_df_questionnaire_by_person():
+    random_number_generator = np.random.default_rng(0)
+    number_of_people = 60
+    la_codes = [str(la_code) for la_code in params.ALL_LA_CODES[:6]]
+    return pd.DataFrame(
+        {
+            "LaCode": random_number_generator.choice(
+                la_codes[::-1], size=number_of_people
+            ).astype(object),
+            "Gender_Grouped": random_number_generator.choice(
+                ["Other", "Male", "Female"], size=number_of_people
+            ).astype(object),
+            "Stratum": random_number_generator.choice([1, 2], size=number_of_people),
+            "Response": random_number_generator.choice([1, 2], size=number_of_people),
+            "can_answer_2c": random_number_generator.choice(
+                [True, False], size=number_of_people
+            ),
+            **{
+                question: random_number_generator.choice(
+                    [1.0, 2.0, 3.0, np.nan], size=number_of_people
+                )
+                for question in params.ANNEX_TABLE_4_QUESTIONS_TO_COUNT
+            },
+        }
+    )
+
+
+def test_make_columns_categorical__annex_table_4_las_in_the_same_order():
+    df_questionnaire_by_person = get_df_questionnaire_by_person()
+
+    annex_table4_expected = format_annex_table4_for_output(
+        create_response_rate_by_la_table(df_questionnaire_by_person.copy())
+    )
+    annex_table4_actual = format_annex_table4_for_output(
+        create_response_rate_by_la_table(
+            make_columns_categorical(df_questionnaire_by_person.copy())
+        )
+    )
+
+    assert list(annex_table4_actual.index) == list(annex_table4_expected.index)
+
+
+@pytest.mark.parametrize(
+    "stratification",
+    [
+        Stratification(
+            discrete_column_name="q3a",
+            supergroup_columns=["LaCode"],
+            subgroup_within_supergroup_columns=["Stratum"],
+        ),
+        # Like the demographics table (see demographics_table.py)
+        Stratification(
+            discrete_column_name="Gender_Grouped",
+            supergroup_columns=[],
+            subgroup_within_supergroup_columns=["LaCode", "Stratum"],
+        ),
+    ],
+)
+def test_make_columns_categorical__stratification_same_as_uncategorical(
+    stratification: Stratification,
+):
+    df_questionnaire_by_person = get_df_questionnaire_by_person()
+    population_by_la_stratum = (
+        df_questionnaire_by_person.groupby(["LaCode", "Stratum"]).size() * 10
+    )
+
+    df_expected = stratification.do_stratification(
+        df_questionnaire_by_person.copy(), population_by_la_stratum
+    )
+    df_actual = stratification.do_stratification(
+        make_columns_categorical(df_questionnaire_by_person.copy()),
+        population_by_la_stratum,
+    )
+
+    pd.testing.assert_frame_equal(
+        df_actual.astype(
+            {column_name: object for column_name in df_actual.select_dtypes("category")}
+        ),
+        df_expected,
+    )
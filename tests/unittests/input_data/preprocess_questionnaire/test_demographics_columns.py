@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from ascs.input_data.preprocess_questionnaire.demographics_columns import (
@@ -74,7 +75,10 @@ def test_add_grouped_columns_from_demographics_conversions():
     add_grouped_columns_from_demographics_conversions(
         df_input, demographic_conversions=TEST_DEMOGRAPHICS_CONVERSIONS
     )
-    pd.testing.assert_frame_equal(df_input, df_expected)
+    pd.testing.assert_frame_equal(
+        df_input.astype({column: object for column in df_expected.columns[4:]}),
+        df_expected,
+    )
 
 
 def test_add_age_grouped_columns_to_questionnaire_data():
@@ -97,3 +101,16 @@ def test_add_age_grouped_columns_to_questionnaire_data():
     )
     add_age_grouped_columns_to_questionnaire_data(df_input)
     pd.testing.assert_frame_equal(df_input.astype({"Age_Grouped": object}), df_expected)
+
+
+def test_add_age_grouped_columns_to_questionnaire_data__ages_not_in_a_bin_are_null():
+    df_input = pd.DataFrame({"Age": [17, 18, np.nan, 25, 30.5, 34.99, 35]})
+
+    df_expected = pd.DataFrame(
+        {
+            "Age": [17, 18, np.nan, 25, 30.5, 34.99, 35],
+            "Age_Grouped": [np.nan, "18-24", np.nan, "25-34", "25-34", "25-34", np.nan],
+        }
+    )
+    add_age_grouped_columns_to_questionnaire_data(df_input, age_group_bins=[18, 25, 35])
+    pd.testing.assert_frame_equal(df_input.astype({"Age_Grouped": object}), df_expected)
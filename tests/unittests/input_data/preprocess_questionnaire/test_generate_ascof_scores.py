@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 from ascs.input_data.preprocess_questionnaire import generate_ascof_scores
 from ascs.input_data.preprocess_questionnaire.ascof_config import SimpleAscofConversion
+from ascs.input_data.input_columns_needed import get_input_question_columns
 
 
 def test_set_score_with_converion():
@@ -286,3 +287,19 @@ def test_set_1J_to_nan_for_invalid_responses():
 
     pd.testing.assert_frame_equal(df_expected, df_actual)
 
+
+def test_generate_all_scores__leaves_out_scores_from_questions_that_werent_loaded():
+    df_in = pd.DataFrame({"LaCode": ["211"], "can_answer_2c": [True]})
+
+    df_actual = generate_ascof_scores.generate_all_scores(
+        df_in.copy(), question_columns_not_loaded=get_input_question_columns()
+    )
+
+    pd.testing.assert_frame_equal(df_actual, df_in)
+
+
+def test_generate_all_scores__fails_on_a_missing_column_when_all_were_loaded():
+    df_in = pd.DataFrame({"LaCode": ["211"], "can_answer_2c": [True]})
+
+    with pytest.raises(KeyError):
+        generate_ascof_scores.generate_all_scores(df_in.copy())
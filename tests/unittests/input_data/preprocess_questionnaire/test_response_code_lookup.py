@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from ascs.input_data.preprocess_questionnaire.response_code_lookup import (
+    convert_to_categorical_with_response_code_lookup,
+    convert_with_response_code_lookup,
+)
+
+
+@pytest.mark.parametrize(
+    "series_in",
+    [
+        pd.Series([1, 2, 3, 4, 5, 2.5, -1, np.nan], name="q3a"),
+        pd.Series([1, 2, 3, 4, 5], name="q3a"),
+        pd.Series([True, False, np.nan], name="age_1864"),
+        pd.Series([True, False], name="age_1864"),
+    ],
+)
+@pytest.mark.parametrize(
+    "conversion",
+    [
+        {1: 1, 2: 0.919, 3: 0.541, 4: 0},
+        {1: 1, 2: 1, 3: 2, 4: 2},
+        {1: np.nan, 2: 1},
+        {True: 0, False: 0.0473},
+    ],
+)
+def test_convert_with_response_code_lookup__same_as_replace(series_in, conversion):
+    series_expected = series_in.replace(conversion)
+
+    series_actual = convert_with_response_code_lookup(series_in, conversion)
+
+    pd.testing.assert_series_equal(
+        series_actual, series_expected.astype(series_actual.dtype), check_exact=True
+    )
+
+
+@pytest.mark.parametrize(
+    "series_in",
+    [
+        pd.Series([1, 2, 3, 4, 5, 2.5, -1, np.nan, 99, 5], name="Ethnicity"),
+        pd.Series([1, 2, 3, 4], name="Ethnicity"),
+        pd.Series([np.nan, np.nan], name="Ethnicity"),
+    ],
+)
+@pytest.mark.parametrize(
+    "conversion",
+    [
+        {1: "White", 2: "White", 3: "Mixed", 99: "Not Stated"},
+        {(1, 2): "White", 3: "Mixed", (4, 99): "Not Stated"},
+    ],
+)
+def test_convert_to_categorical_with_response_code_lookup__same_as_replace(
+    series_in, conversion
+):
+    series_expected = series_in.replace(conversion)
+
+    series_actual = convert_to_categorical_with_response_code_lookup(
+        series_in, conversion
+    )
+
+    assert isinstance(series_actual.dtype, pd.CategoricalDtype)
+    pd.testing.assert_series_equal(
+        series_actual.astype(object), series_expected.astype(object), check_exact=True
+    )
+
+
+def test_convert_to_categorical_with_response_code_lookup__categories_in_order():
+    series_in = pd.Series([7, 2, np.nan, 1, 5, 7])
+
+    series_actual = convert_to_categorical_with_response_code_lookup(
+        series_in, {1: "White", 2: "Mixed", 3: "White"}
+    )
+
+    assert list(series_actual.cat.categories) == ["White", "Mixed", 7, 5]
@@ -3,49 +3,57 @@ import pandas as pd
 import pytest
 
 from ascs.input_data.preprocess_questionnaire.type_conversions import (
-    make_string_columns_either_string_or_none,
-    clean_types_in_numeric_columns,
+    clean_number_columns,
+    clean_types_in_all_columns,
+    widen_compact_numbers,
 )
 
 from ascs import params
 
 
-def test_clean_string_columns():
+@pytest.fixture
+def string_columns(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(
+        params.DATA_RETURN,
+        "STRING_COLUMNS",
+        ["abc", "LaCode", "PrimaryKey", "SerialNo"],
+    )
+
+
+def test_clean_types_in_all_columns__string_columns(string_columns: None):
     df_in = pd.DataFrame({"abc": [1, "hi", None, np.nan, ""]})
 
     df_expected = pd.DataFrame({"abc": ["1", "hi", None, None, None]})
 
-    df_actual = make_string_columns_either_string_or_none(df_in, ["abc"])
+    df_actual, error_dfs = clean_types_in_all_columns(df_in)
 
     pd.testing.assert_frame_equal(df_actual, df_expected)
+    assert error_dfs == []
 
 
-def test_convert_numbers_in_numeric_columns():
+def test_clean_types_in_all_columns__numeric_columns(string_columns: None):
     df_in = pd.DataFrame(
         {
-            "abc": [1, "1", "1.5", np.nan, None, "hi", pd.NA],
+            "LaCode": "211",
+            "PrimaryKey": [str(row_number) for row_number in range(7)],
+            "SerialNo": [str(row_number) for row_number in range(7)],
             "xyz": [1, "1", "1.5", np.nan, None, "hi", pd.NA],
         }
-    ).assign(LaCode=211, PrimaryKey=range(7), SerialNo=range(7))
+    )
 
-    df_cleaned_expected = pd.DataFrame(
-        {
-            "abc": [1, "1", "1.5", np.nan, None, "hi", pd.NA],
-            "xyz": [1, 1, 1.5, np.nan, np.nan, np.nan, np.nan],
-        }
-    ).assign(LaCode=211, PrimaryKey=range(7), SerialNo=range(7))
+    df_cleaned_expected = df_in.assign(xyz=[1, 1, 1.5, np.nan, np.nan, np.nan, np.nan])
 
     df_expected_by_error = pd.DataFrame(
         {
-            "LaCode": [211],
-            "PrimaryKey": [5],
-            "SerialNo": [5],
+            "LaCode": ["211"],
+            "PrimaryKey": ["5"],
+            "SerialNo": ["5"],
             "message": ["Column xyz was 'hi' but should be a number"],
         },
         index=[5],
     )
 
-    df_cleaned_actual, error_dfs = clean_types_in_numeric_columns(df_in, ["xyz"])
+    df_cleaned_actual, error_dfs = clean_types_in_all_columns(df_in)
 
     pd.testing.assert_frame_equal(df_cleaned_actual, df_cleaned_expected)
 
@@ -54,25 +62,102 @@ def test_convert_numbers_in_numeric_columns():
     pd.testing.assert_frame_equal(df_actual_by_error, df_expected_by_error)
 
 
-def test_convert_numbers_in_numeric_columns__gets_numeric_columns_correctly_from_params(
-    monkeypatch: pytest.MonkeyPatch,
+def test_clean_types_in_all_columns__leaves_numeric_columns_alone(
+    string_columns: None,
 ):
-    monkeypatch.setattr(params.DATA_RETURN, "STRING_COLUMNS", ["abc"])
+    df_in = pd.DataFrame(
+        {"def": [1, 2, 3], "xyz": [1.5, np.nan, 2], "bool": [True, False, True]}
+    ).assign(LaCode="211", PrimaryKey=["0", "1", "2"], SerialNo=["0", "1", "2"])
+
+    df_cleaned_actual, error_dfs = clean_types_in_all_columns(df_in.copy())
+
+    pd.testing.assert_frame_equal(
+        df_cleaned_actual[["def", "xyz"]], df_in[["def", "xyz"]]
+    )
+    assert len(error_dfs) == 1
+    assert error_dfs[0]["message"].to_list() == [
+        "Column bool was 'True' but should be a number",
+        "Column bool was 'False' but should be a number",
+        "Column bool was 'True' but should be a number",
+    ]
+
+
+def test_clean_types_in_all_columns(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(
+        params.DATA_RETURN, "STRING_COLUMNS", ["LaCode", "PrimaryKey", "SerialNo"]
+    )
+    monkeypatch.setattr(params, "ERRONEOUS_INPUT_VALUE", -9)
 
     df_in = pd.DataFrame(
         {
-            "abc": [1, "1", "1.5", np.nan, None, "hi", pd.NA],
-            "xyz": [1, "1", "1.5", np.nan, None, "hi", pd.NA],
+            "LaCode": ["211", "211", "-9", ""],
+            "PrimaryKey": ["211_0", "211_1", "211_2", "211_3"],
+            "SerialNo": [1, 2, 3, 4],
+            "abc": [1, -9, 2, 3],
+            "xyz": ["1", "-9", "", "hi"],
         }
-    ).assign(LaCode=211, PrimaryKey=range(7), SerialNo=range(7))
+    )
 
     df_cleaned_expected = pd.DataFrame(
         {
-            "abc": [1, "1", "1.5", np.nan, None, "hi", pd.NA],
-            "xyz": [1, 1, 1.5, np.nan, np.nan, np.nan, np.nan],
+            "LaCode": ["211", "211", None, None],
+            "PrimaryKey": ["211_0", "211_1", "211_2", "211_3"],
+            "SerialNo": ["1", "2", "3", "4"],
+            "abc": [1, np.nan, 2, 3],
+            "xyz": [1, np.nan, np.nan, np.nan],
         }
-    ).assign(LaCode=211, PrimaryKey=range(7), SerialNo=range(7))
+    )
 
-    df_cleaned_actual, error_dfs = clean_types_in_numeric_columns(df_in)
+    df_cleaned_actual, error_dfs = clean_types_in_all_columns(df_in)
 
     pd.testing.assert_frame_equal(df_cleaned_actual, df_cleaned_expected)
+    assert len(error_dfs) == 1
+    pd.testing.assert_frame_equal(
+        error_dfs[0],
+        pd.DataFrame(
+            {
+                "LaCode": [None],
+                "PrimaryKey": ["211_3"],
+                "SerialNo": ["4"],
+                "message": ["Column xyz was 'hi' but should be a number"],
+            },
+            index=[3],
+        ),
+    )
+
+
+def test_widen_compact_numbers():
+    pd.testing.assert_series_equal(
+        widen_compact_numbers(pd.Series([1, 2], dtype=np.int8)),
+        pd.Series([1, 2], dtype=np.int64),
+    )
+    pd.testing.assert_series_equal(
+        widen_compact_numbers(pd.Series([1, np.nan], dtype=np.float32)),
+        pd.Series([1, np.nan], dtype=np.float64),
+    )
+    series_of_strings = pd.Series(["1", None])
+    assert widen_compact_numbers(series_of_strings) is series_of_strings
+
+
+def test_clean_number_columns(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(params, "ERRONEOUS_INPUT_VALUE", -9)
+    df_in = pd.DataFrame(
+        {
+            "abc": pd.Series([1, 2, 3], dtype=np.int8),
+            "def": pd.Series([1, -9, 3], dtype=np.int16),
+            "xyz": pd.Series([1.5, np.nan, -9], dtype=np.float32),
+        }
+    )
+
+    df_actual = clean_number_columns(df_in)
+
+    pd.testing.assert_frame_equal(
+        df_actual[df_in.columns],
+        pd.DataFrame(
+            {
+                "abc": pd.Series([1, 2, 3], dtype=np.int64),
+                "def": [1, np.nan, 3],
+                "xyz": [1.5, np.nan, np.nan],
+            }
+        ),
+    )
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
-from ascs.input_data.df_with_errors import DFWithErrors
+from ascs.input_data.df_with_errors import DeferredErrors, DFWithErrors
+from ascs.input_data.validators.between_validator import BetweenValidator
 
 
 def test_run_transformer_on_df():
@@ -70,3 +72,71 @@ def test_concatenate_errors_into_one_df__doesnt_error_with_no_errors():
     actual_concatenated_errs = df_errs_in.concatenate_errors_into_one_df()
 
     pd.testing.assert_frame_equal(actual_concatenated_errs, expected_concatenated_errs)
+
+
+def test_concatenate_errors_into_one_df__makes_deferred_errors_into_error_dfs():
+    df_questionnaire_by_person = pd.DataFrame(
+        {
+            "LaCode": ["211", "211", "212"],
+            "PrimaryKey": ["211_0", "211_1", "212_0"],
+            "SerialNo": ["1", "2", "1"],
+            # The values at the end, after the invalid ones were set null
+            "q1": [np.nan, 2, np.nan],
+        }
+    )
+    df_errs_in = DFWithErrors(
+        df=df_questionnaire_by_person,
+        error_dfs=[
+            DeferredErrors(
+                validator=BetweenValidator("q1", 1, 3),
+                row_numbers=np.array([0, 2]),
+                df_values_read=pd.DataFrame({"q1": [5.0, 0.0]}, index=[0, 2]),
+            ),
+            pd.DataFrame(
+                {
+                    "LaCode": ["211"],
+                    "PrimaryKey": ["211_1"],
+                    "SerialNo": ["2"],
+                    "message": ["some error"],
+                }
+            ),
+        ],
+    )
+
+    actual_concatenated_errs = df_errs_in.concatenate_errors_into_one_df()
+
+    assert actual_concatenated_errs["PrimaryKey"].to_list() == [
+        "211_0",
+        "212_0",
+        "211_1",
+    ]
+    assert actual_concatenated_errs["message"].to_list() == [
+        "Column q1 was 5.0 when accepted values must be between 1 and 3",
+        "Column q1 was 0.0 when accepted values must be between 1 and 3",
+        "some error",
+    ]
+
+
+def test_concatenate_errors_into_one_df__id_columns_are_objects_when_the_df_is_categorical():
+    df_questionnaire_by_person = pd.DataFrame(
+        {
+            "LaCode": pd.Categorical(["211", "212"]),
+            "PrimaryKey": ["211_0", "212_0"],
+            "SerialNo": ["1", "1"],
+            "q1": [np.nan, 2],
+        }
+    )
+    df_errs_in = DFWithErrors(
+        df=df_questionnaire_by_person,
+        error_dfs=[
+            DeferredErrors(
+                validator=BetweenValidator("q1", 1, 3),
+                row_numbers=np.array([0]),
+                df_values_read=pd.DataFrame({"q1": [5.0]}, index=[0]),
+            ),
+        ],
+    )
+
+    actual_concatenated_errs = df_errs_in.concatenate_errors_into_one_df()
+
+    assert (actual_concatenated_errs.dtypes == object).all()
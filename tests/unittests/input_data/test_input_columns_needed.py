@@ -0,0 +1,64 @@
+import pandas as pd
+
+from ascs.input_data.input_columns_needed import (
+    get_input_columns_to_load,
+    get_input_question_columns,
+    get_input_question_columns_needed_for_columns,
+    get_input_question_columns_not_loaded,
+    needs_question_columns_not_loaded,
+    select_input_columns_to_load,
+)
+
+
+def test_get_input_question_columns_needed_for_columns():
+    input_question_columns_needed = get_input_question_columns_needed_for_columns(
+        ["q1Comb", "q2aComb", "q22Exclb", "can_answer_2c"]
+    )
+
+    assert "q1" in input_question_columns_needed
+    assert "q2c" in input_question_columns_needed
+    assert "q22b" in input_question_columns_needed
+    assert "q12" not in input_question_columns_needed
+    assert "q21" not in input_question_columns_needed
+
+
+def test_get_input_columns_to_load():
+    assert get_input_columns_to_load(None) is None
+
+    input_columns_to_load = get_input_columns_to_load(["q1"])
+
+    assert "LaCode" in input_columns_to_load
+    assert "Questionnaire" in input_columns_to_load
+    assert "q1" in input_columns_to_load
+    assert not set(get_input_question_columns()) - {"q1"} & set(input_columns_to_load)
+
+
+def test_select_input_columns_to_load():
+    df_questionnaire_by_person = pd.DataFrame(
+        [[211, 1, 2]], columns=["LaCode", "q1", "q3a"]
+    )
+
+    assert select_input_columns_to_load(
+        df_questionnaire_by_person, ["q1"]
+    ).columns.to_list() == ["LaCode", "q1"]
+    assert select_input_columns_to_load(df_questionnaire_by_person, None) is (
+        df_questionnaire_by_person
+    )
+
+
+def test_get_input_question_columns_not_loaded():
+    assert get_input_question_columns_not_loaded(None) is None
+
+    question_columns_not_loaded = get_input_question_columns_not_loaded(["q1"])
+
+    assert "q1" not in question_columns_not_loaded
+    assert "q2a" in question_columns_not_loaded
+    assert "LaCode" not in question_columns_not_loaded
+
+
+def test_needs_question_columns_not_loaded():
+    assert needs_question_columns_not_loaded(["q1Comb"], ["q1"])
+    assert needs_question_columns_not_loaded(["LaCode", "q2a"], ["q1", "q2a"])
+    assert not needs_question_columns_not_loaded(["q3a", "can_answer_2c"], ["q1"])
+    assert not needs_question_columns_not_loaded(["q1"], [])
+    assert not needs_question_columns_not_loaded(["q1"], None)
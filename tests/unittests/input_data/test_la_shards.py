@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+
+from ascs.input_data.df_with_errors import DFWithErrors
+from ascs.input_data.la_shards import get_row_numbers_by_la_shard, run_on_la_shards
+from ascs.input_data.step_profiler import profile_steps
+from ascs.input_data.validators.between_validator import BetweenValidator
+from ascs.input_data.validators.fused_validation import run_validators_in_one_pass
+from ascs.input_data.validators.serial_number_duplicates_validator import (
+    SerialNumberDuplicatesValidator,
+)
+from ascs.input_data.validators.whole_number_validator import WholeNumberValidator
+
+
+def get_df_questionnaire_by_person():
+    return pd.DataFrame(
+        {
+            "LaCode": ["211", "212", "211", "213", np.nan, "212", "211", np.nan],
+            "PrimaryKey": [f"key_{row_number}" for row_number in range(8)],
+            "SerialNo": ["1", "1", "1", "1", "2", "2", "3", "2"],
+            "q1": [1.5, 5, 2, np.nan, 4, 1, 2, 3],
+            "q2": [1, 2, 4, 3, 2, 1, 6, 1],
+        }
+    )
+
+
+def validate_questionnaire(df_questionnaire_w_errs: DFWithErrors) -> DFWithErrors:
+    return df_questionnaire_w_errs.run_validator_function_on_df(
+        run_validators_in_one_pass,
+        [
+            WholeNumberValidator("q1"),
+            BetweenValidator("q1", 1, 3),
+            BetweenValidator("q2", 1, 3),
+            SerialNumberDuplicatesValidator(),
+        ],
+    )
+
+
+def test_get_row_numbers_by_la_shard():
+    row_numbers_by_shard = get_row_numbers_by_la_shard(
+        get_df_questionnaire_by_person(), 2
+    )
+
+    assert [row_numbers.tolist() for row_numbers in row_numbers_by_shard] == [
+        [0, 2, 3, 6],
+        [1, 4, 5, 7],
+    ]
+
+
+def test_run_on_la_shards__same_as_not_splitting_the_questionnaire():
+    expected_questionnaire_w_errs = DFWithErrors(get_df_questionnaire_by_person()).pipe(
+        validate_questionnaire
+    )
+
+    actual_questionnaire_w_errs = run_on_la_shards(
+        DFWithErrors(get_df_questionnaire_by_person()),
+        validate_questionnaire,
+        number_of_processes=3,
+    )
+
+    pd.testing.assert_frame_equal(
+        actual_questionnaire_w_errs.df, expected_questionnaire_w_errs.df
+    )
+    pd.testing.assert_frame_equal(
+        actual_questionnaire_w_errs.concatenate_errors_into_one_df(),
+        expected_questionnaire_w_errs.concatenate_errors_into_one_df(),
+    )
+
+
+def test_run_on_la_shards__profiles_the_steps_on_each_shard():
+    with profile_steps() as step_profiles:
+        run_on_la_shards(
+            DFWithErrors(get_df_questionnaire_by_person()),
+            validate_questionnaire,
+            number_of_processes=2,
+        )
+
+    assert sorted(step_profile.la_shard for step_profile in step_profiles) == [0, 1]
+    assert sum(step_profile.rows_before for step_profile in step_profiles) == 8
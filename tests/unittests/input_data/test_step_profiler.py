@@ -0,0 +1,178 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from ascs.input_data import step_profiler
+from ascs.input_data.df_with_errors import DFWithErrors
+from ascs.input_data.step_profiler import (
+    get_step_name,
+    get_step_profile_df,
+    is_profiling_steps,
+    load_baseline_step_profile,
+    profile_steps,
+    warn_about_steps_that_regressed,
+)
+from ascs.input_data.validators.between_validator import BetweenValidator
+from ascs.input_data.validators.fused_validation import run_validators_in_one_pass
+from ascs.input_data.validators.whole_number_validator import WholeNumberValidator
+
+
+def get_df_questionnaire_by_person():
+    return pd.DataFrame(
+        {
+            "LaCode": ["211", "212", "211", "213"],
+            "PrimaryKey": [f"key_{row_number}" for row_number in range(4)],
+            "SerialNo": ["1", "1", "2", "1"],
+            "q1": [1, 5, 2, np.nan],
+            "q2": [1, 2, 4, 3],
+        }
+    )
+
+
+def add_q3_column(df_questionnaire_by_person: pd.DataFrame) -> pd.DataFrame:
+    df_questionnaire_by_person["q3"] = 1
+    return df_questionnaire_by_person
+
+
+def test_profile_steps():
+    with profile_steps() as step_profiles:
+        df_questionnaire_w_errs = (
+            DFWithErrors(get_df_questionnaire_by_person())
+            .run_transformer_on_df(add_q3_column)
+            .run_validator_function_on_df(
+                run_validators_in_one_pass,
+                [BetweenValidator("q1", 1, 3), BetweenValidator("q2", 1, 3)],
+            )
+            .run_validator_on_df(BetweenValidator("q3", 2, 3))
+        )
+    assert not is_profiling_steps()
+
+    df_step_profile = get_step_profile_df(step_profiles)
+
+    assert df_step_profile["step"].to_list() == [
+        "add_q3_column",
+        "run_validators_in_one_pass[BetweenValidator]",
+        "BetweenValidator.run_check",
+    ]
+    assert df_step_profile["columns_before"].to_list() == [5, 6, 6]
+    assert df_step_profile["columns_after"].to_list() == [6, 6, 6]
+    assert df_step_profile["rows_after"].to_list() == [4, 4, 4]
+    assert df_step_profile["errors_added"].to_list() == [0, 2, 4]
+    assert (
+        df_step_profile["errors_added"].sum()
+        == df_questionnaire_w_errs.get_number_of_errors()
+        == len(df_questionnaire_w_errs.concatenate_errors_into_one_df())
+    )
+    assert df_step_profile["la_shard"].isna().all()
+    assert df_step_profile["traced_peak_delta_bytes"].isna().all()
+    assert (df_step_profile["wall_seconds"] >= 0).all()
+
+
+def test_profile_steps__nothing_recorded_when_off():
+    with profile_steps() as step_profiles:
+        pass
+
+    DFWithErrors(get_df_questionnaire_by_person()).run_transformer_on_df(add_q3_column)
+
+    assert step_profiles == []
+
+
+def test_profile_steps__traces_memory_allocations():
+    with profile_steps(trace_memory_allocations=True) as step_profiles:
+        DFWithErrors(get_df_questionnaire_by_person()).run_transformer_on_df(
+            lambda df: df.assign(q4=np.zeros(1_000_000).sum())
+        )
+
+    assert step_profiles[0].traced_peak_delta_bytes >= 8_000_000
+
+
+def test_get_step_name():
+    assert get_step_name(add_q3_column) == "add_q3_column"
+    assert (
+        get_step_name(BetweenValidator("q1", 1, 3).run_check)
+        == "BetweenValidator.run_check"
+    )
+
+
+def test_get_step_name__with_the_types_of_the_validators_run():
+    assert (
+        get_step_name(
+            run_validators_in_one_pass,
+            (
+                [
+                    WholeNumberValidator("q1"),
+                    BetweenValidator("q1", 1, 3),
+                    BetweenValidator("q2", 1, 3),
+                ],
+            ),
+        )
+        == "run_validators_in_one_pass[BetweenValidator,WholeNumberValidator]"
+    )
+
+
+def get_df_step_profile(wall_seconds_by_step, rows):
+    return pd.DataFrame(
+        {
+            "step": list(wall_seconds_by_step),
+            "wall_seconds": list(wall_seconds_by_step.values()),
+            "rss_delta_bytes": 0,
+            "rows_before": rows,
+        }
+    )
+
+
+def test_warn_about_steps_that_regressed(caplog):
+    df_baseline_step_profile = get_df_step_profile(
+        {"clean_all_types": 2.0, "add_q3_column": 0.1, "add_easy_read_columns": 2.0},
+        rows=100_000,
+    )
+    df_step_profile = get_df_step_profile(
+        # add_q3_column took 10 times as long, but only 0.9 seconds longer,
+        # and add_easy_read_columns took as long for each row
+        {"clean_all_types": 10.0, "add_q3_column": 1.0, "add_easy_read_columns": 4.0},
+        rows=200_000,
+    )
+
+    with caplog.at_level(logging.WARNING):
+        df_regressed_by_step = warn_about_steps_that_regressed(
+            df_step_profile, df_baseline_step_profile
+        )
+
+    assert df_regressed_by_step["step"].to_list() == ["clean_all_types"]
+    assert "clean_all_types" in caplog.text
+    assert "add_q3_column" not in caplog.text
+
+
+def test_warn_about_steps_that_regressed__steps_not_in_the_baseline_are_left_out():
+    df_regressed_by_step = warn_about_steps_that_regressed(
+        get_df_step_profile({"new_step": 10.0}, rows=100),
+        get_df_step_profile({"clean_all_types": 1.0}, rows=100),
+    )
+
+    assert len(df_regressed_by_step) == 0
+
+
+def test_load_baseline_step_profile(tmp_path, monkeypatch):
+    baseline_step_profile_file_path = tmp_path / "preprocessing_step_profile.csv"
+    monkeypatch.setattr(
+        step_profiler,
+        "BASELINE_STEP_PROFILE_FILE_PATH",
+        str(baseline_step_profile_file_path),
+    )
+    assert load_baseline_step_profile() is None
+
+    with profile_steps() as step_profiles:
+        DFWithErrors(get_df_questionnaire_by_person()).run_transformer_on_df(
+            add_q3_column
+        )
+    df_step_profile = get_step_profile_df(step_profiles)
+    # As it is saved with the other outputs
+    df_step_profile.to_csv(baseline_step_profile_file_path)
+
+    pd.testing.assert_frame_equal(load_baseline_step_profile(), df_step_profile)
+
+    pd.DataFrame([["The preprocessing wasn't profiled"]]).to_csv(
+        baseline_step_profile_file_path
+    )
+    assert load_baseline_step_profile() is None
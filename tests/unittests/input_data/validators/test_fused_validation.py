@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+from ascs.input_data.df_with_errors import DFWithErrors
+from ascs.input_data.validators.between_validator import BetweenValidator
+from ascs.input_data.validators.column_should_be_null_for_non_respondents_validator import (
+    ColumnShouldBeNullForNonRespondentsValidator,
+)
+from ascs.input_data.validators.fused_validation import (
+    run_validators_in_one_pass,
+    split_validators_into_independent_blocks,
+)
+from ascs.input_data.validators.is_in_validator import IsInValidator
+from ascs.input_data.validators.whole_number_validator import WholeNumberValidator
+
+
+def get_validators():
+    return [
+        WholeNumberValidator("q1"),
+        WholeNumberValidator("q2"),
+        BetweenValidator("q1", 1, 3),
+        BetweenValidator("q2", 1, 3),
+        IsInValidator("Gender", [1, 2, np.nan]),
+        ColumnShouldBeNullForNonRespondentsValidator("q2"),
+    ]
+
+
+def get_df_questionnaire_by_person():
+    return pd.DataFrame(
+        {
+            "LaCode": ["211", "211", "212", "212"],
+            "PrimaryKey": ["211_0", "211_1", "212_0", "212_1"],
+            "SerialNo": ["1", "2", "1", "2"],
+            "Response": [1, 1, 1, 2],
+            "Gender": [1, 3, "a", np.nan],
+            "q1": [1.5, 5, 2, np.nan],
+            "q2": [1, 2, 4.5, 3],
+        }
+    )
+
+
+def test_split_validators_into_independent_blocks():
+    validators = get_validators()
+
+    assert split_validators_into_independent_blocks(validators) == [
+        validators[:2],
+        validators[2:5],
+        validators[5:],
+    ]
+
+
+def test_run_validators_in_one_pass__same_as_running_them_one_at_a_time():
+    df_questionnaire_w_errs = DFWithErrors(get_df_questionnaire_by_person())
+    for validator in get_validators():
+        df_questionnaire_w_errs = df_questionnaire_w_errs.run_validator_on_df(validator)
+
+    actual_questionnaire_w_errs = run_validators_in_one_pass(
+        get_df_questionnaire_by_person(), get_validators()
+    )
+
+    pd.testing.assert_frame_equal(
+        actual_questionnaire_w_errs.df, df_questionnaire_w_errs.df
+    )
+    # One for each validator, even those that found no errors
+    assert len(actual_questionnaire_w_errs.error_dfs) == 6
+    pd.testing.assert_frame_equal(
+        actual_questionnaire_w_errs.concatenate_errors_into_one_df(),
+        df_questionnaire_w_errs.concatenate_errors_into_one_df(),
+    )
+
+
+def test_run_validators_in_one_pass__checks_columns_that_arent_numbers_one_at_a_time():
+    df_questionnaire_by_person = get_df_questionnaire_by_person().astype({"q1": object})
+
+    actual_questionnaire_w_errs = run_validators_in_one_pass(
+        df_questionnaire_by_person, [BetweenValidator("q1", 1, 3)]
+    )
+    actual_questionnaire = actual_questionnaire_w_errs.df
+    actual_error_df = actual_questionnaire_w_errs.concatenate_errors_into_one_df()
+
+    assert actual_error_df["PrimaryKey"].to_list() == ["211_1"]
+    assert actual_questionnaire["q1"].isna().to_list() == [False, True, False, True]
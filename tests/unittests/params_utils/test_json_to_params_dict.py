@@ -18,6 +18,7 @@ def test_do_all_dictionary_keys_to_integer_conversions():
                 "CONVERSION": {"1": 1, "2": 1, "3": 2, "4": 2},
             }
         ],
+        "ASCOF_1J_CONVERSIONS": {"q13": {"1": 0.0, "3": -0.0148}},
     }
 
     expected_dict = {
@@ -29,6 +30,7 @@ def test_do_all_dictionary_keys_to_integer_conversions():
                 "CONVERSION": {1: 1, 2: 1, 3: 2, 4: 2},
             }
         ],
+        "ASCOF_1J_CONVERSIONS": {"q13": {1: 0.0, 3: -0.0148}},
     }
 
     actual_dict = do_all_dictionary_keys_to_integer_conversions(input_dict)
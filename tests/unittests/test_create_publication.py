@@ -0,0 +1,41 @@
+from ascs import create_publication
+from ascs.create_publication import get_input_question_columns_needed_for_tables
+from ascs.input_data.input_columns_needed import get_input_question_columns
+
+
+def test_get_input_question_columns_needed_for_tables():
+    assert (
+        get_input_question_columns_needed_for_tables(
+            ["Missing admin (DQ1, DQ2)", "Ingest Telemetry"]
+        )
+        == []
+    )
+    assert (
+        get_input_question_columns_needed_for_tables(
+            ["Missing admin (DQ1, DQ2)", "Average Rows"]
+        )
+        is None
+    )
+
+
+def test_get_input_question_columns_needed_for_tables__all_of_them(monkeypatch):
+    monkeypatch.setitem(
+        create_publication.INPUT_QUESTION_COLUMNS_NEEDED_BY_TABLE_ID,
+        "Response Rates (4)",
+        lambda: ["q1"],
+    )
+    assert create_publication.get_input_question_columns_needed_for_tables(
+        ["Response Rates (4)"]
+    ) == ["q1"]
+
+    monkeypatch.setitem(
+        create_publication.INPUT_QUESTION_COLUMNS_NEEDED_BY_TABLE_ID,
+        "Response Rates (4)",
+        get_input_question_columns,
+    )
+    assert (
+        create_publication.get_input_question_columns_needed_for_tables(
+            ["Response Rates (4)"]
+        )
+        is None
+    )